@@ -0,0 +1,73 @@
+import json
+import os
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Type
+
+import pytest
+import vcr
+
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.common import BaseModel
+from pydrag.models.common import Chart
+from pydrag.models.tag import Tag
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from tests import fixtures_dir
+
+
+class Case(NamedTuple):
+    cassette: str
+    method: str
+    bind: Type[BaseModel]
+    flatten: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(fixtures_dir, f"{self.cassette}.json")
+
+    @property
+    def body(self) -> str:
+        with open(self.path) as f:
+            cassette = json.load(f)
+        return cassette["interactions"][-1]["response"]["body"]["string"]
+
+    @property
+    def params(self) -> Dict:
+        return {"method": self.method}
+
+
+cases = [
+    Case("album/find", "album.getInfo", Album),
+    Case("album/search", "album.search", Album, "albums.album"),
+    Case("artist/find", "artist.getInfo", Artist),
+    Case("artist/get_similar", "artist.getSimilar", Artist, "artist"),
+    Case("artist/get_top_tracks", "artist.getTopTracks", Track, "track"),
+    Case("chart/get_top_tracks", "chart.getTopTracks", Track, "track"),
+    Case("geo/get_top_artists", "geo.getTopArtists", Artist, "artist"),
+    Case("library/get_artists", "library.getArtists", Artist, "artist"),
+    Case("tag/get_weekly_chart_list", "tag.getWeeklyChartList", Chart, "chart"),
+    Case("track/find", "track.getInfo", Track),
+    Case("track/get_similar", "track.getSimilar", Track, "track"),
+    Case("user/get_friends_with_recent_tracks", "user.getFriends", User, "user"),
+    Case("user/get_info", "user.getInfo", User),
+    Case("user/get_loved_tracks", "user.getLovedTracks", Track, "track"),
+    Case("user/get_recent_tracks", "user.getRecentTracks", Track, "track"),
+    Case("user/get_top_albums", "user.getTopAlbums", Album, "album"),
+    Case("user/get_top_tags", "user.getTopTags", Tag, "tag"),
+    Case("user/get_weekly_track_chart", "user.getWeeklyTrackChart", Track, "track"),
+]
+
+replay = vcr.VCR(
+    cassette_library_dir=fixtures_dir,
+    serializer="json",
+    record_mode="none",
+    match_on=["method"],
+)
+
+
+@pytest.fixture(params=cases, ids=[case.cassette for case in cases])
+def case(request) -> Case:
+    return request.param
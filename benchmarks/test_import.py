@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["pass", "import pydrag", "import pydrag; pydrag.User", "import requests"],
+)
+def test_import(benchmark, code):
+    benchmark.pedantic(
+        subprocess.check_call, args=([sys.executable, "-c", code],), rounds=10
+    )
@@ -0,0 +1,53 @@
+import copy
+import json
+import tracemalloc
+
+import pytest
+
+from benchmarks.conftest import replay
+from pydrag.services import ApiMixin
+from pydrag.services import pythonic_variables
+
+pytest.importorskip("pytest_benchmark")
+
+
+def bind(case, body):
+    return ApiMixin.bind_data(case.bind, body, case.flatten)
+
+
+def test_retrieve(benchmark, case):
+    with replay.use_cassette(case.path, allow_playback_repeats=True):
+        benchmark(
+            ApiMixin.retrieve, bind=case.bind, flatten=case.flatten, params=case.params
+        )
+
+
+def test_parse(benchmark, case):
+    benchmark(json.loads, case.body, object_pairs_hook=pythonic_variables)
+
+
+def test_bind(benchmark, case):
+    body = json.loads(case.body, object_pairs_hook=pythonic_variables)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    obj = bind(case, copy.deepcopy(body))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    benchmark.extra_info["bytes"] = size
+    benchmark.extra_info["bytes_per_item"] = size / (
+        max(len(obj), 1) if case.flatten else 1
+    )
+
+    def setup():
+        return (case, copy.deepcopy(body)), {}
+
+    benchmark.pedantic(bind, setup=setup, rounds=100)
+
+
+def test_to_dict(benchmark, case):
+    body = json.loads(case.body, object_pairs_hook=pythonic_variables)
+    obj = bind(case, body)
+    benchmark(obj.to_dict)
@@ -0,0 +1,28 @@
+import pytest
+
+from pydrag.services import ApiMixin
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("tracks", [1, 50])
+def test_prepare_signed_params(benchmark, tracks):
+    params = {"method": "track.scrobble"}
+    for i in range(tracks):
+        params.update(
+            {
+                f"artist[{i}]": "Fugees",
+                f"track[{i}]": "Fu-Gee-La",
+                f"album[{i}]": "The Score",
+                f"albumArtist[{i}]": "Fugees",
+                f"timestamp[{i}]": 1541874568 + i,
+                f"trackNumber[{i}]": 3,
+                f"duration[{i}]": 260,
+                f"mbid[{i}]": "",
+                f"context[{i}]": None,
+                f"streamId[{i}]": None,
+                f"chosenByUser[{i}]": True,
+            }
+        )
+
+    benchmark(ApiMixin.prepare_params, params, True, False, False)
@@ -1,22 +1,57 @@
-from pydrag.models.album import Album
-from pydrag.models.artist import Artist
-from pydrag.models.auth import AuthSession
-from pydrag.models.auth import AuthToken
-from pydrag.models.common import Config
-from pydrag.models.track import Tag
-from pydrag.models.track import Track
-from pydrag.models.user import User
+import importlib
+import sys
+from typing import Any
+from typing import List
+from typing import TYPE_CHECKING
+
 from pydrag.version import version
 
-try:
-    from dotenv import load_dotenv
+if TYPE_CHECKING:  # pragma: no cover
+    from pydrag.models.album import Album
+    from pydrag.models.artist import Artist
+    from pydrag.models.auth import AuthSession
+    from pydrag.models.auth import AuthToken
+    from pydrag.models.common import Config
+    from pydrag.models.tag import Tag
+    from pydrag.models.track import Track
+    from pydrag.models.user import User
+
+    configure = Config.instance
+
+# The models and their dependencies are only imported on first access
+lazy_attributes = {
+    "Album": "pydrag.models.album",
+    "Artist": "pydrag.models.artist",
+    "AuthSession": "pydrag.models.auth",
+    "AuthToken": "pydrag.models.auth",
+    "Config": "pydrag.models.common",
+    "Tag": "pydrag.models.tag",
+    "Track": "pydrag.models.track",
+    "User": "pydrag.models.user",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "configure":
+        value = __getattr__("Config").instance
+    elif name in lazy_attributes:
+        value = getattr(importlib.import_module(lazy_attributes[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(lazy_attributes) + ["configure"])
+
 
-    load_dotenv()
-except ImportError:  # pragma: no cover
-    # tox -e docs doesn't load python-dotenv
-    pass
+# Module attribute hooks are only supported since python 3.7
+if sys.version_info < (3, 7):  # pragma: no cover
+    for attribute in [*lazy_attributes, "configure"]:
+        __getattr__(attribute)
 
-configure = Config.instance
 
 __all__ = [
     "User",
@@ -0,0 +1,269 @@
+import json
+import os
+from array import array
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+
+VERSION = 1
+META_FILE = "meta.json"
+STRING_COLUMNS = ("name", "mbid", "url", "artist", "artist_mbid", "album", "album_mbid")
+NUMBER_COLUMNS = ("timestamp", "loved")
+DTYPES = {
+    **{column: np.int32 for column in STRING_COLUMNS},
+    "timestamp": np.int64,
+    "loved": np.int8,
+}
+
+
+def track_values(track: Track) -> Dict[str, Any]:
+    artist = track.artist
+    album = track.album
+    return {
+        "name": track.name,
+        "mbid": track.mbid,
+        "url": track.url,
+        "artist": artist.name if artist else None,
+        "artist_mbid": artist.mbid if artist else None,
+        "album": album.name if album else None,
+        "album_mbid": album.mbid if album else None,
+        "timestamp": track.timestamp,
+        "loved": None if track.loved is None else int(track.loved),
+    }
+
+
+class ArchiveWriter:
+    """
+    Stream tracks into a columnar archive directory.
+
+    The text columns are dictionary encoded to int32 codes and every column
+    is saved as a numpy array file that can be memory mapped, missing values
+    are stored as ``-1``.
+
+    The files are replaced atomically on close, readers of a previous
+    version of the archive keep their memory maps intact.
+
+    :param path: The archive directory
+    :param attributes: Extra json compatible metadata to save
+
+    .. code-block:: python
+
+        >>> with ArchiveWriter("rj") as writer:
+        ...     for page in range(1, 10):
+        ...         writer.write(user.get_recent_tracks(limit=200, page=page))
+    """
+
+    def __init__(self, path: str, attributes: Optional[Dict] = None):
+        self.path = path
+        self.attributes = attributes or {}
+        self.dictionaries: Dict[str, Dict[str, int]] = {c: {} for c in STRING_COLUMNS}
+        self.columns: Dict[str, array] = {c: array("q") for c in DTYPES}
+
+    @classmethod
+    def extend(cls, archive: "Archive", path: Optional[str] = None) -> "ArchiveWriter":
+        """
+        Return a writer preloaded with the rows and the dictionaries of the
+        given archive.
+
+        :param archive: The archive to extend
+        :param path: The new archive directory, defaults to the archive path
+        :rtype: :class:`~pydrag.archive.ArchiveWriter`
+        """
+        writer = cls(path or archive.path, dict(archive.attributes))
+        for column, values in archive.dictionaries.items():
+            writer.dictionaries[column] = {value: i for i, value in enumerate(values)}
+        for column in DTYPES:
+            data = np.asarray(archive.column(column), dtype=np.int64)
+            writer.columns[column].frombytes(data.tobytes())
+        return writer
+
+    def write(self, tracks: Iterable[Track]):
+        """
+        Append the given tracks to the archive.
+
+        :param tracks: The tracks to append
+        """
+        for track in tracks:
+            self.append(track_values(track))
+
+    def append(self, values: Dict[str, Any]):
+        for column in STRING_COLUMNS:
+            value = values.get(column)
+            if value is None or value == "":
+                code = -1
+            else:
+                codes = self.dictionaries[column]
+                code = codes.setdefault(str(value), len(codes))
+            self.columns[column].append(code)
+
+        for column in NUMBER_COLUMNS:
+            value = values.get(column)
+            self.columns[column].append(-1 if value is None else int(value))
+
+    def sort(self, column: str = "timestamp"):
+        """
+        Reorder the rows by the values of the given column, the sort is stable.
+
+        :param column: The column name
+        """
+        order = np.argsort(np.frombuffer(self.columns[column], np.int64), kind="stable")
+        for name, values in self.columns.items():
+            data = np.frombuffer(values, np.int64)[order]
+            self.columns[name] = array("q", data.tobytes())
+
+    def close(self):
+        """Save the columns, the dictionaries and the metadata files."""
+        os.makedirs(self.path, exist_ok=True)
+        for column, values in self.columns.items():
+            data = np.array(values, dtype=DTYPES[column])
+            with self.open(f"{column}.npy", "wb") as f:
+                np.save(f, data)
+
+        meta = {
+            "version": VERSION,
+            "length": len(self.columns["timestamp"]),
+            "dictionaries": {
+                column: list(codes) for column, codes in self.dictionaries.items()
+            },
+            "attributes": self.attributes,
+        }
+        with self.open(META_FILE, "w") as f:
+            json.dump(meta, f)
+
+    @contextmanager
+    def open(self, name: str, mode: str) -> Iterator[IO]:
+        path = os.path.join(self.path, name)
+        with open(f"{path}.tmp", mode) as f:
+            yield f
+        os.replace(f"{path}.tmp", path)
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+
+class Archive(Sequence[Track]):
+    """
+    Read only, memory mapped view of a columnar tracks archive. The track
+    objects are constructed on access.
+
+    All the columns are mapped on construction, the archive keeps reading
+    the version it was opened with when a writer replaces the files.
+
+    :param path: The archive directory
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as f:
+            meta = json.load(f)
+
+        if meta["version"] != VERSION:
+            raise ValueError(f"Unsupported archive version: {meta['version']}")
+
+        self.length: int = meta["length"]
+        self.dictionaries: Dict[str, List[str]] = meta["dictionaries"]
+        self.attributes: Dict = meta.get("attributes", {})
+        self.arrays: Dict[str, np.ndarray] = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in DTYPES
+        }
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return the memory mapped array of the given column, the text columns
+        hold the dictionary codes.
+
+        :param name: The column name
+        """
+        return self.arrays[name]
+
+    def value(self, name: str, index: int) -> Any:
+        code = int(self.column(name)[index])
+        if code == -1:
+            return None
+        if name in self.dictionaries:
+            return self.dictionaries[name][code]
+        return code
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore
+        if isinstance(index, slice):
+            return [self.track(i) for i in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("archive index out of range")
+
+        return self.track(index)
+
+    def __iter__(self) -> Iterator[Track]:
+        return (self.track(i) for i in range(self.length))
+
+    def track(self, index: int) -> Track:
+        """
+        Construct the track of the given row.
+
+        :param index: The row number
+        :rtype: :class:`~pydrag.models.track.Track`
+        """
+        album = self.value("album", index)
+        loved = self.value("loved", index)
+        return Track(
+            name=self.value("name", index),
+            artist=Artist(
+                name=self.value("artist", index),
+                mbid=self.value("artist_mbid", index),
+            ),
+            album=(
+                None
+                if album is None
+                else Album(name=album, mbid=self.value("album_mbid", index))
+            ),
+            mbid=self.value("mbid", index),
+            url=self.value("url", index),
+            timestamp=self.value("timestamp", index),
+            loved=None if loved is None else bool(loved),
+        )
+
+    def tracks(self, user: Optional[str] = None) -> ListModel[Track]:
+        """
+        Return a list model that constructs the tracks lazily.
+
+        :param user: The user name metadata
+        :rtype: :class:`~pydrag.models.common.ListModel` of
+            :class:`~pydrag.models.track.Track`
+        """
+        return ListModel(data=self, total=self.length, user=user)  # type: ignore
+
+
+def export_tracks(tracks: Iterable[Track], path: str) -> Archive:
+    """
+    Write the given tracks to a new archive directory.
+
+    :param tracks: The tracks to export
+    :param path: The archive directory
+    :rtype: :class:`~pydrag.archive.Archive`
+    """
+    with ArchiveWriter(path) as writer:
+        writer.write(tracks)
+    return Archive(path)
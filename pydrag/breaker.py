@@ -0,0 +1,210 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from pydrag.exceptions import ApiError
+from pydrag.exceptions import CircuitOpenError
+from pydrag.exceptions import DeadlineExceeded
+from pydrag.hooks import CIRCUIT_CHANGE
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+Transition = Optional[Tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class Ticket:
+    """
+    Admission of a request by the circuit breaker.
+
+    :param generation: The breaker generation the request was admitted in,
+        it changes with every state transition
+    :param trial: The request is a half open trial
+    :param transition: The state transition caused by the admission
+    """
+
+    generation: int
+    trial: bool = False
+    transition: Transition = None
+
+
+class CircuitBreaker:
+    """
+    Thread safe circuit breaker for the last.fm endpoint.
+
+    The outcomes of the most recent requests are kept in a rolling window,
+    the circuit opens when the failure rate reaches the threshold. Open
+    circuits reject the requests with
+    :class:`~pydrag.exceptions.CircuitOpenError` until the cooldown passes,
+    then a limited number of trial requests are let through. A successful
+    trial closes the circuit and a failed one opens it again.
+
+    The api errors with one of the failure codes, the http server errors,
+    connection errors and timeouts are failures, the rest of the responses
+    prove the endpoint is healthy. Cached responses are served without
+    consulting the breaker, stale entries keep being served while their
+    refresh is rejected.
+
+    The state changes are emitted with the ``circuit_change`` hook.
+
+    :param threshold: The failure rate that opens the circuit
+    :param window: The number of recent outcomes to evaluate
+    :param min_calls: The minimum number of outcomes before opening
+    :param cooldown: Seconds to reject requests before the trials
+    :param probes: The maximum number of concurrent trial requests
+    :param codes: The api error codes that count as failures
+
+    .. code-block:: python
+
+        >>> Config.breaker = CircuitBreaker(threshold=0.5, cooldown=30)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        cooldown: float = 30,
+        probes: int = 1,
+        codes: Sequence[int] = (11, 16),
+    ):
+        self.threshold = threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.probes = probes
+        self.codes = tuple(codes)
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.opened = 0.0
+        self.trials = 0
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def guard(
+        self, method: Optional[str] = None, params: Optional[Dict] = None
+    ) -> Iterator[None]:
+        """
+        Admit the request in the block and record its outcome.
+
+        :param str method: The last.fm method name
+        :param Dict params: The request params
+        :raise: :class:`~pydrag.exceptions.CircuitOpenError`
+        """
+        ticket = self.acquire()
+        self.emit(ticket.transition, method, params)
+        try:
+            yield
+        except Exception as e:
+            self.emit(self.record(ticket, e), method, params)
+            raise
+        self.emit(self.record(ticket, None), method, params)
+
+    def acquire(self) -> Ticket:
+        """
+        Admit a request or raise if the circuit is open or all the trials
+        are in progress.
+
+        :returns: The admission ticket to record the outcome with
+        :raise: :class:`~pydrag.exceptions.CircuitOpenError`
+        """
+        with self.lock:
+            transition = None
+            if self.state == OPEN:
+                retry_after = self.opened + self.cooldown - time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError("Circuit breaker is open", retry_after)
+                transition = self.transition(HALF_OPEN)
+
+            trial = self.state == HALF_OPEN
+            if trial:
+                if self.trials >= self.probes:
+                    raise CircuitOpenError("Circuit breaker is half open", 0)
+                self.trials += 1
+
+            return Ticket(self.generation, trial, transition)
+
+    def record(self, ticket: Ticket, error: Optional[Exception]) -> Transition:
+        """
+        Record the outcome of an admitted request. Requests admitted before
+        the last state transition are ignored, only the trials decide the
+        half open transitions.
+
+        :param ticket: The admission ticket
+        :param error: The request error, None on success
+        :returns: The state transition, if any
+        """
+        failure = error is not None and self.is_failure(error)
+        with self.lock:
+            if ticket.generation != self.generation:
+                return None
+
+            if ticket.trial:
+                self.trials -= 1
+                return self.transition(OPEN if failure else CLOSED)
+
+            self.outcomes.append(failure)
+            total = len(self.outcomes)
+            if total >= self.min_calls and sum(self.outcomes) / total >= self.threshold:
+                return self.transition(OPEN)
+            return None
+
+    def is_failure(self, error: Exception) -> bool:
+        """
+        Return whether the error indicates the endpoint is degraded.
+
+        :param error: The request error
+        """
+        from requests.exceptions import ConnectionError
+        from requests.exceptions import Timeout
+
+        if isinstance(error, ApiError):
+            return error.error in self.codes
+        if isinstance(error, DeadlineExceeded):
+            return False
+
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None:
+            return status >= 500
+        return isinstance(error, (ConnectionError, Timeout))
+
+    def transition(self, state: str) -> Tuple[str, str]:
+        previous, self.state = self.state, state
+        self.generation += 1
+        if state == OPEN:
+            self.opened = time.monotonic()
+        self.outcomes.clear()
+        self.trials = 0
+        return previous, state
+
+    def reset(self):
+        """Close the circuit and discard the recorded outcomes."""
+        with self.lock:
+            self.transition(CLOSED)
+
+    @staticmethod
+    def emit(transition: Transition, method: Any, params: Any):
+        if transition is None:
+            return
+
+        from pydrag.models.common import Config
+
+        previous, state = transition
+        Config.hooks.emit(
+            CIRCUIT_CHANGE,
+            method=method,
+            params=params,
+            previous=previous,
+            state=state,
+        )
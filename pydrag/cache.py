@@ -0,0 +1,216 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Sequence
+
+from pydrag.exceptions import ApiError
+
+# Retrieve cache mode that only remembers the not found lookups
+NEGATIVE = "negative"
+
+
+@dataclass
+class Entry:
+    """
+    Cache entry.
+
+    :param value: The cached value
+    :param created: Monotonic timestamp of the entry creation
+    :param ttl: Seconds the entry is considered fresh
+    :param stale_ttl: Seconds after the ttl the entry can be served while
+        it's being refreshed
+    :param error: The value holds the arguments of a cached api error
+    """
+
+    value: Any
+    created: float
+    ttl: float
+    stale_ttl: float
+    error: bool = False
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created
+
+    @property
+    def fresh(self) -> bool:
+        return self.age < self.ttl
+
+    @property
+    def expired(self) -> bool:
+        return self.age >= self.ttl + self.stale_ttl
+
+
+class Cache:
+    """
+    Thread safe in memory LRU cache with stale-while-revalidate semantics.
+
+    Fresh entries are served directly, stale entries are served immediately
+    while a single background refresh replaces them and expired entries are
+    reloaded synchronously.
+
+    Api errors with one of the negative codes, like ``6`` for not found
+    resources, are cached for the negative ttl and raised again without
+    calling the loader.
+
+    :param ttl: Seconds an entry is considered fresh
+    :param stale_ttl: Seconds after the ttl an entry can still be served
+    :param maxsize: Maximum number of entries
+    :param negative_ttl: Seconds to cache api errors, zero to disable
+    :param negative_codes: The api error codes to cache
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        stale_ttl: float = 3600,
+        maxsize: int = 1024,
+        negative_ttl: float = 60,
+        negative_codes: Sequence[int] = (6,),
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.negative_codes = tuple(negative_codes)
+        self.entries: "OrderedDict[Hashable, Entry]" = OrderedDict()
+        self.pending: Dict[Hashable, threading.Thread] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Entry]:
+        """
+        Return the entry for the given key, expired entries are discarded.
+
+        :param key: The cache key
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            if entry.expired:
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        error: bool = False,
+    ):
+        """
+        Store the value for the given key and evict the least recently used
+        entries over the maximum size. Error entries are never served stale.
+
+        :param key: The cache key
+        :param value: The value to cache
+        :param ttl: Override the default ttl
+        :param error: The value holds the arguments of an api error
+        """
+        entry = Entry(
+            value=value,
+            created=time.monotonic(),
+            ttl=self.ttl if ttl is None else ttl,
+            stale_ttl=0 if error else self.stale_ttl,
+            error=error,
+        )
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def fetch(
+        self, key: Hashable, loader: Callable[[], Any], positive: bool = True
+    ) -> Any:
+        """
+        Return the cached value for the given key or use the loader to
+        retrieve it.
+
+        :param key: The cache key
+        :param loader: Callable that retrieves a fresh value
+        :param positive: Cache the loaded values, otherwise only the api
+            errors with one of the negative codes are cached
+        :raise: :class:`~pydrag.exceptions.ApiError`
+        """
+        entry = self.get(key)
+        if entry is not None and not positive and not entry.error:
+            entry = None
+
+        if entry is not None:
+            if entry.error:
+                raise ApiError(**entry.value)
+            if not entry.fresh:
+                self.revalidate(key, loader)
+            return entry.value
+
+        try:
+            value = loader()
+        except ApiError as e:
+            if self.negative_ttl and e.error in self.negative_codes:
+                error = {"message": e.message, "error": e.error, "links": e.links}
+                self.set(key, error, ttl=self.negative_ttl, error=True)
+            raise
+
+        if positive:
+            self.set(key, value)
+        return value
+
+    def revalidate(self, key: Hashable, loader: Callable[[], Any]):
+        """
+        Refresh the given key in a background thread, unless a refresh is
+        already in progress.
+
+        :param key: The cache key
+        :param loader: Callable that retrieves a fresh value
+        """
+        with self.lock:
+            if key in self.pending:
+                return
+
+            thread = threading.Thread(
+                target=self.refresh, args=(key, loader), daemon=True
+            )
+            self.pending[key] = thread
+
+        thread.start()
+
+    def refresh(self, key: Hashable, loader: Callable[[], Any]):
+        try:
+            self.set(key, loader())
+        except Exception:
+            # Keep serving the stale entry until it expires
+            pass
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+
+    def join(self, timeout: Optional[float] = None):
+        """
+        Wait for the background refreshes to complete.
+
+        :param timeout: Seconds to wait for each refresh
+        """
+        with self.lock:
+            threads = list(self.pending.values())
+
+        for thread in threads:
+            thread.join(timeout)
@@ -0,0 +1,347 @@
+import time
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from pydrag.archive import Archive
+from pydrag.constants import Period
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.common import BaseModel
+from pydrag.models.common import Chart
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+
+KINDS = ("artist", "album", "track")
+Timestamp = Union[int, str, None]
+PERIOD_DAYS = {
+    Period.week: 7,
+    Period.month: 30,
+    Period.quarter: 90,
+    Period.semester: 180,
+    Period.year: 365,
+    Period.overall: None,
+}
+
+
+class ChartEngine:
+    """
+    Compute user weekly and top charts from a local scrobbles archive.
+
+    The scrobbles are grouped by the dictionary codes of the artist, album
+    or track columns with numpy, the results are shaped like the user chart
+    api responses.
+
+    :param archive: The scrobbles archive
+    :param user: The user name metadata
+
+    .. code-block:: python
+
+        >>> index = ScrobbleIndex("scrobbles", "rj")
+        >>> engine = ChartEngine(index.archive, user="rj")
+        >>> charts = engine.weekly_charts("artist", user.get_weekly_chart_list())
+    """
+
+    def __init__(self, archive: Archive, user: Optional[str] = None):
+        self.archive = archive
+        self.user = user
+        self.keys: Dict[str, np.ndarray] = {}
+
+    def weekly_artist_chart(
+        self, from_date: Timestamp = None, to_date: Timestamp = None
+    ) -> ListModel[Artist]:
+        """
+        Local equivalent of :meth:`~pydrag.models.user.User.get_weekly_artist_chart`.
+
+        :param from_date: The date at which the chart should start from.
+        :param to_date: The date at which the chart should end on.
+        :rtype: :class:`~models.common.ListModel` of
+            :class:`~pydrag.models.artist.Artist`
+        """
+        return self.chart("artist", from_date, to_date)
+
+    def weekly_album_chart(
+        self, from_date: Timestamp = None, to_date: Timestamp = None
+    ) -> ListModel[Album]:
+        """
+        Local equivalent of :meth:`~pydrag.models.user.User.get_weekly_album_chart`.
+
+        :param from_date: The date at which the chart should start from.
+        :param to_date: The date at which the chart should end on.
+        :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.album.Album`
+        """
+        return self.chart("album", from_date, to_date)
+
+    def weekly_track_chart(
+        self, from_date: Timestamp = None, to_date: Timestamp = None
+    ) -> ListModel[Track]:
+        """
+        Local equivalent of :meth:`~pydrag.models.user.User.get_weekly_track_chart`.
+
+        :param from_date: The date at which the chart should start from.
+        :param to_date: The date at which the chart should end on.
+        :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
+        """
+        return self.chart("track", from_date, to_date)
+
+    def chart(
+        self, kind: str, from_date: Timestamp = None, to_date: Timestamp = None
+    ) -> ListModel:
+        """
+        Compute the chart of the scrobbles in the given range, the start is
+        inclusive and the end exclusive like the weekly chart boundaries.
+
+        :param kind: One of artist, album or track
+        :param from_date: Beginning unix timestamp of the range
+        :param to_date: End unix timestamp of the range
+        :rtype: :class:`~pydrag.models.common.ListModel`
+        """
+        return self.ranges(kind, [(from_date, to_date)])[0]
+
+    def weekly_charts(self, kind: str, charts: Iterable[Chart]) -> List[ListModel]:
+        """
+        Compute the charts of all the given weeks in a single pass over the
+        scrobbles, use the result of
+        :meth:`~pydrag.models.user.User.get_weekly_chart_list` to align with
+        the api charts.
+
+        :param kind: One of artist, album or track
+        :param charts: The chart date ranges, sorted and not overlapping
+        :rtype: List[:class:`~pydrag.models.common.ListModel`]
+        """
+        return self.ranges(kind, [(c.from_date, c.to_date) for c in charts])
+
+    def ranges(
+        self, kind: str, ranges: Sequence[Tuple[Timestamp, Timestamp]]
+    ) -> List[ListModel]:
+        """
+        Group the scrobbles by the given date ranges and the chart kind
+        with a single sort and return the ranked charts. Scrobbles without
+        a timestamp are ignored.
+
+        :param kind: One of artist, album or track
+        :param ranges: The start and end timestamps, sorted and not
+            overlapping
+        :rtype: List[:class:`~pydrag.models.common.ListModel`]
+        """
+        maximum = np.iinfo(np.int64).max
+        starts = np.array([0 if s is None else int(s) for s, _ in ranges], np.int64)
+        ends = np.array([maximum if e is None else int(e) for _, e in ranges], np.int64)
+        if np.any(starts[1:] < ends[:-1]):
+            raise ValueError("Chart ranges must be sorted and not overlapping")
+
+        timestamps = np.asarray(self.archive.column("timestamp"))
+        keys = self.group_keys(kind)
+        weeks = np.searchsorted(starts, timestamps, side="right") - 1
+        valid = (weeks >= 0) & (keys >= 0) & (timestamps >= 0)
+        valid[valid] &= timestamps[valid] < ends[weeks[valid]]
+
+        rows = np.flatnonzero(valid)
+        size = max(int(keys.max()) + 1, 1) if len(keys) else 1
+        groups, first, counts = np.unique(
+            weeks[rows] * size + keys[rows], return_index=True, return_counts=True
+        )
+        groups = groups // size
+        order = np.lexsort((first, -counts, groups))
+        bounds = np.searchsorted(groups[order], np.arange(len(ranges) + 1))
+
+        result = []
+        for i, (start, end) in enumerate(ranges):
+            ranked = order[bounds[i] : bounds[i + 1]]
+            result.append(
+                ListModel(
+                    data=self.models(kind, rows[first[ranked]], counts[ranked]),
+                    user=self.user,
+                    from_date=None if start is None else int(start),
+                    to_date=None if end is None else int(end),
+                )
+            )
+        return result
+
+    def top_artists(
+        self, period: Period, limit: int = 50, page: int = 1
+    ) -> ListModel[Artist]:
+        """
+        Local equivalent of :meth:`~pydrag.models.user.User.get_top_artists`.
+
+        :param Period period:
+        :param limit: The number of results to fetch per page.
+        :param page: The page number to fetch.
+        :rtype: :class:`~models.common.ListModel` of
+            :class:`~pydrag.models.artist.Artist`
+        """
+        return self.top("artist", period, limit, page)
+
+    def top_albums(
+        self, period: Period, limit: int = 50, page: int = 1
+    ) -> ListModel[Album]:
+        """
+        Local equivalent of :meth:`~pydrag.models.user.User.get_top_albums`.
+
+        :param Period period:
+        :param limit: The number of results to fetch per page.
+        :param page: The page number to fetch.
+        :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.album.Album`
+        """
+        return self.top("album", period, limit, page)
+
+    def top_tracks(
+        self, period: Period, limit: int = 50, page: int = 1
+    ) -> ListModel[Track]:
+        """
+        Local equivalent of :meth:`~pydrag.models.user.User.get_top_tracks`.
+
+        :param Period period:
+        :param limit: The number of results to fetch per page.
+        :param page: The page number to fetch.
+        :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
+        """
+        return self.top("track", period, limit, page)
+
+    def top(
+        self,
+        kind: str,
+        period: Period,
+        limit: int = 50,
+        page: int = 1,
+        now: Optional[int] = None,
+    ) -> ListModel:
+        """
+        Compute the top chart of the given period.
+
+        :param kind: One of artist, album or track
+        :param Period period:
+        :param limit: The number of results per page
+        :param page: The page number
+        :param now: The unix timestamp the periods end, defaults to now
+        :rtype: :class:`~pydrag.models.common.ListModel`
+        """
+        if not isinstance(period, Period):
+            raise ValueError("Invalid period")
+
+        return self.top_periods(kind, limit, page, now)[period]
+
+    def top_periods(
+        self, kind: str, limit: int = 50, page: int = 1, now: Optional[int] = None
+    ) -> Dict[Period, ListModel]:
+        """
+        Compute the top charts of every period in a single pass over the
+        scrobbles. The periods are nested, every scrobble is counted in its
+        shortest period and the counts are accumulated over the longer ones.
+        Scrobbles without a timestamp only count in the overall period.
+
+        :param kind: One of artist, album or track
+        :param limit: The number of results per page
+        :param page: The page number
+        :param now: The unix timestamp the periods end, defaults to now
+        :rtype: Dict[:class:`~pydrag.constants.Period`,
+            :class:`~pydrag.models.common.ListModel`]
+        """
+        now = int(time.time()) if now is None else now
+        periods = list(PERIOD_DAYS)
+        cutoffs = np.array(
+            [now - days * 86400 for days in PERIOD_DAYS.values() if days], np.int64
+        )
+
+        keys = self.group_keys(kind)
+        rows = np.flatnonzero(keys >= 0)
+        timestamps = np.asarray(self.archive.column("timestamp"))[rows]
+        buckets = len(cutoffs) - np.searchsorted(
+            cutoffs[::-1], timestamps, side="right"
+        )
+        buckets[timestamps < 0] = len(cutoffs)
+
+        groups, first, inverse = np.unique(
+            keys[rows], return_index=True, return_inverse=True
+        )
+        counts = np.bincount(
+            buckets * len(groups) + inverse.ravel(),
+            minlength=len(periods) * len(groups),
+        )
+        counts = counts.reshape(len(periods), len(groups)).cumsum(axis=0)
+
+        result = {}
+        offset = (page - 1) * limit
+        for period, period_counts in zip(periods, counts):
+            found = np.flatnonzero(period_counts)
+            order = found[np.lexsort((first[found], -period_counts[found]))]
+            ranked = order[offset : offset + limit]
+            models = self.models(kind, rows[first[ranked]], period_counts[ranked])
+            for rank, model in enumerate(models, offset + 1):
+                model.rank = rank  # type: ignore
+
+            result[period] = ListModel(
+                data=models, page=page, limit=limit, total=len(found), user=self.user
+            )
+        return result
+
+    def group_keys(self, kind: str) -> np.ndarray:
+        """
+        Return the group key of every scrobble, artist codes for artist
+        charts and combined artist and album or track codes for the rest.
+        Scrobbles with missing values have the key ``-1``.
+
+        :param kind: One of artist, album or track
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown chart kind: {kind}")
+
+        if kind not in self.keys:
+            artists = np.asarray(self.archive.column("artist"), dtype=np.int64)
+            if kind == "artist":
+                keys = artists
+            else:
+                column = "album" if kind == "album" else "name"
+                codes = np.asarray(self.archive.column(column), dtype=np.int64)
+                size = len(self.archive.dictionaries[column])
+                keys = np.where((artists < 0) | (codes < 0), -1, artists * size + codes)
+            self.keys[kind] = keys
+        return self.keys[kind]
+
+    def models(
+        self, kind: str, rows: np.ndarray, counts: np.ndarray
+    ) -> List[BaseModel]:
+        """
+        Construct the ranked chart models, the metadata are taken from the
+        given representative rows.
+
+        :param kind: One of artist, album or track
+        :param rows: The representative row of every group
+        :param counts: The playcount of every group
+        """
+        value = self.archive.value
+        result: List[BaseModel] = []
+        for rank, (row, playcount) in enumerate(zip(rows.tolist(), counts.tolist())):
+            artist = Artist(
+                name=value("artist", row), mbid=value("artist_mbid", row) or ""
+            )
+            model: BaseModel
+            if kind == "artist":
+                artist.playcount = playcount
+                artist.rank = rank + 1
+                model = artist
+            elif kind == "album":
+                model = Album(
+                    name=value("album", row),
+                    mbid=value("album_mbid", row) or "",
+                    artist=artist,
+                    playcount=playcount,
+                    rank=rank + 1,
+                )
+            else:
+                model = Track(
+                    name=value("name", row),
+                    artist=artist,
+                    mbid=value("mbid", row) or "",
+                    url=value("url", row),
+                    playcount=playcount,
+                    rank=rank + 1,
+                )
+            result.append(model)
+        return result
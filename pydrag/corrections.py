@@ -0,0 +1,139 @@
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pydrag.models.common import RawResponse
+from pydrag.services import ApiMixin
+from pydrag.stores import MemoryStore
+from pydrag.stores import Store
+from pydrag.utils import map_concurrently
+from pydrag.utils import normalize
+
+TrackKey = Tuple[str, str]
+
+
+def clean(text: str) -> str:
+    return " ".join(text.split())
+
+
+class Corrector:
+    """
+    Bulk canonicalisation of artist and track names, on top of the last.fm
+    corrections api.
+
+    The names are grouped by their normalized form, the known corrections
+    are served from the store and the rest are fetched concurrently. Names
+    without a correction map to their cleaned up form and failed lookups
+    map to None and are retried on the next call.
+
+    :param store: The corrections store, defaults to an in memory store
+    :param workers: The maximum number of concurrent requests
+
+    .. code-block:: python
+
+        >>> corrector = Corrector(ShelveStore("corrections"))
+        >>> corrector.correct_artists(["guns an roses", "Guns  an Roses"])
+        {'guns an roses': "Guns N' Roses", 'Guns  an Roses': "Guns N' Roses"}
+    """
+
+    def __init__(self, store: Optional[Store] = None, workers: int = 8):
+        self.store = store if store is not None else MemoryStore()
+        self.workers = workers
+
+    def correct_artists(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Return the canonical artist name for every given name.
+
+        :param names: The artist names
+        :rtype: Dict[str, Optional[str]]
+        """
+        names = list(names)
+        groups: Dict[str, str] = {}
+        for name in names:
+            groups.setdefault(normalize(name), clean(name))
+
+        found = self.resolve(
+            {f"artist:{key}": value for key, value in groups.items()},
+            self.fetch_artist,
+        )
+        return {name: found.get(f"artist:{normalize(name)}") for name in names}
+
+    def correct_tracks(
+        self, tracks: Iterable[TrackKey]
+    ) -> Dict[TrackKey, Optional[TrackKey]]:
+        """
+        Return the canonical artist and track name for every given pair.
+
+        :param tracks: The artist and track name pairs
+        :rtype: Dict[Tuple[str, str], Optional[Tuple[str, str]]]
+        """
+        tracks = list(tracks)
+        groups: Dict[str, TrackKey] = {}
+        for artist, track in tracks:
+            key = self.track_key(artist, track)
+            groups.setdefault(key, (clean(artist), clean(track)))
+
+        found = self.resolve(groups, self.fetch_track)
+        result: Dict[TrackKey, Optional[TrackKey]] = {}
+        for artist, track in tracks:
+            value = found.get(self.track_key(artist, track))
+            result[(artist, track)] = tuple(value) if value else None  # type: ignore
+        return result
+
+    def resolve(self, groups: Dict, fetch: Callable) -> Dict:
+        """
+        Return the stored or fetched corrections of the given groups, the
+        successful lookups are added to the store.
+
+        :param groups: The store keys and their lookup values
+        :param fetch: Callable that retrieves the correction of a lookup value
+        :rtype: Dict
+        """
+        found = {}
+        missing = {}
+        for key, value in groups.items():
+            cached = self.store.get(key)
+            if cached is None:
+                missing[key] = value
+            else:
+                found[key] = cached
+
+        results, _ = map_concurrently(fetch, missing.values(), self.workers)
+        for key, value in missing.items():
+            if value in results:
+                found[key] = results[value]
+                self.store.set(key, results[value])
+
+        return found
+
+    @staticmethod
+    def track_key(artist: str, track: str) -> str:
+        return f"track:{normalize(artist)}\x1f{normalize(track)}"
+
+    @staticmethod
+    def fetch_artist(name: str) -> str:
+        correction = Corrector.fetch({"method": "artist.getCorrection", "artist": name})
+        return correction.get("artist", {}).get("name") or name
+
+    @staticmethod
+    def fetch_track(key: TrackKey) -> List[str]:
+        artist, track = key
+        correction = Corrector.fetch(
+            {"method": "track.getCorrection", "artist": artist, "track": track}
+        )
+        corrected = correction.get("track", {})
+        return [
+            corrected.get("artist", {}).get("name") or artist,
+            corrected.get("name") or track,
+        ]
+
+    @staticmethod
+    def fetch(params: Dict) -> Dict:
+        response = ApiMixin.retrieve(bind=RawResponse, params=params)
+        correction = (response.data or {}).get("correction") or {}
+        if isinstance(correction, list):
+            correction = correction[0] if correction else {}
+        return correction
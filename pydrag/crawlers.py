@@ -0,0 +1,385 @@
+import contextvars
+import math
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+
+from pydrag.models.artist import Artist
+from pydrag.models.common import BaseModel
+from pydrag.models.tag import Tag
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from pydrag.stores import Store
+
+Neighbours = List[Tuple[Any, Optional[float]]]
+Task = Callable[[], Neighbours]
+
+
+@dataclass
+class Edge:
+    """
+    Graph edge between two entity keys.
+
+    :param source: The source entity key
+    :param target: The target entity key
+    :param weight: The edge weight, eg the similarity match
+    :param depth: The hop number of the source entity, seeds are zero
+    :param entity: The target entity as returned by the expansion
+    """
+
+    source: str
+    target: str
+    weight: Optional[float] = None
+    depth: int = 0
+    entity: Any = field(default=None, compare=False, repr=False)
+
+
+class Crawler(ABC):
+    """
+    Breadth first graph crawler with bounded concurrency.
+
+    Every hop expands the frontier entities concurrently, emits the edges
+    and schedules the unvisited neighbours for the next hop. The follow up
+    tasks of an expansion, like the next result pages, share the same
+    bounded pool. The frontier and the visited keys are saved to the store
+    after every hop and a new crawler with the same store resumes from the
+    last completed hop. The edges of an interrupted hop are emitted again on
+    resume. Entities that
+    failed to expand are kept in ``errors`` and retried with the next hop,
+    including after a resume.
+
+    :param seeds: The starting entities
+    :param depth: The maximum number of hops
+    :param workers: The maximum number of concurrent requests
+    :param store: The store to save and resume the crawl state
+    :param state_key: The store key of the crawl state
+    """
+
+    bind: Type[BaseModel] = BaseModel
+
+    def __init__(
+        self,
+        seeds: Sequence[Any],
+        depth: int = 2,
+        workers: int = 8,
+        store: Optional[Store] = None,
+        state_key: str = "crawler",
+    ):
+        self.seeds = list(seeds)
+        self.depth = depth
+        self.workers = workers
+        self.store = store
+        self.state_key = state_key
+        self.errors: Dict[str, Exception] = {}
+
+    def crawl(self) -> Iterator[Edge]:
+        """
+        Crawl the graph and stream the edges.
+
+        :rtype: Iterator[:class:`~pydrag.crawlers.Edge`]
+        """
+        hop, frontier, visited = self.load()
+        while hop < self.depth and frontier:
+            results, errors = self.expand_all(frontier)
+            for key in results:
+                self.errors.pop(key, None)
+            self.errors.update(errors)
+
+            upcoming: Dict[str, Any] = {key: frontier[key] for key in errors}
+            for source in frontier:
+                for neighbour, weight in results.get(source, []):
+                    target = self.key(neighbour)
+                    yield Edge(
+                        source=source,
+                        target=target,
+                        weight=weight,
+                        depth=hop,
+                        entity=neighbour,
+                    )
+
+                    if target not in visited:
+                        visited.add(target)
+                        upcoming[target] = neighbour
+
+            hop += 1
+            frontier = upcoming
+            self.save(hop, frontier, visited)
+
+    def adjacency(self) -> Dict[str, List[Tuple[str, Optional[float]]]]:
+        """
+        Crawl the graph and return the adjacency list of every entity key.
+
+        :rtype: Dict[str, List[Tuple[str, Optional[float]]]]
+        """
+        result: Dict[str, List[Tuple[str, Optional[float]]]] = {}
+        for edge in self.crawl():
+            result.setdefault(edge.source, []).append((edge.target, edge.weight))
+        return result
+
+    def load(self) -> Tuple[int, Dict[str, Any], set]:
+        state = self.store.get(self.state_key) if self.store else None
+        if state:
+            frontier = {
+                key: self.deserialize(data) for key, data in state["frontier"].items()
+            }
+            return state["hop"], frontier, set(state["visited"])
+
+        frontier = {self.key(seed): seed for seed in self.seeds}
+        return 0, frontier, set(frontier)
+
+    def save(self, hop: int, frontier: Dict[str, Any], visited: set):
+        if self.store is None:
+            return
+
+        state = {
+            "hop": hop,
+            "frontier": {key: self.serialize(value) for key, value in frontier.items()},
+            "visited": sorted(visited),
+        }
+        self.store.set(self.state_key, state)
+
+    def expand_all(
+        self, frontier: Dict[str, Any]
+    ) -> Tuple[Dict[str, Neighbours], Dict[str, Exception]]:
+        """
+        Expand the frontier entities and their follow up tasks with a thread
+        pool and collect the neighbours and the errors keyed by entity key.
+        The caller context variables are copied to every task.
+
+        :param frontier: The entities keyed by entity key
+        :rtype: Tuple[Dict[str, Neighbours], Dict[str, Exception]]
+        """
+        parts: Dict[str, Dict[int, Neighbours]] = {}
+        errors: Dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+
+            def submit(task: Callable) -> Future:
+                context = contextvars.copy_context()
+                return executor.submit(lambda: context.run(task))
+
+            futures = {
+                submit(partial(self.expand_tasks, entity)): (key, 0)
+                for key, entity in frontier.items()
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, index = futures.pop(future)
+                    if key in errors:
+                        continue
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        errors[key] = e
+                        parts.pop(key, None)
+                        continue
+
+                    if index == 0:
+                        result, tasks = result
+                        for number, task in enumerate(tasks, start=1):
+                            futures[submit(task)] = (key, number)
+                    parts.setdefault(key, {})[index] = result
+
+        results = {
+            key: [item for index in sorted(pages) for item in pages[index]]
+            for key, pages in parts.items()
+        }
+        return results, errors
+
+    @abstractmethod
+    def expand(self, entity: Any) -> Neighbours:
+        """
+        Return the neighbours of the given entity with the edge weights.
+
+        :param entity: The entity to expand
+        """
+
+    def expand_tasks(self, entity: Any) -> Tuple[Neighbours, List[Task]]:
+        """
+        Return the first neighbours of the given entity and the follow up
+        tasks of the expansion, eg the next result pages. The crawl schedules
+        the tasks in the same pool and appends their neighbours in order.
+
+        :param entity: The entity to expand
+        """
+        return self.expand(entity), []
+
+    def key(self, entity: Any) -> str:
+        """
+        Return the unique key of the given entity, the musicbrainz id if
+        available or the lowercase name.
+
+        :param entity: The graph entity
+        """
+        mbid = getattr(entity, "mbid", None)
+        if mbid:
+            return f"mbid:{mbid}"
+
+        name = entity.name.casefold()
+        artist = getattr(entity, "artist", None)
+        if artist is not None:
+            return f"name:{artist.name.casefold()}\x1f{name}"
+        return f"name:{name}"
+
+    def serialize(self, entity: Any) -> Dict:
+        data = {"name": entity.name, "mbid": getattr(entity, "mbid", None)}
+        artist = getattr(entity, "artist", None)
+        if artist is not None:
+            data["artist"] = {"name": artist.name, "mbid": artist.mbid}
+        return data
+
+    def deserialize(self, data: Dict) -> Any:
+        return self.bind.from_dict(dict(data))
+
+
+class SimilarityCrawler(Crawler):
+    """
+    Crawl the similarity graph of artists, tracks or tags, the edge weights
+    are the similarity match values.
+
+    :param seeds: The starting artists, tracks or tags
+    :param depth: The maximum number of hops
+    :param limit: The maximum number of similar entities per hop
+    :param workers: The maximum number of concurrent requests
+    :param store: The store to save and resume the crawl state
+    :param state_key: The store key of the crawl state
+
+    .. code-block:: python
+
+        >>> crawler = SimilarityCrawler([Artist.find("Queen")], depth=2, limit=10)
+        >>> for edge in crawler.crawl():
+        ...     edge.source, edge.target, edge.weight
+    """
+
+    def __init__(
+        self,
+        seeds: Sequence[Any],
+        depth: int = 2,
+        limit: int = 50,
+        workers: int = 8,
+        store: Optional[Store] = None,
+        state_key: str = "crawler",
+    ):
+        super().__init__(seeds, depth, workers, store, state_key)
+        self.limit = limit
+        self.bind = type(self.seeds[0]) if self.seeds else Artist
+
+    def expand(self, entity: Any) -> Neighbours:
+        if isinstance(entity, Tag):
+            similar = list(entity.get_similar())[: self.limit]
+        elif isinstance(entity, (Artist, Track)):
+            similar = list(entity.get_similar(limit=self.limit))
+        else:
+            raise ValueError(f"Unsupported entity type: {type(entity).__name__}")
+
+        return [(item, getattr(item, "match", None)) for item in similar]
+
+    def serialize(self, entity: Any) -> Dict:
+        if isinstance(entity, Tag):
+            return {"name": entity.name}
+        return super().serialize(entity)
+
+
+class FriendsCrawler(Crawler):
+    """
+    Crawl the friends graph of last.fm users, the edges are unweighted and
+    the edge entities are the friend users with their most recent track if
+    requested.
+
+    The first friend list page gives the total friends, the next pages are
+    fetched concurrently with the rest of the crawl.
+
+    :param seeds: The starting users or user names
+    :param depth: The maximum number of hops
+    :param limit: The maximum number of friends per user
+    :param recent_tracks: Include the recent track of every friend
+    :param page_size: The number of friends per page request
+    :param workers: The maximum number of concurrent requests
+    :param store: The store to save and resume the crawl state
+    :param state_key: The store key of the crawl state
+
+    .. code-block:: python
+
+        >>> crawler = FriendsCrawler(["rj"], depth=2, recent_tracks=True)
+        >>> for edge in crawler.crawl():
+        ...     edge.source, edge.target, edge.entity.recent_track
+    """
+
+    bind = User
+
+    def __init__(
+        self,
+        seeds: Sequence[Any],
+        depth: int = 2,
+        limit: int = 200,
+        recent_tracks: bool = False,
+        page_size: int = 50,
+        workers: int = 8,
+        store: Optional[Store] = None,
+        state_key: str = "crawler",
+    ):
+        seeds = [self.user(seed) if isinstance(seed, str) else seed for seed in seeds]
+        super().__init__(seeds, depth, workers, store, state_key)
+        self.limit = limit
+        self.recent_tracks = recent_tracks
+        self.page_size = page_size
+
+    def expand(self, entity: User) -> Neighbours:
+        neighbours, tasks = self.expand_tasks(entity)
+        for task in tasks:
+            neighbours.extend(task())
+        return neighbours
+
+    def expand_tasks(self, entity: User) -> Tuple[Neighbours, List[Task]]:
+        first = entity.get_friends(self.recent_tracks, limit=self.page_size)
+        total = min(first.total or 0, self.limit)
+        pages = range(2, math.ceil(total / self.page_size) + 1)
+        tasks: List[Task] = [partial(self.fetch_page, entity, page) for page in pages]
+        return self.neighbours(first, 1), tasks
+
+    def fetch_page(self, entity: User, page: int) -> Neighbours:
+        friends = entity.get_friends(
+            self.recent_tracks, limit=self.page_size, page=page
+        )
+        return self.neighbours(friends, page)
+
+    def neighbours(self, friends: Iterable[User], page: int) -> Neighbours:
+        remaining = max(self.limit - (page - 1) * self.page_size, 0)
+        return [(friend, None) for friend in list(friends)[:remaining]]
+
+    def serialize(self, entity: Any) -> Dict:
+        return {"name": entity.name}
+
+    def deserialize(self, data: Dict) -> Any:
+        return self.user(data["name"])
+
+    @staticmethod
+    def user(name: str) -> User:
+        profile: Dict[str, Any] = dict(
+            playlists=None,
+            playcount=None,
+            gender=None,
+            url=None,
+            country=None,
+            image=None,
+            age=None,
+            registered=None,
+        )
+        return User(name=name, **profile)
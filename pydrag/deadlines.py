@@ -0,0 +1,86 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from pydrag.exceptions import DeadlineExceeded
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+# Monotonic timestamp the requests of the current context must complete by
+current: "ContextVar[Optional[float]]" = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound the total time of all the requests in the block, including
+    pagination helpers and the concurrent requests that copy the context.
+    Nested deadlines can only shorten the outer one.
+
+    The deadline is best-effort within a single request: the timeouts of
+    every request are capped to the time left, but the read timeout applies
+    per socket read, so a slowly trickling response can overrun it. Such a
+    response raises :class:`~pydrag.exceptions.DeadlineExceeded` once it
+    completes and no further requests are sent.
+
+    :param seconds: The time budget in seconds
+    :returns: The monotonic timestamp of the deadline
+
+    .. code-block:: python
+
+        >>> with deadline(10):
+        ...     index.sync()
+    """
+    outer = current.get()
+    expires = time.monotonic() + seconds
+    if outer is not None:
+        expires = min(expires, outer)
+
+    token = current.set(expires)
+    try:
+        yield expires
+    finally:
+        current.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Return the seconds left until the current deadline, None without a
+    deadline.
+
+    :rtype: Optional[float]
+    """
+    expires = current.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def request_timeout(timeout: Timeout) -> Timeout:
+    """
+    Cap the connect and read timeouts to the time left until the current
+    deadline, the read timeout applies to every socket read and not to the
+    whole response.
+
+    :param timeout: Seconds or a connect and read timeouts pair
+    :rtype: Tuple[Optional[float], Optional[float]]
+    :raise: :class:`~pydrag.exceptions.DeadlineExceeded`
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return (
+        left if connect is None else min(connect, left),
+        left if read is None else min(read, left),
+    )
@@ -4,3 +4,18 @@ class ApiError(Exception):
         self.message = message
         self.error = error
         self.links = links
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the current deadline expires before a request is sent or
+    completed, see :func:`~pydrag.deadlines.deadline`."""
+
+
+class CircuitOpenError(Exception):
+    """Raised without sending the request while the circuit breaker is open,
+    see :class:`~pydrag.breaker.CircuitBreaker`."""
+
+    def __init__(self, message, retry_after) -> None:
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
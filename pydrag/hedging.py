@@ -0,0 +1,192 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+from pydrag.metrics import DEFAULT_BUCKETS
+from pydrag.metrics import Histogram
+
+
+class HedgingPolicy:
+    """
+    Hedged requests for the idempotent api reads.
+
+    The request runs on its own thread, if it hasn't answered within the
+    given latency percentile of the method a duplicate request is sent from
+    a thread pool and the first response wins. The late response is
+    discarded. Errors are returned as they arrive, only slow requests are
+    hedged.
+
+    The hedges are limited to a fraction of the requests, so that hedging
+    never uses more than the budget of the api quota, and to the idle pool
+    workers, hedges are skipped instead of queued. The percentile delay is
+    estimated from the latencies of the completed requests, measured from
+    the moment they are sent. Methods with few samples use the default
+    delay.
+
+    :param percentile: The latency percentile to wait before hedging
+    :param budget: The maximum ratio of hedges to requests
+    :param default_delay: Seconds to wait without enough latency samples
+    :param min_samples: The number of samples before using the percentile
+    :param workers: The maximum number of concurrent hedges
+    :param buckets: The latency histogram bucket upper bounds in seconds
+
+    .. code-block:: python
+
+        >>> Config.hedging = HedgingPolicy(percentile=95, budget=0.05)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        budget: float = 0.05,
+        default_delay: float = 1.0,
+        min_samples: int = 20,
+        workers: int = 16,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.default_delay = default_delay
+        self.min_samples = min_samples
+        self.workers = workers
+        self.buckets = buckets
+        self.latencies: Dict[str, Histogram] = {}
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self.slots = threading.BoundedSemaphore(workers)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.lock = threading.Lock()
+
+    def run(self, method: str, send: Callable[[], Any]) -> Any:
+        """
+        Call the send function and hedge it if it's slow and the budget
+        allows it.
+
+        :param str method: The last.fm method name
+        :param send: Callable that sends the request and returns the response
+        """
+        with self.lock:
+            self.requests += 1
+
+        primary = self.start(method, send)
+        done, _ = wait([primary], timeout=self.delay(method))
+        hedge = None if done else self.hedge(method, send)
+        if hedge is None:
+            return primary.result()
+
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None:
+                if winner is hedge:
+                    with self.lock:
+                        self.wins += 1
+                return winner.result()
+            if not pending:
+                return primary.result()
+
+    def delay(self, method: str) -> float:
+        """
+        Return the seconds to wait before hedging a request of the method.
+
+        :param str method: The last.fm method name
+        """
+        with self.lock:
+            histogram = self.latencies.get(method)
+            if histogram is None or histogram.count < self.min_samples:
+                return self.default_delay
+            value = histogram.percentile(self.percentile)
+
+        if value is None or value == float("inf"):
+            return self.default_delay
+        return value
+
+    def allow(self) -> bool:
+        """Reserve a hedge if it's within the budget."""
+        with self.lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def observe(self, method: str, duration: float):
+        with self.lock:
+            if method not in self.latencies:
+                self.latencies[method] = Histogram(self.buckets)
+            self.latencies[method].observe(duration)
+
+    def timed(self, method: str, send: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = send()
+        self.observe(method, time.perf_counter() - start)
+        return result
+
+    def start(self, method: str, send: Callable[[], Any]) -> Future:
+        """
+        Run the request on a new thread, outside of the hedging pool so
+        that the client concurrency is not limited by it.
+
+        :param str method: The last.fm method name
+        :param send: Callable that sends the request
+        """
+        future: Future = Future()
+        context = contextvars.copy_context()
+
+        def target():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(context.run(self.timed, method, send))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=target, daemon=True).start()
+        return future
+
+    def hedge(self, method: str, send: Callable[[], Any]) -> Optional[Future]:
+        """
+        Send a duplicate request from the pool, if a worker is idle and the
+        budget allows it.
+
+        :param str method: The last.fm method name
+        :param send: Callable that sends the request
+        """
+        if not self.slots.acquire(blocking=False):
+            return None
+        if not self.allow():
+            self.slots.release()
+            return None
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="pydrag-hedge"
+                )
+            executor = self.executor
+
+        context = contextvars.copy_context()
+        future = executor.submit(lambda: context.run(self.timed, method, send))
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the thread pool, a new one is started on the next hedge.
+
+        :param wait: Wait for the pending requests to complete
+        """
+        with self.lock:
+            executor, self.executor = self.executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,93 @@
+import logging
+import threading
+from typing import Callable
+from typing import Dict
+from typing import List
+
+PRE_REQUEST = "pre_request"
+POST_RESPONSE = "post_response"
+POST_PARSE = "post_parse"
+POST_BIND = "post_bind"
+ON_ERROR = "on_error"
+CIRCUIT_CHANGE = "circuit_change"
+
+logger = logging.getLogger(__name__)
+
+
+class Hooks:
+    """
+    Pydrag request lifecycle event registry.
+
+    Callbacks are called with keyword arguments only, every event includes
+    the last.fm ``method`` name and the request ``params``.
+
+    * ``pre_request``: Before the web request is sent
+    * ``post_response``: After the response is received, includes the
+      ``response``, the total request ``duration``, the server ``elapsed``
+      time and the body ``size`` in bytes.
+    * ``post_parse``: After the json decoding, includes the ``body`` and the
+      parsing ``duration``
+    * ``post_bind``: After the model binding, includes the ``result`` and the
+      binding ``duration``
+    * ``on_error``: When any error is raised, includes the ``error``
+    * ``circuit_change``: When the circuit breaker changes state, includes
+      the ``previous`` and the new ``state``
+
+    Callback errors are logged and never interrupt the request.
+    """
+
+    events = (
+        PRE_REQUEST,
+        POST_RESPONSE,
+        POST_PARSE,
+        POST_BIND,
+        ON_ERROR,
+        CIRCUIT_CHANGE,
+    )
+
+    def __init__(self):
+        self.callbacks: Dict[str, List[Callable]] = {e: [] for e in self.events}
+        self.lock = threading.Lock()
+
+    def register(self, event: str, callback: Callable):
+        """
+        Register a callback for the given event.
+
+        :param str event: The event name
+        :param callback: The callable to invoke with the event keyword arguments
+        :raise: ValueError if the event name is unknown
+        """
+        if event not in self.callbacks:
+            raise ValueError(f"Unknown event: {event}")
+
+        with self.lock:
+            self.callbacks[event] = self.callbacks[event] + [callback]
+
+    def unregister(self, event: str, callback: Callable):
+        """
+        Remove a callback for the given event, unknown callbacks are ignored.
+
+        :param str event: The event name
+        :param callback: The registered callable
+        """
+        with self.lock:
+            self.callbacks[event] = [
+                c for c in self.callbacks.get(event, []) if c != callback
+            ]
+
+    def emit(self, event: str, **kwargs):
+        """
+        Invoke all the callbacks registered for the given event.
+
+        :param str event: The event name
+        """
+        for callback in self.callbacks[event]:
+            try:
+                callback(**kwargs)
+            except Exception:
+                logger.exception("Hook callback failed for event: %s", event)
+
+    def clear(self):
+        """Remove all the registered callbacks."""
+        with self.lock:
+            self.callbacks = {e: [] for e in self.events}
@@ -0,0 +1,177 @@
+import os
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from pydrag.archive import Archive
+from pydrag.archive import ArchiveWriter
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+from pydrag.models.user import User
+
+
+class ScrobbleIndex:
+    """
+    Local, memory mapped and timestamp sorted index of a user's scrobbles.
+
+    Range queries are answered with a binary search over the timestamp
+    column, the scrobbles after the last synchronization are fetched from
+    the recent tracks api. Wrap the calls with
+    :func:`~pydrag.deadlines.deadline` to bound the time of all the page
+    requests.
+
+    :param path: The index root directory, every user has a sub directory
+    :param user: The user name
+
+    .. code-block:: python
+
+        >>> index = ScrobbleIndex("scrobbles", "rj")
+        >>> index.sync()
+        >>> index.range(from_date=1541000000, to_date=1541874568)
+    """
+
+    def __init__(self, path: str, user: str):
+        self.user = user
+        self.path = os.path.join(path, user)
+        self.archive: Optional[Archive] = None
+        if os.path.exists(os.path.join(self.path, "meta.json")):
+            self.archive = Archive(self.path)
+
+    @property
+    def synced(self) -> Optional[int]:
+        """The timestamp of the last synchronization, None if never synced."""
+        return self.archive.attributes.get("synced") if self.archive else None
+
+    def __len__(self) -> int:
+        return len(self.archive) if self.archive else 0
+
+    def sync(self, limit: int = 200) -> int:
+        """
+        Fetch the scrobbles since the last synchronization and add them to
+        the index.
+
+        :param limit: The number of results to fetch per page
+        :returns: The number of new scrobbles
+        """
+        now = int(time.time())
+        tracks = self.fetch(self.start(None), now, limit)
+
+        if self.archive is None:
+            writer = ArchiveWriter(self.path)
+        else:
+            writer = ArchiveWriter.extend(self.archive)
+
+        writer.write(tracks)
+        writer.sort("timestamp")
+        writer.attributes.update(user=self.user, synced=now)
+        writer.close()
+
+        self.archive = Archive(self.path)
+        return len(tracks)
+
+    def range(
+        self,
+        from_date: Optional[int] = None,
+        to_date: Optional[int] = None,
+        fetch: bool = True,
+        limit: int = 200,
+    ) -> ListModel[Track]:
+        """
+        Return the scrobbles between the given timestamps in chronological
+        order, the range limits are inclusive.
+
+        :param from_date: Beginning unix timestamp of the range
+        :param to_date: End unix timestamp of the range
+        :param fetch: Retrieve the range after the last synchronization from
+            the api
+        :param limit: The number of results to fetch per page
+        :rtype: :class:`~pydrag.models.common.ListModel` of
+            :class:`~pydrag.models.track.Track`
+        """
+        start, end = self.search(from_date, to_date)
+        data: List[Track] = self.archive[start:end] if self.archive else []
+
+        synced = self.synced
+        if fetch and (synced is None or to_date is None or to_date > synced):
+            tail = self.fetch(self.start(from_date), to_date, limit)
+            data.extend(sorted(tail, key=lambda track: track.timestamp or 0))
+
+        return ListModel(
+            data=data,
+            total=len(data),
+            user=self.user,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
+    def search(
+        self, from_date: Optional[int], to_date: Optional[int]
+    ) -> Tuple[int, int]:
+        """
+        Return the start and end row numbers of the given range.
+
+        :param from_date: Beginning unix timestamp of the range
+        :param to_date: End unix timestamp of the range
+        :rtype: Tuple[int, int]
+        """
+        if self.archive is None:
+            return 0, 0
+
+        timestamps = self.archive.column("timestamp")
+        start = 0
+        end = len(timestamps)
+        if from_date is not None:
+            start = int(np.searchsorted(timestamps, from_date, side="left"))
+        if to_date is not None:
+            end = int(np.searchsorted(timestamps, to_date, side="right"))
+        return start, max(start, end)
+
+    def start(self, from_date: Optional[int]) -> Optional[int]:
+        synced = self.synced
+        if synced is None:
+            return from_date
+        if from_date is None:
+            return synced + 1
+        return max(from_date, synced + 1)
+
+    def fetch(
+        self, from_date: Optional[int], to_date: Optional[int], limit: int
+    ) -> List[Track]:
+        """
+        Page through the recent tracks api, the now playing track is
+        skipped.
+
+        :param from_date: Beginning unix timestamp of the range
+        :param to_date: End unix timestamp of the range
+        :param limit: The number of results to fetch per page
+        """
+        profile: Dict[str, Any] = dict(
+            playlists=None,
+            playcount=None,
+            gender=None,
+            url=None,
+            country=None,
+            image=None,
+            age=None,
+            registered=None,
+        )
+        user = User(name=self.user, **profile)
+        start = None if from_date is None else str(from_date)
+        end = None if to_date is None else str(to_date)
+        result: List[Track] = []
+        page = 1
+        while True:
+            tracks = user.get_recent_tracks(
+                from_date=start, to_date=end, limit=limit, page=page
+            )
+            result.extend(track for track in tracks if track.timestamp is not None)
+
+            total = tracks.total or 0
+            if not tracks or page * limit >= total:
+                return result
+            page += 1
@@ -0,0 +1,222 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+from pydrag.exceptions import ApiError
+from pydrag.hooks import CIRCUIT_CHANGE
+from pydrag.hooks import Hooks
+from pydrag.hooks import ON_ERROR
+from pydrag.hooks import POST_BIND
+from pydrag.hooks import POST_PARSE
+from pydrag.hooks import POST_RESPONSE
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Cumulative latency histogram with fixed upper bounds in seconds, the last
+    bucket catches everything above the highest bound.
+
+    :param buckets: The sorted bucket upper bounds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return the upper bound of the bucket that contains the given
+        percentile, or None if there are no observations.
+
+        :param float q: The percentile, between 0 and 100
+        """
+        if self.count == 0:
+            return None
+
+        rank = self.count * q / 100
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class MethodMetrics:
+    """
+    Metrics of a single last.fm method.
+
+    :param buckets: The histogram bucket upper bounds
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.requests = 0
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.not_modified = 0
+        self.errors: Dict[Any, int] = defaultdict(int)
+        self.latency = Histogram(buckets)
+        self.server = Histogram(buckets)
+        self.parse = Histogram(buckets)
+        self.bind = Histogram(buckets)
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "wire_bytes": self.wire_bytes,
+            "not_modified": self.not_modified,
+            "errors": dict(self.errors),
+            "latency": self.latency.to_dict(),
+            "server": self.server.to_dict(),
+            "parse": self.parse.to_dict(),
+            "bind": self.bind.to_dict(),
+        }
+
+
+class MetricsCollector:
+    """
+    Collect latency histograms, error counts and response sizes per last.fm
+    method through the request hooks. The response sizes are counted
+    decompressed in ``bytes`` and as received in ``wire_bytes``.
+
+    Errors are counted by the api error code, the http status code or the
+    exception class name, the requests rejected by the circuit breaker are
+    counted as ``CircuitOpenError``. The current circuit breaker state is
+    kept in ``circuit`` and the number of transitions to every state in
+    ``circuit_changes``.
+
+    :param buckets: The histogram bucket upper bounds in seconds
+
+    .. code-block:: python
+
+        >>> collector = MetricsCollector()
+        >>> collector.attach()
+        >>> collector.get("user.getRecentTracks").latency.percentile(99)
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.methods: Dict[str, MethodMetrics] = {}
+        self.lock = threading.Lock()
+        self.hooks: Optional[Hooks] = None
+        self.circuit: Optional[str] = None
+        self.circuit_changes: Dict[str, int] = defaultdict(int)
+
+    def attach(self, hooks: Optional[Hooks] = None):
+        """
+        Register the collector callbacks, defaults to the configuration hooks.
+
+        :param hooks: The hooks registry
+        """
+        if hooks is None:
+            from pydrag.models.common import Config
+
+            hooks = Config.hooks
+
+        hooks.register(POST_RESPONSE, self.on_response)
+        hooks.register(POST_PARSE, self.on_parse)
+        hooks.register(POST_BIND, self.on_bind)
+        hooks.register(ON_ERROR, self.on_error)
+        hooks.register(CIRCUIT_CHANGE, self.on_circuit_change)
+        self.hooks = hooks
+
+    def detach(self):
+        """Unregister the collector callbacks."""
+        if self.hooks is None:
+            return
+
+        self.hooks.unregister(POST_RESPONSE, self.on_response)
+        self.hooks.unregister(POST_PARSE, self.on_parse)
+        self.hooks.unregister(POST_BIND, self.on_bind)
+        self.hooks.unregister(ON_ERROR, self.on_error)
+        self.hooks.unregister(CIRCUIT_CHANGE, self.on_circuit_change)
+        self.hooks = None
+
+    def get(self, method: str) -> MethodMetrics:
+        """
+        Return the metrics of the given last.fm method.
+
+        :param str method: The last.fm method name, eg ``user.getInfo``
+        """
+        with self.lock:
+            if method not in self.methods:
+                self.methods[method] = MethodMetrics(self.buckets)
+            return self.methods[method]
+
+    def reset(self):
+        """Discard all the collected metrics."""
+        with self.lock:
+            self.methods = {}
+            self.circuit = None
+            self.circuit_changes = defaultdict(int)
+
+    def to_dict(self) -> Dict:
+        with self.lock:
+            return {k: v.to_dict() for k, v in self.methods.items()}
+
+    def on_response(
+        self,
+        method: str,
+        duration: float,
+        elapsed: float,
+        size: int,
+        wire_size: Optional[int] = None,
+        response: Any = None,
+        **kwargs: Any,
+    ):
+        metrics = self.get(method)
+        with self.lock:
+            metrics.requests += 1
+            metrics.bytes += size
+            metrics.wire_bytes += size if wire_size is None else wire_size
+            if getattr(response, "status_code", None) == 304:
+                metrics.not_modified += 1
+            metrics.latency.observe(duration)
+            metrics.server.observe(elapsed)
+
+    def on_parse(self, method: str, duration: float, **kwargs: Any):
+        metrics = self.get(method)
+        with self.lock:
+            metrics.parse.observe(duration)
+
+    def on_bind(self, method: str, duration: float, **kwargs: Any):
+        metrics = self.get(method)
+        with self.lock:
+            metrics.bind.observe(duration)
+
+    def on_error(self, method: str, error: Exception, **kwargs: Any):
+        if isinstance(error, ApiError):
+            code: Any = error.error
+        else:
+            response = getattr(error, "response", None)
+            code = getattr(response, "status_code", None) or type(error).__name__
+
+        metrics = self.get(method)
+        with self.lock:
+            metrics.errors[code] += 1
+
+    def on_circuit_change(self, state: str, **kwargs: Any):
+        with self.lock:
+            self.circuit = state
+            self.circuit_changes[state] += 1
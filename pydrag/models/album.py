@@ -3,12 +3,14 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
+from pydrag.cache import NEGATIVE
 from pydrag.models.artist import Artist
 from pydrag.models.common import BaseModel
 from pydrag.models.common import Image
 from pydrag.models.common import ListModel
 from pydrag.models.common import RawResponse
 from pydrag.models.common import Wiki
+from pydrag.models.frozen import FrozenAlbum
 from pydrag.models.tag import Tag
 from pydrag.services import ApiMixin
 
@@ -45,6 +47,7 @@ class Album(BaseModel, ApiMixin):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         if isinstance(data.get("artist"), str):
             data["artist"] = {"name": data["artist"]}
 
@@ -67,6 +70,19 @@ class Album(BaseModel, ApiMixin):
 
         return super().from_dict(data)
 
+    def freeze(self) -> FrozenAlbum:
+        """
+        Return the immutable and hashable variant of the album.
+
+        :rtype: :class:`~pydrag.models.frozen.FrozenAlbum`
+        """
+        return FrozenAlbum(
+            name=self.name,
+            artist=self.artist.freeze() if self.artist else None,
+            mbid=self.mbid,
+            url=self.url,
+        )
+
     @classmethod
     def find(
         cls,
@@ -96,6 +112,7 @@ class Album(BaseModel, ApiMixin):
                 "username": user,
                 "lang": lang,
             },
+            cache=NEGATIVE,
         )
 
     @classmethod
@@ -119,6 +136,7 @@ class Album(BaseModel, ApiMixin):
                 "username": user,
                 "lang": lang,
             },
+            cache=NEGATIVE,
         )
 
     def get_info(self, user: str = None, lang: str = "en") -> "Album":
@@ -163,12 +181,13 @@ class Album(BaseModel, ApiMixin):
             },
         )
 
-    def add_tags(self, tags: List[str]) -> RawResponse:
+    def add_tags(self, tags: List[str], user: Optional[str] = None) -> RawResponse:
         """
         Tag an album using a list of user supplied tags.
 
         :param tags: A list of user supplied tags to apply to this album. Accepts a
             maximum of 10 tags.
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         if self.artist is None:
@@ -177,6 +196,7 @@ class Album(BaseModel, ApiMixin):
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={
                 "method": "album.addTags",
                 "arist": self.artist.name,
@@ -185,11 +205,12 @@ class Album(BaseModel, ApiMixin):
             },
         )
 
-    def remove_tag(self, tag: str) -> RawResponse:
+    def remove_tag(self, tag: str, user: Optional[str] = None) -> RawResponse:
         """
         Remove a user's tag from an album.
 
         :param tag: A single user tag to remove from this album.
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         if self.artist is None:
@@ -198,6 +219,7 @@ class Album(BaseModel, ApiMixin):
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={
                 "method": "album.removeTag",
                 "album": self.name,
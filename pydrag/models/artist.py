@@ -3,11 +3,13 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
+from pydrag.cache import NEGATIVE
 from pydrag.models.common import BaseModel
 from pydrag.models.common import Image
 from pydrag.models.common import ListModel
 from pydrag.models.common import RawResponse
 from pydrag.models.common import Wiki
+from pydrag.models.frozen import FrozenArtist
 from pydrag.models.tag import Tag
 from pydrag.services import ApiMixin
 
@@ -50,6 +52,7 @@ class Artist(BaseModel, ApiMixin):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         try:
             data.update(data.pop("stats"))
         except KeyError:
@@ -57,7 +60,7 @@ class Artist(BaseModel, ApiMixin):
 
         try:
             correction = data.pop("correction")
-            data = correction.pop("artist")
+            data = dict(correction["artist"])
         except KeyError:
             pass
 
@@ -76,6 +79,14 @@ class Artist(BaseModel, ApiMixin):
 
         return super().from_dict(data)
 
+    def freeze(self) -> FrozenArtist:
+        """
+        Return the immutable and hashable variant of the artist.
+
+        :rtype: :class:`~pydrag.models.frozen.FrozenArtist`
+        """
+        return FrozenArtist(name=self.name, mbid=self.mbid, url=self.url)
+
     @classmethod
     def find(cls, artist: str, user: str = None, lang: str = "en") -> "Artist":
         """
@@ -98,6 +109,7 @@ class Artist(BaseModel, ApiMixin):
                 "username": user,
                 "lang": lang,
             },
+            cache=NEGATIVE,
         )
 
     @classmethod
@@ -122,6 +134,7 @@ class Artist(BaseModel, ApiMixin):
                 "username": user,
                 "lang": lang,
             },
+            cache=NEGATIVE,
         )
 
     def get_info(self, user: str = None, lang: str = "en") -> "Artist":
@@ -183,6 +196,7 @@ class Artist(BaseModel, ApiMixin):
                 "limit": limit,
                 "page": page,
             },
+            cache=True,
         )
 
     @classmethod
@@ -201,19 +215,22 @@ class Artist(BaseModel, ApiMixin):
             bind=Artist,
             flatten="artist",
             params={"method": "chart.getTopArtists", "limit": limit, "page": page},
+            cache=True,
         )
 
-    def add_tags(self, tags: List[str]) -> RawResponse:
+    def add_tags(self, tags: List[str], user: Optional[str] = None) -> RawResponse:
         """
         Tag an artist with one or more user supplied tags.
 
         :param tags: A list of user supplied tags to apply to this artist.
             Accepts a maximum of 10 tags.
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={
                 "method": "artist.addTags",
                 "arist": self.name,
@@ -221,16 +238,18 @@ class Artist(BaseModel, ApiMixin):
             },
         )
 
-    def remove_tag(self, tag: str) -> RawResponse:
+    def remove_tag(self, tag: str, user: Optional[str] = None) -> RawResponse:
         """
         Remove a user's tag from an artist.
 
         :param tag: A single user tag to remove from this artist.
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={"method": "artist.removeTag", "arist": self.name, "tag": tag},
         )
 
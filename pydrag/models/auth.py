@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import ClassVar
+from typing import Dict
+from typing import Optional
 
 from pydrag.models.common import BaseModel
 from pydrag.models.common import Config
@@ -10,6 +13,10 @@ class AuthSession(BaseModel, ApiMixin):
     """
     Last.FM authentication api wrapper.
 
+    Saved sessions are kept in a registry keyed by username, backed by the
+    configured session store, in order to perform write operations on behalf
+    of many users.
+
     :param key: Session key
     :param name: Authenticated user
     """
@@ -17,6 +24,8 @@ class AuthSession(BaseModel, ApiMixin):
     key: str
     name: str
 
+    registry: ClassVar[Dict[str, "AuthSession"]] = {}
+
     @classmethod
     def authenticate(cls) -> "AuthSession":
         """
@@ -33,6 +42,39 @@ class AuthSession(BaseModel, ApiMixin):
             params={"method": "auth.getMobileSession"},
         )
 
+    @classmethod
+    def load(cls, username: Optional[str]) -> Optional["AuthSession"]:
+        """
+        Load a previously saved session for the given user from the registry
+        or the configured session store.
+
+        :param username: The session owner
+        :rtype: :class:`~pydrag.models.auth.AuthSession`
+        """
+        if not username:
+            return None
+
+        session = cls.registry.get(username)
+        store = Config.session_store
+        if session is None and store is not None:
+            data = store.get(username)
+            if data:
+                session = cls(**data)
+                cls.registry[username] = session
+
+        return session
+
+    def save(self):
+        """Add the session to the registry and persist it to the configured
+        session store, if any."""
+        if not self.name:
+            return
+
+        self.registry[self.name] = self
+        store = Config.session_store
+        if store is not None:
+            store.set(self.name, {"key": self.key, "name": self.name})
+
     @classmethod
     def from_token(cls, token: str) -> "AuthSession":
         """
@@ -1,3 +1,4 @@
+import copy
 import os
 import time
 from collections import UserList
@@ -5,6 +6,8 @@ from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import fields
+from dataclasses import replace
+from functools import lru_cache
 from typing import Any
 from typing import ClassVar
 from typing import Dict
@@ -16,6 +19,13 @@ from typing import Type
 from typing import TypeVar
 from typing import Union
 
+from pydrag.breaker import CircuitBreaker
+from pydrag.cache import Cache
+from pydrag.deadlines import Timeout
+from pydrag.hedging import HedgingPolicy
+from pydrag.hooks import Hooks
+from pydrag.stores import Store
+from pydrag.utils import load_dotenv
 from pydrag.utils import md5
 from pydrag.utils import to_camel_case
 
@@ -51,10 +61,14 @@ class BaseModel:
         Construct a BaseModel from a dictionary based on the class fields type
         annotations. Only primitive types are supported.
 
+        The input dictionary is never modified, the subclasses work on
+        shallow copies so parsed responses can be shared and bound again.
+
         :param data:
         :type data: Type[BaseModel]
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
+        data = dict(data)
         for f in fields(cls):
             if f.name not in data or data[f.name] is None:
                 continue
@@ -111,13 +125,13 @@ class ListModel(UserList, Sequence[T], BaseModel):
 
     @classmethod
     def from_dict(cls: Type, data: Dict):
+        data = dict(data)
         if "attr" in data:
             data.update(data.pop("attr"))
 
         if "query" in data:
-            data["query"].pop("text", None)
-            data["query"].pop("role", None)
-            data.update(data.pop("query"))
+            query = data.pop("query")
+            data.update({k: v for k, v in query.items() if k not in ("text", "role")})
 
         if "offset" in data and "page" not in data and "limit" in data:
             data["page"] = int(data["offset"]) / int(data["limit"])
@@ -125,6 +139,20 @@ class ListModel(UserList, Sequence[T], BaseModel):
         data.pop("offset", None)
         return super().from_dict(data)
 
+    def to_dict(self) -> Dict:
+        """
+        Convert our object to a traditional dictionary, lazy sequences like
+        :meth:`~pydrag.archive.Archive.tracks` are materialized first.
+
+        :rtype: Dict
+        """
+        if isinstance(self.data, list):
+            return super().to_dict()
+
+        result = replace(self, data=list(self.data))
+        result.params = self.params
+        return result.to_dict()
+
 
 @dataclass
 class RawResponse(BaseModel):
@@ -142,7 +170,17 @@ class RawResponse(BaseModel):
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data)
+        return cls(copy.deepcopy(data))
+
+
+@lru_cache(maxsize=16)
+def auth_token(username: Optional[str], password: Optional[str]) -> Optional[str]:
+    return md5(str(username) + str(password))
+
+
+@lru_cache(maxsize=16)
+def signing_secret(api_secret: Optional[str]) -> bytes:
+    return str(api_secret).encode("utf-8")
 
 
 @dataclass
@@ -155,6 +193,22 @@ class Config:
     :param username: The user' name you want to authenticate
     :param password: The user's password you want to authenticate
     :param session: The already authenticated user's session key
+
+    Assign a :class:`~pydrag.stores.Store` to ``Config.session_store`` to
+    persist authenticated sessions between processes and register request
+    lifecycle callbacks to ``Config.hooks``. Assign a
+    :class:`~pydrag.cache.Cache` to ``Config.cache`` to serve the slow
+    changing chart and geo resources without waiting for last.fm and to
+    remember the not found lookups, stale entries are revalidated with
+    conditional requests when last.fm provides validators. The
+    ``Config.headers`` are sent with every request and ``Config.timeout``
+    holds the default connect and read timeouts in seconds. Assign a
+    :class:`~pydrag.breaker.CircuitBreaker` to ``Config.breaker`` to fail
+    fast while last.fm is degraded and a
+    :class:`~pydrag.hedging.HedgingPolicy` to ``Config.hedging`` to cut the
+    tail latency of the read requests. Enable
+    ``Config.dotenv`` to load the environmental variables from a ``.env``
+    file.
     """
 
     api_key: str
@@ -165,6 +219,14 @@ class Config:
 
     api_url: ClassVar[str] = "https://ws.audioscrobbler.com/2.0/"
     auth_url: ClassVar[str] = "https://www.last.fm/api/auth?token={}&api_key={}"
+    session_store: ClassVar[Optional[Store]] = None
+    hooks: ClassVar[Hooks] = Hooks()
+    dotenv: ClassVar[bool] = False
+    cache: ClassVar[Optional[Cache]] = None
+    headers: ClassVar[Dict[str, str]] = {"Accept-Encoding": "gzip, deflate"}
+    timeout: ClassVar[Timeout] = (10.0, 30.0)
+    breaker: ClassVar[Optional[CircuitBreaker]] = None
+    hedging: ClassVar[Optional[HedgingPolicy]] = None
     _instance: ClassVar[Optional["Config"]] = None
 
     def __post_init__(self):
@@ -173,7 +235,12 @@ class Config:
 
     @property
     def auth_token(self):
-        return md5(str(self.username) + str(self.password))
+        return auth_token(self.username, self.password)
+
+    @property
+    def signing_secret(self) -> bytes:
+        """The encoded api secret appended to the request signatures."""
+        return signing_secret(self.api_secret)
 
     @staticmethod
     def instance(
@@ -184,7 +251,8 @@ class Config:
         session: Optional[str] = None,
     ):
         """Get/Create a config instance, if no api key is specified it attempt
-        to read the settings from environmental variables."""
+        to read the settings from environmental variables and optionally the
+        ``.env`` file."""
 
         keys = [f.name for f in fields(Config)]
         if Config._instance is None or api_key:
@@ -192,6 +260,9 @@ class Config:
                 values = locals()
                 params = {k: values[k] for k in keys}
             else:
+                if Config.dotenv:
+                    load_dotenv()
+
                 params = {
                     k: os.getenv(
                         f"LASTFM_{k.upper()}",
@@ -239,11 +310,13 @@ class Wiki(BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         if "links" in data:
-            if isinstance(data["links"]["link"], dict):
-                data["links"]["link"] = [data["links"]["link"]]
+            links = data["links"]["link"]
+            if isinstance(links, dict):
+                links = [links]
 
-            data["links"] = list(map(Link.from_dict, data["links"]["link"]))
+            data["links"] = list(map(Link.from_dict, links))
         return super().from_dict(data)
 
 
@@ -266,6 +339,7 @@ class ScrobbleTrack(BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         data.update(
             {
                 k: data[k]["text"] if data.get(k, {}).get("text", "") != "" else None
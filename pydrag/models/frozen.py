@@ -0,0 +1,122 @@
+from abc import ABC
+from abc import abstractmethod
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from pydrag.utils import normalize
+
+
+@dataclass(frozen=True, eq=False)  # type: ignore
+class FrozenModel(ABC):
+    """
+    Immutable and hashable model identity, two instances are equal if they
+    have the same type and key. The key and the hash are computed once on
+    construction, the hash is computed again when unpickled because string
+    hashes are randomized per process.
+    """
+
+    key: Tuple = field(init=False, repr=False)
+    hash: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "key", self.identity())
+        self.rehash()
+
+    @abstractmethod
+    def identity(self) -> Tuple:
+        """Return the identity key of the model."""
+
+    def rehash(self):
+        object.__setattr__(self, "hash", hash((type(self), self.key)))
+
+    def __getstate__(self) -> Dict:
+        state = dict(self.__dict__)
+        state.pop("hash", None)
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self.rehash()
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.key == other.key
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenArtist(FrozenModel):
+    """
+    Frozen :class:`~pydrag.models.artist.Artist`, identified by the
+    musicbrainz id or the normalized name.
+
+    :param name: Artist name
+    :param mbid: Musicbrainz ID
+    :param url: Last.fm profile url
+    """
+
+    name: str = ""
+    mbid: Optional[str] = None
+    url: Optional[str] = None
+
+    def identity(self) -> Tuple:
+        if self.mbid:
+            return ("mbid", self.mbid)
+        return ("name", normalize(self.name))
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenAlbum(FrozenModel):
+    """
+    Frozen :class:`~pydrag.models.album.Album`, identified by the
+    musicbrainz id or the normalized artist and album names.
+
+    :param name: Album name
+    :param artist: Album artist
+    :param mbid: Musicbrainz ID
+    :param url: Last.fm profile url
+    """
+
+    name: str = ""
+    artist: Optional[FrozenArtist] = None
+    mbid: Optional[str] = None
+    url: Optional[str] = None
+
+    def identity(self) -> Tuple:
+        if self.mbid:
+            return ("mbid", self.mbid)
+        artist = normalize(self.artist.name) if self.artist else None
+        return ("name", artist, normalize(self.name))
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenTrack(FrozenModel):
+    """
+    Frozen :class:`~pydrag.models.track.Track`, identified by the
+    musicbrainz id or the normalized artist and track names.
+
+    :param name: Track name
+    :param artist: Track artist
+    :param album: Track album
+    :param mbid: Musicbrainz ID
+    :param url: Last.fm profile url
+    """
+
+    name: str = ""
+    artist: Optional[FrozenArtist] = None
+    album: Optional[FrozenAlbum] = None
+    mbid: Optional[str] = None
+    url: Optional[str] = None
+
+    def identity(self) -> Tuple:
+        if self.mbid:
+            return ("mbid", self.mbid)
+        artist = normalize(self.artist.name) if self.artist else None
+        return ("name", artist, normalize(self.name))
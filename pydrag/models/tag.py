@@ -34,6 +34,7 @@ class Tag(BaseModel, ApiMixin):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         if "wiki" in data:
             data["wiki"] = Wiki.from_dict(data["wiki"])
         return super().from_dict(data)
@@ -84,6 +85,7 @@ class Tag(BaseModel, ApiMixin):
             bind=Tag,
             flatten="tag",
             params={"method": "chart.getTopTags", "limit": limit, "page": page},
+            cache=True,
         )
 
     def get_similar(self) -> ListModel["Tag"]:
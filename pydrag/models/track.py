@@ -4,6 +4,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
+from pydrag.cache import NEGATIVE
 from pydrag.models.album import Album
 from pydrag.models.artist import Artist
 from pydrag.models.common import BaseModel
@@ -12,6 +13,7 @@ from pydrag.models.common import ListModel
 from pydrag.models.common import RawResponse
 from pydrag.models.common import ScrobbleTrack
 from pydrag.models.common import Wiki
+from pydrag.models.frozen import FrozenTrack
 from pydrag.models.tag import Tag
 from pydrag.services import ApiMixin
 
@@ -71,9 +73,10 @@ class Track(ApiMixin, BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         try:
             correction = data.pop("correction")
-            data = correction.pop("track")
+            data = dict(correction["track"])
         except KeyError:
             pass
 
@@ -97,11 +100,25 @@ class Track(ApiMixin, BaseModel):
         if "date" in data:
             date = data.pop("date")
             if isinstance(date, dict) and "timestamp" not in data:
-                date.pop("text")
-                data.update(date)
+                data.update({k: v for k, v in date.items() if k != "text"})
 
         return super().from_dict(data)
 
+    def freeze(self) -> FrozenTrack:
+        """
+        Return the immutable and hashable variant of the track, usable in
+        sets and as dictionary key.
+
+        :rtype: :class:`~pydrag.models.frozen.FrozenTrack`
+        """
+        return FrozenTrack(
+            name=self.name,
+            artist=self.artist.freeze(),
+            album=self.album.freeze() if self.album else None,
+            mbid=self.mbid,
+            url=self.url,
+        )
+
     @classmethod
     def find(
         cls, artist: str, track: str, user: str = None, lang: str = "en"
@@ -127,6 +144,7 @@ class Track(ApiMixin, BaseModel):
                 "username": user,
                 "lang": lang,
             },
+            cache=NEGATIVE,
         )
 
     @classmethod
@@ -149,6 +167,7 @@ class Track(ApiMixin, BaseModel):
                 "username": user,
                 "lang": lang,
             },
+            cache=NEGATIVE,
         )
 
     def get_info(self, user: str = None, lang: str = "en") -> "Track":
@@ -222,6 +241,7 @@ class Track(ApiMixin, BaseModel):
                 "limit": limit,
                 "page": page,
             },
+            cache=True,
         )
 
     @classmethod
@@ -238,20 +258,23 @@ class Track(ApiMixin, BaseModel):
             bind=Track,
             flatten="track",
             params={"method": "chart.getTopTracks", "limit": limit, "page": page},
+            cache=True,
         )
 
-    def add_tags(self, tags: List[str]) -> RawResponse:
+    def add_tags(self, tags: List[str], user: Optional[str] = None) -> RawResponse:
         """
         Tag an track with one or more user supplied tags.
 
         :param tags: A list of user supplied tags to apply to this track. Accepts a
             maximum of 10 tags.
         :type tags: :class:`list` of :class:`str`
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={
                 "method": "track.addTags",
                 "track": self.name,
@@ -259,16 +282,18 @@ class Track(ApiMixin, BaseModel):
             },
         )
 
-    def remove_tag(self, tag: str) -> RawResponse:
+    def remove_tag(self, tag: str, user: Optional[str] = None) -> RawResponse:
         """
         Remove a user's tag from an track.
 
         :param tag: A single user tag to remove from this track.
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={"method": "track.removeTag", "track": self.name, "tag": tag},
         )
 
@@ -333,15 +358,17 @@ class Track(ApiMixin, BaseModel):
             },
         )
 
-    def love(self) -> RawResponse:
+    def love(self, user: Optional[str] = None) -> RawResponse:
         """
         Love a track for a user profile.
 
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={
                 "method": "track.love",
                 "artist": self.artist.name,
@@ -349,15 +376,17 @@ class Track(ApiMixin, BaseModel):
             },
         )
 
-    def unlove(self) -> RawResponse:
+    def unlove(self, user: Optional[str] = None) -> RawResponse:
         """
         Unlove a track for a user profile.
 
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
         return self.submit(
             bind=RawResponse,
             stateful=True,
+            user=user,
             params={
                 "method": "track.unlove",
                 "artist": self.artist.name,
@@ -367,15 +396,20 @@ class Track(ApiMixin, BaseModel):
 
     @classmethod
     def scrobble_tracks(
-        cls, tracks: List[ScrobbleTrack], batch_size=10
+        cls,
+        tracks: List[ScrobbleTrack],
+        batch_size: int = 10,
+        user: Optional[str] = None,
     ) -> ListModel[ScrobbleTrack]:
         """
         Split tracks into the desired batch size, with maximum size set to 50
         and send the tracks for processing, I am debating if this even belongs
-        here.
+        here. The batches share the current
+        :func:`~pydrag.deadlines.deadline`, if any.
 
         :param tracks: The tracks to scrobble
         :param batch_size: The number of tracks to submit per cycle
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`pydrag.models.common.ListModel` of
             :class:`~pydrag.models.common.ScrobbleTrack`
         """
@@ -387,7 +421,7 @@ class Track(ApiMixin, BaseModel):
         data: List[ScrobbleTrack] = []
         params = []
         for batch in list(divide_chunks(tracks, min(batch_size, 50))):
-            res = Track._scrobble(batch)
+            res = Track._scrobble(batch, user)
             data += res.data
             params.append(res.params)
 
@@ -396,10 +430,13 @@ class Track(ApiMixin, BaseModel):
         return result
 
     @classmethod
-    def _scrobble(cls, tracks: List[ScrobbleTrack]) -> ListModel[ScrobbleTrack]:
+    def _scrobble(
+        cls, tracks: List[ScrobbleTrack], user: Optional[str] = None
+    ) -> ListModel[ScrobbleTrack]:
         """
         :param tracks: A list fo tracks to scrobble
         :type tracks: :class:`list` of :class:`~pydrag.models.common.ScrobbleTrack`
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`pydrag.models.common.ListModel` of
             :class:`~pydrag.models.common.ScrobbleTrack`
         """
@@ -415,6 +452,7 @@ class Track(ApiMixin, BaseModel):
             bind=ScrobbleTrack,
             flatten="scrobble",
             stateful=True,
+            user=user,
             params=params,
         )
 
@@ -428,6 +466,7 @@ class Track(ApiMixin, BaseModel):
         context: str = None,
         duration: int = None,
         album_artist: str = None,
+        user: Optional[str] = None,
     ) -> ScrobbleTrack:
         """
         :param artist: The artist name
@@ -437,12 +476,14 @@ class Track(ApiMixin, BaseModel):
         :param context: Sub-client version (not public)
         :param duration: The length of the track in seconds
         :param album_artist: The album artist
+        :param user: The session owner, defaults to the configuration user
         :rtype: :class:`~models.common.RawResponse`
         """
 
         return cls.submit(
             bind=ScrobbleTrack,
             stateful=True,
+            user=user,
             params={
                 "method": "track.updateNowPlaying",
                 "artist": artist,
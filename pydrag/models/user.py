@@ -1,10 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
+from pydrag.cache import NEGATIVE
 from pydrag.constants import Period
 from pydrag.models.album import Album
 from pydrag.models.artist import Artist
@@ -15,6 +20,7 @@ from pydrag.models.common import ListModel
 from pydrag.models.tag import Tag
 from pydrag.models.track import Track
 from pydrag.services import ApiMixin
+from pydrag.utils import map_concurrently
 
 
 @dataclass
@@ -57,6 +63,7 @@ class User(BaseModel, ApiMixin):
 
     @classmethod
     def from_dict(cls, data: Dict):
+        data = dict(data)
         data.update(
             {
                 "registered": data["registered"]["timestamp"],
@@ -68,23 +75,71 @@ class User(BaseModel, ApiMixin):
         return super().from_dict(data)
 
     @classmethod
-    def find(cls, username: str) -> "User":
+    def find(cls, username: str, cache: Union[bool, str] = NEGATIVE) -> "User":
         """
         Get information about a user profile.
 
+        :param username: The user name
+        :param cache: Serve the profile through the configuration cache,
+            only the not found errors are cached by default
         :rtype: :class:`~pydrag.models.user.User`
         """
         return cls.retrieve(
-            bind=User, params={"method": "user.getInfo", "user": username}
+            bind=User,
+            params={"method": "user.getInfo", "user": username},
+            cache=cache,
+        )
+
+    @classmethod
+    def find_many(
+        cls,
+        usernames: Iterable[str],
+        workers: int = 8,
+        cache: Union[bool, str] = NEGATIVE,
+    ) -> Tuple[Dict[str, "User"], Dict[str, Exception]]:
+        """
+        Get information about many user profiles concurrently.
+
+        The usernames are case insensitive and every profile is retrieved
+        only once, failed lookups like missing users are reported without
+        aborting the batch.
+
+        :param usernames: The user names
+        :param int workers: The maximum number of concurrent requests
+        :param cache: Serve the profiles through the configuration cache,
+            pass ``True`` to also cache the found profiles
+        :returns: The users and the errors keyed by the given user names
+        :rtype: Tuple[Dict[str, :class:`~pydrag.models.user.User`], Dict[str, Exception]]
+        """
+        usernames = list(usernames)
+        unique: Dict[str, str] = {}
+        for username in usernames:
+            unique.setdefault(username.casefold(), username)
+
+        results, errors = map_concurrently(
+            partial(cls.find, cache=cache), unique.values(), workers
         )
 
-    def get_artists(self, limit: int = 50, page: int = 1) -> ListModel[Artist]:
+        users: Dict[str, User] = {}
+        failures: Dict[str, Exception] = {}
+        for username in usernames:
+            key = unique[username.casefold()]
+            if key in results:
+                users[username] = results[key]
+            else:
+                failures[username] = errors[key]
+        return users, failures
+
+    def get_artists(
+        self, limit: int = 50, page: int = 1, fields: Optional[Sequence[str]] = None
+    ) -> ListModel[Artist]:
         """
         Retrieve a paginated list of all the artists in the user's library,
         with playcounts and tagcounts.
 
         :param page: The page number to fetch.
         :param limit: The number of results to fetch per page.
+        :param fields: The field paths to bind, eg ``["name", "playcount"]``
         :rtype: :class:`~models.common.ListModel` of
             :class:`~pydrag.models.artist.Artist`
         """
@@ -97,6 +152,7 @@ class User(BaseModel, ApiMixin):
                 "page": page,
                 "limit": limit,
             },
+            fields=fields,
         )
 
     def get_artist_tracks(
@@ -105,6 +161,7 @@ class User(BaseModel, ApiMixin):
         from_date: str = None,
         to_date: str = None,
         page: int = 1,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Track]:
         """
         Get a list of tracks by a given artist scrobbled by this user,
@@ -115,6 +172,7 @@ class User(BaseModel, ApiMixin):
         :param from_date: An unix timestamp to start at.
         :param to_date: An unix timestamp to end at.
         :param page: The page number to fetch.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
         """
         return self.retrieve(
@@ -128,10 +186,15 @@ class User(BaseModel, ApiMixin):
                 "endTimestamp": to_date,
                 "page": page,
             },
+            fields=fields,
         )
 
     def get_friends(
-        self, recent_tracks: bool, limit: int = 50, page: int = 1
+        self,
+        recent_tracks: bool,
+        limit: int = 50,
+        page: int = 1,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel["User"]:
         """
         Get a list of the user's friends on Last.fm.
@@ -140,6 +203,7 @@ class User(BaseModel, ApiMixin):
          friends' recent listening in the response.
         :param page: The page number to fetch.
         :param limit: The number of results to fetch per page.
+        :param fields: The field paths to bind, eg ``["name", "recent_track.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.user.User`
         """
         return self.retrieve(
@@ -152,14 +216,18 @@ class User(BaseModel, ApiMixin):
                 "page": page,
                 "limit": limit,
             },
+            fields=fields,
         )
 
-    def get_loved_tracks(self, limit: int = 50, page: int = 1) -> ListModel[Track]:
+    def get_loved_tracks(
+        self, limit: int = 50, page: int = 1, fields: Optional[Sequence[str]] = None
+    ) -> ListModel[Track]:
         """
         Get the user's loved tracks list.
 
         :param page: The page number to fetch.
         :param limit: The number of results to fetch per page.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
         """
         return self.retrieve(
@@ -171,6 +239,7 @@ class User(BaseModel, ApiMixin):
                 "limit": limit,
                 "page": page,
             },
+            fields=fields,
         )
 
     def get_personal_tags(
@@ -212,6 +281,7 @@ class User(BaseModel, ApiMixin):
         to_date: str = None,
         limit: int = 50,
         page: int = 1,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Track]:
         """
         Get a list of the recent tracks listened to by this user. Also includes
@@ -226,6 +296,7 @@ class User(BaseModel, ApiMixin):
             January 1st 1970 UTC). This must be in the UTC time zone.
         :param limit: The number of results to fetch per page.
         :param page: The page number to fetch.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
         """
         return self.retrieve(
@@ -240,10 +311,15 @@ class User(BaseModel, ApiMixin):
                 "extended": True,
                 "to": to_date,
             },
+            fields=fields,
         )
 
     def get_top_albums(
-        self, period: Period, limit: int = 50, page: int = 1
+        self,
+        period: Period,
+        limit: int = 50,
+        page: int = 1,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Album]:
         """
         Get the top albums listened to by a user. You can stipulate a time
@@ -252,6 +328,7 @@ class User(BaseModel, ApiMixin):
         :param Period period:
         :param limit: The number of results to fetch per page.
         :param page: The page number to fetch.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~pydrag.models.common.ListModel` of
             :class:`~pydrag.models.album.Album`
         :rtype: List[Album]
@@ -269,10 +346,15 @@ class User(BaseModel, ApiMixin):
                 "page": page,
                 "period": period.value,
             },
+            fields=fields,
         )
 
     def get_top_artists(
-        self, period: Period, limit: int = 50, page: int = 1
+        self,
+        period: Period,
+        limit: int = 50,
+        page: int = 1,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Artist]:
         """
         Get the top artists listened to by a user. You can stipulate a time
@@ -281,6 +363,7 @@ class User(BaseModel, ApiMixin):
         :param Period period:
         :param limit: The number of results to fetch per page.
         :param page: The page number to fetch.
+        :param fields: The field paths to bind, eg ``["name", "playcount"]``
         :rtype: :class:`~models.common.ListModel` of
             :class:`~pydrag.models.artist.Artist`
         """
@@ -297,6 +380,7 @@ class User(BaseModel, ApiMixin):
                 "page": page,
                 "period": period.value,
             },
+            fields=fields,
         )
 
     def get_top_tags(self, limit: int = 50) -> ListModel[Tag]:
@@ -315,7 +399,11 @@ class User(BaseModel, ApiMixin):
         )
 
     def get_top_tracks(
-        self, period: Period, limit: int = 50, page: int = 1
+        self,
+        period: Period,
+        limit: int = 50,
+        page: int = 1,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Track]:
         """
         Get the top tracks listened to by a user. You can stipulate a time
@@ -324,6 +412,7 @@ class User(BaseModel, ApiMixin):
         :param Period period:
         :param limit: The number of results to fetch per page.
         :param page: The page number to fetch.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
         """
 
@@ -340,14 +429,19 @@ class User(BaseModel, ApiMixin):
                 "page": page,
                 "period": period.value,
             },
+            fields=fields,
         )
 
     def get_weekly_album_chart(
-        self, from_date: str = None, to_date: str = None
+        self,
+        from_date: str = None,
+        to_date: str = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Album]:
         """
         :param from_date:  The date at which the chart should start from.
         :param to_date: The date at which the chart should end on.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.album.Album`
         """
         return self.retrieve(
@@ -359,10 +453,14 @@ class User(BaseModel, ApiMixin):
                 "from": from_date,
                 "to": to_date,
             },
+            fields=fields,
         )
 
     def get_weekly_artist_chart(
-        self, from_date: str = None, to_date: str = None
+        self,
+        from_date: str = None,
+        to_date: str = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Artist]:
         """
         Get an album chart for a user profile, for a given date range. If no
@@ -371,6 +469,7 @@ class User(BaseModel, ApiMixin):
 
         :param from_date:  The date at which the chart should start from.
         :param to_date: The date at which the chart should end on.
+        :param fields: The field paths to bind, eg ``["name", "mbid"]``
         :rtype: :class:`~models.common.ListModel` of
             :class:`~pydrag.models.artist.Artist`
         """
@@ -383,6 +482,7 @@ class User(BaseModel, ApiMixin):
                 "from": from_date,
                 "to": to_date,
             },
+            fields=fields,
         )
 
     def get_weekly_chart_list(self) -> ListModel[Chart]:
@@ -401,7 +501,10 @@ class User(BaseModel, ApiMixin):
         )
 
     def get_weekly_track_chart(
-        self, from_date: str = None, to_date: str = None
+        self,
+        from_date: str = None,
+        to_date: str = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> ListModel[Track]:
         """
         Get a list of available charts for this user, expressed as date ranges
@@ -409,6 +512,7 @@ class User(BaseModel, ApiMixin):
 
         :param from_date:  The date at which the chart should start from.
         :param to_date: The date at which the chart should end on.
+        :param fields: The field paths to bind, eg ``["name", "artist.name"]``
         :rtype: :class:`~models.common.ListModel` of :class:`~pydrag.models.track.Track`
         """
         return self.retrieve(
@@ -420,4 +524,5 @@ class User(BaseModel, ApiMixin):
                 "from": from_date,
                 "to": to_date,
             },
+            fields=fields,
         )
@@ -1,31 +1,75 @@
+import dataclasses
+import hashlib
+import threading
+import time
+from contextlib import ExitStack
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import ContextManager
 from typing import Dict
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
+from typing import Union
 
-from requests import request
-
-from pydrag import utils
+from pydrag import deadlines
+from pydrag.cache import NEGATIVE
+from pydrag.deadlines import Timeout
 from pydrag.exceptions import ApiError
+from pydrag.exceptions import DeadlineExceeded
+from pydrag.hooks import ON_ERROR
+from pydrag.hooks import POST_BIND
+from pydrag.hooks import POST_PARSE
+from pydrag.hooks import POST_RESPONSE
+from pydrag.hooks import PRE_REQUEST
 from pydrag.models.common import BaseModel
 from pydrag.models.common import Config
 from pydrag.models.common import ListModel
 from pydrag.utils import get_nested
 
+session_lock = threading.Lock()
+
 
 class ApiMixin:
     @classmethod
-    def get_session(cls) -> "AuthSession":  # type: ignore
+    def get_session(cls, user: Optional[str] = None) -> "AuthSession":  # type: ignore
         """
-        Return the session from configuration or attempt to authenticate the
-        configuration user.
+        Return the session from configuration, the session store or attempt
+        to authenticate the configuration user.
 
+        The lookup is guarded by a lock so that concurrent stateful calls
+        share a single authentication request. Sessions of other users
+        must be saved beforehand, see
+        :meth:`~pydrag.models.auth.AuthSession.save`.
+
+        :param str user: The session owner, defaults to the configuration user
         :rtype: :class:`~pydrag.models.auth.AuthSession`
+        :raise: ValueError if there is no saved session for the given user
         """
         cfg = Config.instance()
-        if not cfg.session:
+        if user and user != cfg.username:
             from pydrag.models.auth import AuthSession
 
-            cfg.session = AuthSession.authenticate()
+            session = AuthSession.load(user)
+            if session is None:
+                raise ValueError(f"No session registered for user: {user}")
+            return session
+
+        if cfg.session:
+            return cfg.session
+
+        with session_lock:
+            if not cfg.session:
+                from pydrag.models.auth import AuthSession
+
+                session = AuthSession.load(cfg.username)
+                if session is None:
+                    session = AuthSession.authenticate()
+                    session.save()
+
+                cfg.session = session
         return cfg.session
 
     @classmethod
@@ -34,6 +78,9 @@ class ApiMixin:
         bind: Type[BaseModel],
         flatten: Optional[str] = None,
         params: Optional[Dict] = None,
+        cache: Union[bool, str] = False,
+        fields: Optional[Sequence[str]] = None,
+        timeout: Timeout = None,
     ):
         """
         Perform an api retrieve/get resource action.
@@ -42,6 +89,10 @@ class ApiMixin:
         :type bind: :class:`~pydrag.models.common.BaseModel`
         :param str flatten: A dot separated string used to flatten nested list of values
         :param Dict params: A dictionary of query string params
+        :param cache: Serve the response through the configuration cache,
+            ``"negative"`` only caches the not found errors
+        :param fields: Dot separated field paths to bind, the rest are dropped
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
         return cls._perform(
@@ -52,6 +103,9 @@ class ApiMixin:
             sign=False,
             stateful=False,
             authenticate=False,
+            cache=cache,
+            fields=fields,
+            timeout=timeout,
         )
 
     @classmethod
@@ -63,6 +117,8 @@ class ApiMixin:
         sign: bool = False,
         stateful: bool = False,
         authenticate: bool = False,
+        user: Optional[str] = None,
+        timeout: Timeout = None,
     ):
         """
         Perform an api write/update resource action.
@@ -74,6 +130,8 @@ class ApiMixin:
         :param bool sign: Sign the request with the api secret
         :param bool stateful: Requires a session
         :param bool authenticate: Perform an authentication request
+        :param str user: The session owner for stateful requests
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
         return cls._perform(
@@ -84,7 +142,59 @@ class ApiMixin:
             sign=sign,
             stateful=stateful,
             authenticate=authenticate,
+            user=user,
+            timeout=timeout,
+        )
+
+    @classmethod
+    def call(
+        cls,
+        params: Dict,
+        method: str = "GET",
+        decode: bool = True,
+        sign: bool = False,
+        stateful: bool = False,
+        authenticate: bool = False,
+        user: Optional[str] = None,
+        timeout: Timeout = None,
+    ) -> Union[Dict, bytes]:
+        """
+        Perform a low level api call without model binding, for pipelines
+        that forward the responses to storage.
+
+        The decoded body has the same normalized keys the models are
+        constructed from, the undecoded body is returned as received after
+        decompression and the api errors in it are not raised. The calls go
+        through the configuration circuit breaker and hedging policy, like
+        the model requests.
+
+        :param Dict params: A dictionary of body or query string params
+        :param str method: Http method POST/GET
+        :param bool decode: Decode the json body and raise the api errors
+        :param bool sign: Sign the request with the api secret
+        :param bool stateful: Requires a session
+        :param bool authenticate: Perform an authentication request
+        :param str user: The session owner for stateful requests
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
+        :rtype: Union[Dict, bytes]
+        :raise: :class:`~pydrag.exceptions.ApiError`
+        """
+        send = partial(
+            cls._send, method, params, sign, stateful, authenticate, user, None, timeout
         )
+        try:
+            with cls._guard(params):
+                response = cls._hedge(method, params, send)
+                if decode:
+                    return cls._parse(response, params)
+
+                response.raise_for_status()
+                return response.content
+        except Exception as e:
+            Config.hooks.emit(
+                ON_ERROR, method=params.get("method"), params=params, error=e
+            )
+            raise
 
     @classmethod
     def _perform(
@@ -96,9 +206,14 @@ class ApiMixin:
         sign: bool,
         stateful: bool,
         authenticate: bool,
+        user: Optional[str] = None,
+        cache: Union[bool, str] = False,
+        fields: Optional[Sequence[str]] = None,
+        timeout: Timeout = None,
     ):
         """
-        Orchestrate the request, error handling and response deserialization.
+        Orchestrate the request, caching, error handling and response
+        deserialization.
 
         :param str method: Http method POST/GET
         :param bind: Class type to construct from the api response.
@@ -108,27 +223,310 @@ class ApiMixin:
         :param bool sign: Sign the request with the api secret
         :param bool stateful: Requires a session
         :param bool authenticate: Perform an authentication request
+        :param str user: The session owner for stateful requests
+        :param cache: Serve the response through the configuration cache,
+            ``"negative"`` only caches the not found errors
+        :param fields: Dot separated field paths to bind, the rest are dropped
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
+        hooks = Config.hooks
+        name = params.get("method")
+        try:
+            if cache and Config.cache is not None:
+                key = cls.cache_key(params)
+
+                def load():
+                    with cls._guard(params):
+                        return cls._revalidate(
+                            key,
+                            method,
+                            params,
+                            sign,
+                            stateful,
+                            authenticate,
+                            user,
+                            timeout,
+                        )
+
+                positive = cache != NEGATIVE
+                body = Config.cache.fetch(key, load, positive)["body"]
+            else:
+                with cls._guard(params):
+                    body = cls._request(
+                        method, params, sign, stateful, authenticate, user, timeout
+                    )
+
+            start = time.perf_counter()
+            obj = cls.bind_data(bind, body, flatten, fields)
+            obj.params = params
+            hooks.emit(
+                POST_BIND,
+                method=name,
+                params=params,
+                result=obj,
+                duration=time.perf_counter() - start,
+            )
+        except Exception as e:
+            hooks.emit(ON_ERROR, method=name, params=params, error=e)
+            raise
+
+        return obj
+
+    @staticmethod
+    def _guard(params: Dict) -> ContextManager:
+        """
+        Return the configuration circuit breaker guard for the given request
+        or a no-op context manager.
+
+        :param Dict params: A dictionary of body or query string params
+        :raise: :class:`~pydrag.exceptions.CircuitOpenError`
+        """
+        if Config.breaker is None:
+            return ExitStack()
+        return Config.breaker.guard(params.get("method"), params)
+
+    @classmethod
+    def _request(
+        cls,
+        method: str,
+        params: Dict,
+        sign: bool,
+        stateful: bool,
+        authenticate: bool,
+        user: Optional[str] = None,
+        timeout: Timeout = None,
+    ) -> Dict:
+        """
+        Send the web request and return the decoded response body.
+
+        :param str method: Http method POST/GET
+        :param Dict params: A dictionary of body or query string params
+        :param bool sign: Sign the request with the api secret
+        :param bool stateful: Requires a session
+        :param bool authenticate: Perform an authentication request
+        :param str user: The session owner for stateful requests
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
+        :rtype: Dict
+        :raise: :class:`~pydrag.exceptions.ApiError`
+        """
+        response = cls._hedge(
+            method,
+            params,
+            partial(
+                cls._send,
+                method,
+                params,
+                sign,
+                stateful,
+                authenticate,
+                user,
+                timeout=timeout,
+            ),
+        )
+        return cls._parse(response, params)
+
+    @classmethod
+    def _revalidate(
+        cls,
+        key: Tuple,
+        method: str,
+        params: Dict,
+        sign: bool,
+        stateful: bool,
+        authenticate: bool,
+        user: Optional[str] = None,
+        timeout: Timeout = None,
+    ) -> Dict:
+        """
+        Cache loader, send a conditional request with the validators of the
+        stale cache entry if the server provided any. Not modified responses
+        reuse the cached body.
+
+        :param Tuple key: The cache key
+        :param str method: Http method POST/GET
+        :param Dict params: A dictionary of body or query string params
+        :param bool sign: Sign the request with the api secret
+        :param bool stateful: Requires a session
+        :param bool authenticate: Perform an authentication request
+        :param str user: The session owner for stateful requests
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
+        :returns: The response body and the validators
+        :rtype: Dict
+        :raise: :class:`~pydrag.exceptions.ApiError`
+        """
+        entry = Config.cache.get(key) if Config.cache is not None else None
+        previous = entry.value if entry is not None and not entry.error else {}
+
+        headers = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        response = cls._hedge(
+            method,
+            params,
+            partial(
+                cls._send,
+                method,
+                params,
+                sign,
+                stateful,
+                authenticate,
+                user,
+                headers,
+                timeout,
+            ),
+        )
+        if response.status_code == 304 and previous:
+            return previous
+
+        return {
+            "body": cls._parse(response, params),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    @staticmethod
+    def _hedge(method: str, params: Dict, send: Callable):
+        """
+        Send the request through the configuration hedging policy, only the
+        GET requests are hedged.
+
+        :param str method: Http method POST/GET
+        :param Dict params: A dictionary of body or query string params
+        :param send: Callable that sends the request
+        :rtype: :class:`requests.Response`
+        """
+        if Config.hedging is None or method != "GET":
+            return send()
+        return Config.hedging.run(params.get("method", ""), send)
+
+    @classmethod
+    def _send(
+        cls,
+        method: str,
+        params: Dict,
+        sign: bool,
+        stateful: bool,
+        authenticate: bool,
+        user: Optional[str] = None,
+        headers: Optional[Dict] = None,
+        timeout: Timeout = None,
+    ):
+        """
+        Send the web request with the configuration headers, compression is
+        negotiated explicitly with the ``Accept-Encoding`` header.
+
+        The connect and read timeouts are capped to the time left until the
+        current :func:`~pydrag.deadlines.deadline`, requests that time out
+        or complete after the deadline raise
+        :class:`~pydrag.exceptions.DeadlineExceeded`. The read timeout
+        applies to every socket read, a slowly trickling response can still
+        run past the deadline.
+
+        :param str method: Http method POST/GET
+        :param Dict params: A dictionary of body or query string params
+        :param bool sign: Sign the request with the api secret
+        :param bool stateful: Requires a session
+        :param bool authenticate: Perform an authentication request
+        :param str user: The session owner for stateful requests
+        :param Dict headers: Extra request headers
+        :param timeout: Connect and read timeouts, defaults to ``Config.timeout``
+        :rtype: :class:`requests.Response`
+        :raise: :class:`~pydrag.exceptions.DeadlineExceeded`
+        """
+        from requests import request
+        from requests.exceptions import Timeout as RequestTimeout
+
         data: Dict = {}
         query: Dict = {}
         if method == "GET":
-            query = cls.prepare_params(params, sign, stateful, authenticate)
+            query = cls.prepare_params(params, sign, stateful, authenticate, user)
         else:
-            data = cls.prepare_params(params, sign, stateful, authenticate)
+            data = cls.prepare_params(params, sign, stateful, authenticate, user)
 
         cfg = Config.instance()
-        response = request(method=method, url=cfg.api_url, data=data, params=query)
+        hooks = Config.hooks
+        name = params.get("method")
+        limits = deadlines.request_timeout(
+            Config.timeout if timeout is None else timeout
+        )
+        hooks.emit(PRE_REQUEST, method=name, params=params)
+
+        start = time.perf_counter()
+        try:
+            response = request(
+                method=method,
+                url=cfg.api_url,
+                data=data,
+                params=query,
+                headers={**Config.headers, **(headers or {})},
+                timeout=limits,
+            )
+        except RequestTimeout as e:
+            if deadlines.expired():
+                raise DeadlineExceeded("Deadline exceeded") from e
+            raise
+        hooks.emit(
+            POST_RESPONSE,
+            method=name,
+            params=params,
+            response=response,
+            duration=time.perf_counter() - start,
+            elapsed=response.elapsed.total_seconds(),
+            size=len(response.content),
+            wire_size=wire_size(response),
+        )
+        if deadlines.expired():
+            raise DeadlineExceeded("Deadline exceeded")
+        return response
+
+    @classmethod
+    def _parse(cls, response, params: Dict) -> Dict:
+        """
+        Decode the response body and raise the http and api errors.
+
+        :param response: The web response
+        :type response: :class:`requests.Response`
+        :param Dict params: A dictionary of body or query string params
+        :rtype: Dict
+        :raise: :class:`~pydrag.exceptions.ApiError`
+        """
         response.raise_for_status()
+
+        start = time.perf_counter()
         body = response.json(object_pairs_hook=pythonic_variables)
+        Config.hooks.emit(
+            POST_PARSE,
+            method=params.get("method"),
+            params=params,
+            body=body,
+            duration=time.perf_counter() - start,
+        )
         cls.raise_for_error(body)
-        obj = cls.bind_data(bind, body, flatten)
-        obj.params = params
-        return obj
+        return body
+
+    @staticmethod
+    def cache_key(params: Dict) -> Tuple:
+        """
+        Generate a cache key from the request params, None values are
+        ignored.
+
+        :param Dict params: A dictionary of query string params
+        :rtype: Tuple
+        """
+        return tuple(sorted((k, str(v)) for k, v in params.items() if v is not None))
 
     @classmethod
     def prepare_params(
-        cls, params: Dict, sign: bool, stateful: bool, authenticate: bool
+        cls,
+        params: Dict,
+        sign: bool,
+        stateful: bool,
+        authenticate: bool,
+        user: Optional[str] = None,
     ) -> dict:
         """
         Perform common parameter tasks before sending the web request.
@@ -141,6 +539,7 @@ class ApiMixin:
         :param bool sign: Sign the request with the api secret
         :param bool stateful: Add the session key to the params
         :param bool authenticate: Add the username and auth token to the params
+        :param str user: The session owner for stateful requests
         :rtype: Dict
         """
         cfg = Config.instance()
@@ -155,10 +554,11 @@ class ApiMixin:
             params.update({"username": cfg.username, "authToken": cfg.auth_token})
 
         if stateful:
-            params.update({"sk": cls.get_session().key})
+            params.update({"sk": cls.get_session(user).key})
 
         if authenticate or stateful or sign:
-            params.update({"api_sig": cls.sign(params)})
+            params = dict(sorted(params.items()))
+            params["api_sig"] = cls.sign(params)
 
         return params
 
@@ -168,6 +568,7 @@ class ApiMixin:
         bind: Type[BaseModel],
         body: Optional[Dict],
         flatten: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ):
         """
         Construct a BaseModel from the response body and the flatten directive.
@@ -176,6 +577,7 @@ class ApiMixin:
         :type bind: :class:`~pydrag.models.common.BaseModel`
         :param Dict body: The api response
         :param str flatten: A dot separated string used to flatten nested list of values
+        :param fields: Dot separated field paths to bind, the rest are dropped
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
         if not body:
@@ -185,13 +587,17 @@ class ApiMixin:
         if data and not isinstance(data, Dict):
             data = body
 
+        tree = projection(fields) if fields else None
         if flatten is None:
-            return bind.from_dict(data)
+            return bind.from_dict(project(data, tree, bind) if tree else data)
 
         keys = flatten.split(".")
         items = get_nested(data, keys, ensure_list=True)
-        data.pop(next(iter(keys)))
-        data.update({"data": [bind.from_dict(i) for i in items]})
+        if tree:
+            items = [project(item, tree, bind) for item in items]
+
+        data = {k: v for k, v in data.items() if k != keys[0]}
+        data["data"] = [bind.from_dict(i) for i in items]
         return ListModel.from_dict(data)
 
     @staticmethod
@@ -211,15 +617,142 @@ class ApiMixin:
         Last.fm signing formula for webservice calls. Exclude format, sort
         params, append the api secret key and hash the params string.
 
+        The pairs are streamed to the hash instead of joining a large
+        string, params built in key order like in
+        :meth:`~pydrag.services.ApiMixin.prepare_params` sort in linear time.
+
         :param Dict params:
         :rtype: str
         """
-        keys = sorted(params.keys())
-        keys.remove("format")
+        digest = hashlib.md5()
+        for key in sorted(params):
+            value = params[key]
+            if value and key != "format":
+                digest.update(f"{key}{value}".encode("utf-8"))
+
+        digest.update(Config.instance().signing_secret)
+        return digest.hexdigest()
+
+
+def projection(fields: Sequence[str]) -> Dict:
+    """
+    Convert the dot separated field paths to a nested dictionary.
+
+    :param fields: The field paths, eg ``["name", "artist.name"]``
+    :rtype: Dict
+    """
+    tree: Dict = {}
+    for path in fields:
+        node = tree
+        for key in path.split("."):
+            node = node.setdefault(key, {})
+    return tree
+
+
+def project(data: Any, tree: Dict, bind: Optional[Type] = None) -> Any:
+    """
+    Drop the response keys that are not in the projection tree, before
+    binding. The keys of the required model fields and the ``attr``
+    metadata are always kept. Wrapper objects without any of the kept
+    keys, like ``{"track": [...]}`` in the album tracks, are descended
+    into with the same projection tree.
+
+    :param data: The response dictionary or a list of dictionaries
+    :param Dict tree: The projection tree, see :func:`projection`
+    :param bind: The model type the data will be bound to
+    :rtype: Any
+    """
+    if isinstance(data, list):
+        return [project(item, tree, bind) for item in data]
+    if not isinstance(data, dict) or not tree:
+        return data
+
+    types = {}
+    keep = set(tree) | {"attr"}
+    if isinstance(bind, type) and dataclasses.is_dataclass(bind):
+        for f in dataclasses.fields(bind):
+            types[f.name] = model_type(f.type)
+            required = (
+                f.default is dataclasses.MISSING
+                and f.default_factory is dataclasses.MISSING  # type: ignore
+            )
+            if f.init and required and f.name not in tree:
+                keep.add(f.name)
+
+    for key in list(keep):
+        keep.update(projection_aliases.get(key, ()))
+
+    wrapper = not (keep - {"attr"}) & data.keys() and all(
+        isinstance(value, (dict, list)) for value in data.values()
+    )
+    if wrapper:
+        return {
+            key: value if key == "attr" else project(value, tree, bind)
+            for key, value in data.items()
+        }
 
-        signature = [str(k) + str(params[k]) for k in keys if params.get(k)]
-        signature.append(str(Config.instance().api_secret))
-        return utils.md5("".join(signature))  # type: ignore
+    result = {}
+    for key, value in data.items():
+        if key in keep:
+            subtree = tree.get(key)
+            result[key] = project(value, subtree, types.get(key)) if subtree else value
+    return result
+
+
+def model_type(annotation: Any) -> Optional[Type]:
+    """
+    Return the model class of a field annotation, unwraps optional and list
+    annotations and resolves the forward references by the model name.
+
+    :param annotation: The field type annotation
+    """
+    annotation = getattr(annotation, "__forward_arg__", annotation)
+    if isinstance(annotation, str):
+        return model_classes(BaseModel).get(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    for arg in getattr(annotation, "__args__", None) or ():
+        result = model_type(arg)
+        if result is not None:
+            return result
+    return None
+
+
+def model_classes(base: Type) -> Dict[str, Type]:
+    result = {}
+    for cls in base.__subclasses__():
+        result.update(model_classes(cls))
+        result[cls.__name__] = cls
+    return result
+
+
+# The response keys that hold the values of the model fields
+projection_aliases = {
+    "name": ("text",),
+    "timestamp": ("date",),
+    "playcount": ("stats",),
+    "listeners": ("stats",),
+}
+
+
+def wire_size(response) -> int:
+    """
+    Return the number of bytes received before decompression, falls back
+    to the content length header and the decoded content size.
+
+    :param response: The web response
+    :type response: :class:`requests.Response`
+    :rtype: int
+    """
+    try:
+        size = response.raw.tell()
+    except Exception:
+        size = 0
+
+    if not size:
+        size = int(response.headers.get("Content-Length") or len(response.content))
+    return size
 
 
 def pythonic_variables(data):
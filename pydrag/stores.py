@@ -0,0 +1,109 @@
+import threading
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+
+class Store(ABC):
+    """
+    Pydrag key value store interface, used to persist state like sessions
+    between processes.
+
+    Values must be json compatible, primitives, lists and dictionaries.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the value for the given key or None if it doesn't exist.
+
+        :param str key: The storage key
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        """
+        Store the value for the given key.
+
+        :param str key: The storage key
+        :param value: The json compatible value
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        Remove the given key from the store, missing keys are ignored.
+
+        :param str key: The storage key
+        """
+
+    @abstractmethod
+    def keys(self) -> Iterator[str]:
+        """Iterate over all the stored keys."""
+
+
+class MemoryStore(Store):
+    """Thread safe in memory store, nothing survives the process."""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            return self.data.get(key)
+
+    def set(self, key: str, value: Any):
+        with self.lock:
+            self.data[key] = value
+
+    def delete(self, key: str):
+        with self.lock:
+            self.data.pop(key, None)
+
+    def keys(self) -> Iterator[str]:
+        with self.lock:
+            return iter(list(self.data.keys()))
+
+
+class ShelveStore(Store):
+    """
+    Thread safe persistent store backed by the standard library
+    :mod:`shelve` module.
+
+    :param str path: The database file path
+    """
+
+    def __init__(self, path: str):
+        import shelve
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.shelf = shelve.open(path)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            return self.shelf.get(key)
+
+    def set(self, key: str, value: Any):
+        with self.lock:
+            self.shelf[key] = value
+            self.shelf.sync()
+
+    def delete(self, key: str):
+        with self.lock:
+            if key in self.shelf:
+                del self.shelf[key]
+                self.shelf.sync()
+
+    def keys(self) -> Iterator[str]:
+        with self.lock:
+            return iter(list(self.shelf.keys()))
+
+    def close(self):
+        """Flush and close the underlying database."""
+        with self.lock:
+            self.shelf.close()
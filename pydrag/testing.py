@@ -0,0 +1,343 @@
+import argparse
+import glob
+import json
+import math
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qsl
+from urllib.parse import urlsplit
+
+Generator = Callable[[Dict[str, str]], Dict]
+
+ERROR_MESSAGES = {
+    6: "Invalid parameters",
+    11: "Service Offline - This service is temporarily offline. Try again later.",
+    16: "There was a temporary error processing your request. Please try again",
+    29: "Rate limit exceeded",
+}
+
+ERROR_STATUS = {11: 503, 16: 500, 29: 429}
+
+
+class Paginated:
+    """
+    Synthetic paginated list generator, shaped like the last.fm list
+    responses.
+
+    :param root: The response root key, eg ``recenttracks``
+    :param key: The items key, eg ``track``
+    :param total: The total number of items
+    :param factory: Callable that builds the item for the given index
+
+    .. code-block:: python
+
+        >>> server.register("user.getRecentTracks", Paginated("recenttracks", "track", 10000, synthetic_track))
+    """
+
+    def __init__(
+        self,
+        root: str,
+        key: str,
+        total: int,
+        factory: Callable[[int], Dict],
+    ):
+        self.root = root
+        self.key = key
+        self.total = total
+        self.factory = factory
+
+    def __call__(self, params: Dict[str, str]) -> Dict:
+        limit = max(int(params.get("limit", 50)), 1)
+        page = max(int(params.get("page", 1)), 1)
+        start = (page - 1) * limit
+        end = min(start + limit, self.total)
+
+        attr = {
+            "page": str(page),
+            "perPage": str(limit),
+            "total": str(self.total),
+            "totalPages": str(math.ceil(self.total / limit)),
+        }
+        if "user" in params:
+            attr["user"] = params["user"]
+
+        return {
+            self.root: {
+                self.key: [self.factory(i) for i in range(start, end)],
+                "@attr": attr,
+            }
+        }
+
+
+def synthetic_artist(index: int) -> Dict:
+    return {
+        "name": f"Artist {index}",
+        "mbid": "",
+        "url": f"https://www.last.fm/music/Artist+{index}",
+        "playcount": str(1000000 - index),
+        "listeners": str(100000 - index),
+        "image": [{"#text": "", "size": "small"}],
+    }
+
+
+def synthetic_track(index: int) -> Dict:
+    return {
+        "name": f"Track {index}",
+        "mbid": "",
+        "url": f"https://www.last.fm/music/Artist+{index % 100}/_/Track+{index}",
+        "artist": {"name": f"Artist {index % 100}", "mbid": ""},
+        "album": {"#text": f"Album {index % 500}", "mbid": ""},
+        "date": {"uts": str(1500000000 + index * 180), "#text": ""},
+        "image": [{"#text": "", "size": "small"}],
+    }
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """Thread per request http server, part of the stdlib since python 3.7."""
+
+    daemon_threads = True
+
+
+class FakeServer:
+    """
+    Local stand-in of the last.fm web service for load testing.
+
+    Responses are served by the registered generators, or the recorded
+    vcrpy cassettes of the fixtures directory matched by the ``method``
+    param. Point the library to the server with ``Config.api_url``.
+
+    :param fixtures_dir: Directory with the recorded vcrpy cassettes
+    :param host: The bind address
+    :param port: The bind port, zero picks a free port
+    :param latency: Fixed delay in seconds added to every response
+    :param jitter: Random delay in seconds added to the latency
+    :param error_rate: Fraction of requests to fail with ``error_code``
+    :param error_code: The api error code of the injected failures
+    :param rate_limit: Maximum requests per second before responding with
+        the api error 29
+    :param seed: Random seed for reproducible runs
+
+    .. code-block:: python
+
+        >>> with FakeServer(fixtures_dir, latency=0.05, rate_limit=5) as server:
+        ...     Config.api_url = server.url
+        ...     Track.get_top_tracks_chart()
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: int = 16,
+        rate_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.generators: Dict[str, Generator] = {}
+        self.requests: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.tokens = rate_limit or 0.0
+        self.refilled = time.monotonic()
+        self.thread: Optional[threading.Thread] = None
+
+        if fixtures_dir:
+            self.load_fixtures(fixtures_dir)
+
+        self.httpd = ThreadingHTTPServer((host, port), self.handler())
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/2.0/"
+
+    def register(self, method: str, generator: Generator):
+        """
+        Register a response generator for the given last.fm method.
+
+        :param method: The last.fm method name, eg ``user.getInfo``
+        :param generator: Callable that receives the request params and
+            returns the response body
+        """
+        self.generators[method] = generator
+
+    def load_fixtures(self, path: str):
+        """
+        Register the responses of all the vcrpy cassettes in the given
+        directory, the last recorded interaction wins.
+
+        :param path: The fixtures directory
+        """
+        pattern = os.path.join(path, "**", "*.json")
+        for file_path in glob.glob(pattern, recursive=True):
+            if file_path.endswith("_expected.json"):
+                continue
+
+            with open(file_path) as f:
+                cassette = json.load(f)
+
+            for interaction in cassette.get("interactions", []):
+                request = interaction["request"]
+                params = dict(parse_qsl(urlsplit(request["uri"]).query))
+                params.update(parse_qsl(request.get("body") or ""))
+                body = json.loads(interaction["response"]["body"]["string"])
+                if "method" in params and "error" not in body:
+                    self.register(params["method"], self.static(body))
+
+    @staticmethod
+    def static(body: Dict) -> Generator:
+        return lambda params: body
+
+    def start(self) -> "FakeServer":
+        """Serve requests in a background daemon thread."""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Shutdown the server and wait for the background thread."""
+        if self.thread:
+            self.httpd.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *args: Any):
+        self.stop()
+
+    def respond(self, params: Dict[str, str]) -> Tuple[int, Dict]:
+        """
+        Return the http status and body for the given request params, after
+        applying the rate limit, error and latency injection.
+
+        :param params: The request query string or form params
+        """
+        method = params.get("method", "")
+        with self.lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+            throttled = not self.acquire()
+            failed = self.random.random() < self.error_rate
+            delay = self.latency + self.random.random() * self.jitter
+
+        if delay:
+            time.sleep(delay)
+
+        if throttled:
+            return self.error(29)
+        if failed:
+            return self.error(self.error_code)
+
+        generator = self.generators.get(method)
+        if generator is None:
+            return self.error(3, "Invalid Method - No method with that name")
+
+        return 200, generator(params)
+
+    def acquire(self) -> bool:
+        if not self.rate_limit:
+            return True
+
+        now = time.monotonic()
+        elapsed = now - self.refilled
+        self.refilled = now
+        self.tokens = min(self.rate_limit, self.tokens + elapsed * self.rate_limit)
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+    @staticmethod
+    def error(code: int, message: Optional[str] = None) -> Tuple[int, Dict]:
+        body: Dict[str, Any] = {
+            "error": code,
+            "message": message or ERROR_MESSAGES.get(code, "Error"),
+            "links": [],
+        }
+        return ERROR_STATUS.get(code, 200), body
+
+    def handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.reply(dict(parse_qsl(urlsplit(self.path).query)))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode("utf-8")
+                self.reply(dict(parse_qsl(body)))
+
+            def reply(self, params: Dict[str, str]):
+                status, body = server.respond(params)
+                content = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: Any):
+                pass
+
+        return Handler
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Fake last.fm api server")
+    parser.add_argument("--fixtures", help="Directory with vcrpy cassettes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-code", type=int, default=16)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--total", type=int, default=10000)
+    args = parser.parse_args()
+
+    server = FakeServer(
+        fixtures_dir=args.fixtures,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_code=args.error_code,
+        rate_limit=args.rate_limit,
+    )
+    server.register(
+        "user.getRecentTracks",
+        Paginated("recenttracks", "track", args.total, synthetic_track),
+    )
+    server.register(
+        "chart.getTopArtists",
+        Paginated("artists", "artist", args.total, synthetic_artist),
+    )
+    print(f"Serving on {server.url}")
+    server.httpd.serve_forever()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
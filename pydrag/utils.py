@@ -1,5 +1,25 @@
+import contextvars
 import hashlib
+from concurrent.futures import as_completed
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import Optional
+from typing import Tuple
+
+
+def load_dotenv():
+    """Load the environmental variables from the nearest ``.env`` file, if
+    python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv as load
+    except ImportError:  # pragma: no cover
+        return
+
+    load()
 
 
 def md5(text: Optional[str]) -> Optional[str]:
@@ -16,6 +36,17 @@ def md5(text: Optional[str]) -> Optional[str]:
     return hashlib.md5(text.encode("utf-8")).hexdigest()
 
 
+def normalize(text: str) -> str:
+    """
+    Collapse whitespace and casefold the given text, used to compare the
+    spelling variants of names.
+
+    :param str text: The text to normalize
+    :rtype: str
+    """
+    return " ".join(text.split()).casefold()
+
+
 def to_camel_case(text):
     """
     Convert string with underscores to camel case.
@@ -36,3 +67,35 @@ def get_nested(obj, keys, ensure_list=False):
     if ensure_list and isinstance(obj, dict):
         obj = [obj]
     return obj
+
+
+def map_concurrently(
+    func: Callable, items: Iterable, workers: int = 8
+) -> Tuple[Dict[Any, Any], Dict[Any, Exception]]:
+    """
+    Apply the function to every item with a thread pool and collect the
+    results and the errors keyed by item. The caller context variables are
+    copied to every call.
+
+    :param func: The callable to apply
+    :param items: The hashable items
+    :param int workers: The maximum number of threads
+    :rtype: Tuple[Dict, Dict]
+    """
+    results: Dict[Any, Any] = {}
+    errors: Dict[Any, Exception] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def submit(item: Any) -> Future:
+            context = contextvars.copy_context()
+            return executor.submit(lambda: context.run(func, item))
+
+        futures = {submit(item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                errors[item] = e
+
+    return results, errors
@@ -1,12 +1,16 @@
 import json
 import os
 import re
+from datetime import timedelta
+from unittest import mock
 from unittest import TestCase
 
 import vcr
 
+from pydrag.models.auth import AuthSession
 from pydrag.models.common import Config
 
+Config.dotenv = True
 try:
     config = Config.instance()
 except ValueError:
@@ -41,10 +45,24 @@ fixture = vcr.config.VCR(
 )
 
 
+def make_response(status_code, body=None, headers=None):
+    content = b"" if body is None else json.dumps(body).encode()
+    response = mock.Mock(
+        status_code=status_code,
+        content=content,
+        headers=headers or {},
+        elapsed=timedelta(seconds=0.1),
+    )
+    response.raw.tell.return_value = len(content) // 2
+    response.json = lambda **kwargs: json.loads(content, **kwargs)
+    return response
+
+
 class MethodTestCase(TestCase):
     def setUp(self):
         self.maxDiff = None
         Config.instance().session = None
+        AuthSession.registry.clear()
         super().setUp()
 
     @staticmethod
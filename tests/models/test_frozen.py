@@ -0,0 +1,79 @@
+import pickle
+from dataclasses import FrozenInstanceError
+from unittest import TestCase
+
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.frozen import FrozenAlbum
+from pydrag.models.frozen import FrozenArtist
+from pydrag.models.frozen import FrozenModel
+from pydrag.models.frozen import FrozenTrack
+from pydrag.models.track import Track
+
+
+class FrozenModelTests(TestCase):
+    def test_artist_identity(self):
+        first = FrozenArtist(name="Guns N' Roses")
+        second = FrozenArtist(name="  guns n'   ROSES ", url="https://last.fm")
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(("name", "guns n' roses"), first.key)
+
+        first = FrozenArtist(name="Queen", mbid="a")
+        second = FrozenArtist(name="Queen (band)", mbid="a")
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, FrozenArtist(name="Queen"))
+
+    def test_type_is_part_of_identity(self):
+        artist = FrozenArtist(name="x", mbid="a")
+        album = FrozenAlbum(name="x", mbid="a")
+        self.assertNotEqual(artist, album)
+        self.assertEqual(2, len({artist, album}))
+
+    def test_track_identity(self):
+        first = FrozenTrack(name="Paradise City", artist=FrozenArtist("Guns N' Roses"))
+        second = FrozenTrack(name="paradise city", artist=FrozenArtist("GUNS N' ROSES"))
+        other = FrozenTrack(name="Paradise City", artist=FrozenArtist("Slash"))
+
+        counts = {first: 1}
+        counts[second] = counts.get(second, 0) + 1
+        counts[other] = counts.get(other, 0) + 1
+        self.assertEqual({first: 2, other: 1}, counts)
+
+    def test_pickle(self):
+        track = FrozenTrack(name="Paradise City", artist=FrozenArtist("Slash"))
+        self.assertNotIn("hash", track.__getstate__())
+
+        object.__setattr__(track, "hash", 0)
+        result = pickle.loads(pickle.dumps(track))
+        self.assertEqual(track, result)
+        self.assertEqual(hash((FrozenTrack, track.key)), hash(result))
+        self.assertEqual(hash(track.artist), hash(result.artist))
+
+    def test_identity_is_abstract(self):
+        with self.assertRaises(TypeError):
+            FrozenModel()
+
+    def test_immutable(self):
+        artist = FrozenArtist(name="Queen")
+        with self.assertRaises(FrozenInstanceError):
+            artist.name = "Slash"  # type: ignore
+
+    def test_freeze(self):
+        track = Track(
+            name="Paradise City",
+            artist=Artist(name="Guns N' Roses", mbid="eeb"),
+            album=Album(name="Appetite", artist=Artist(name="Guns N' Roses")),
+            url="https://last.fm",
+        )
+        expected = FrozenTrack(
+            name="Paradise City",
+            artist=FrozenArtist(name="Guns N' Roses", mbid="eeb"),
+            album=FrozenAlbum(name="Appetite", artist=FrozenArtist("Guns N' Roses")),
+            url="https://last.fm",
+        )
+        frozen = track.freeze()
+        self.assertEqual(expected, frozen)
+        self.assertEqual(expected.album, frozen.album)
+        self.assertEqual("eeb", frozen.artist.mbid)
+        self.assertEqual(Album(name="Appetite").freeze(), FrozenAlbum("Appetite"))
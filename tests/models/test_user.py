@@ -1,6 +1,8 @@
 from datetime import datetime
+from unittest import mock
 
 from pydrag.constants import Period
+from pydrag.exceptions import ApiError
 from pydrag.models.common import ListModel
 from pydrag.models.user import User
 from tests import fixture
@@ -64,6 +66,32 @@ class UserTests(MethodTestCase):
         self.assertIsInstance(result, User)
         self.assertFixtureEqual("user/get_info", result.to_dict())
 
+    @mock.patch.object(User, "retrieve")
+    def test_find_caches_not_found_errors(self, retrieve):
+        User.find("rj")
+        self.assertEqual("negative", retrieve.call_args[1]["cache"])
+
+        User.find_many(["rj"])
+        self.assertEqual("negative", retrieve.call_args[1]["cache"])
+
+    @mock.patch.object(User, "find")
+    def test_find_many(self, find):
+        def side_effect(username, cache):
+            self.assertIs(True, cache)
+            if username == "missing":
+                raise ApiError("User not found", 6, [])
+            return username.upper()
+
+        find.side_effect = side_effect
+        users, errors = User.find_many(["rj", "missing", "RJ", "foo", "rj"], cache=True)
+
+        self.assertEqual({"rj": "RJ", "RJ": "RJ", "foo": "FOO"}, users)
+        self.assertEqual(["missing"], list(errors))
+        self.assertEqual(6, errors["missing"].error)
+        self.assertEqual(
+            ["foo", "missing", "rj"], sorted(c.args[0] for c in find.call_args_list)
+        )
+
     @fixture.use_cassette(path="user/get_loved_tracks")
     def test_get_loved_tracks(self):
         result = self.user.get_loved_tracks()
@@ -222,6 +250,20 @@ class UserTests(MethodTestCase):
         self.assertIsInstance(result, ListModel)
         self.assertFixtureEqual("user/get_top_tracks", result.to_dict())
 
+    @fixture.use_cassette(path="user/get_top_tracks")
+    def test_get_top_tracks_with_fields(self):
+        result = self.user.get_top_tracks(
+            period=Period.week, limit=1, fields=["name", "artist.name", "playcount"]
+        )
+        expected = {
+            "name": "Einschlafhilfe Baby Sleepy - 60 Minuten",
+            "artist": {"name": "Womb Sounds Heartbeat"},
+            "playcount": 35,
+            "rank": 1,
+        }
+        self.assertEqual(expected, result[0].to_dict())
+        self.assertEqual(1, result.page)
+
     def test_get_top_tracks_with_invalid_period(self):
         with self.assertRaises(ValueError) as cm:
             self.user.get_top_tracks(period="blah")
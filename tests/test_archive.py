@@ -0,0 +1,118 @@
+import os
+import tempfile
+from unittest import skipIf
+from unittest import TestCase
+
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+
+try:
+    import numpy as np
+
+    from pydrag.archive import Archive
+    from pydrag.archive import ArchiveWriter
+    from pydrag.archive import export_tracks
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@skipIf(np is None, "numpy is not installed")
+class ArchiveTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "rj")
+        self.tracks = [
+            Track(
+                name="Fu-Gee-La",
+                artist=Artist(name="Fugees", mbid="a1"),
+                album=Album(name="The Score", mbid=""),
+                url="https://www.last.fm/music/Fugees/_/Fu-Gee-La",
+                timestamp=1541874568,
+                loved=True,
+            ),
+            Track(name="Ready or Not", artist=Artist(name="Fugees", mbid="a1")),
+            Track(
+                name="Fu-Gee-La",
+                artist=Artist(name="Fugees", mbid="a1"),
+                album=Album(name="The Score"),
+                timestamp=1541874000,
+                loved=False,
+            ),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_export_and_read(self):
+        archive = export_tracks(self.tracks, self.path)
+
+        self.assertIsInstance(archive, Archive)
+        self.assertEqual(3, len(archive))
+        self.assertEqual(["Fugees"], archive.dictionaries["artist"])
+        self.assertEqual(["Fu-Gee-La", "Ready or Not"], archive.dictionaries["name"])
+        self.assertEqual([0, 1, 0], archive.column("name").tolist())
+        self.assertIsInstance(archive.column("timestamp"), np.memmap)
+
+        expected = [track.to_dict() for track in self.tracks]
+        expected[0]["album"].pop("mbid")
+        self.assertEqual(expected, [track.to_dict() for track in archive])
+        self.assertEqual(expected[-1], archive[-1].to_dict())
+        self.assertEqual(expected[1:], [t.to_dict() for t in archive[1:]])
+
+        with self.assertRaises(IndexError):
+            archive[3]
+
+    def test_tracks(self):
+        archive = export_tracks(self.tracks, self.path)
+        result = archive.tracks(user="rj")
+
+        self.assertIsInstance(result, ListModel)
+        self.assertEqual(3, len(result))
+        self.assertEqual(3, result.total)
+        self.assertEqual("rj", result.user)
+        self.assertEqual("Ready or Not", result[1].name)
+
+        expected = [track.to_dict() for track in archive]
+        result = result.to_dict()
+        self.assertIsInstance(result["data"], list)
+        self.assertEqual(expected, result["data"])
+        self.assertEqual({"data": expected, "total": 3, "user": "rj"}, result)
+
+    def test_extend_and_sort(self):
+        archive = export_tracks(self.tracks[:1], self.path)
+        timestamps = archive.column("timestamp")
+
+        writer = ArchiveWriter.extend(archive)
+        writer.write(self.tracks[1:])
+        writer.sort("timestamp")
+        writer.attributes["synced"] = 1
+        writer.close()
+
+        extended = Archive(self.path)
+        self.assertEqual(
+            [-1, 1541874000, 1541874568], extended.column("timestamp").tolist()
+        )
+        self.assertEqual(["Fu-Gee-La", "Ready or Not"], extended.dictionaries["name"])
+        self.assertEqual({"synced": 1}, extended.attributes)
+        self.assertEqual([1541874568], timestamps.tolist())
+        self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(self.path)))
+
+    def test_replaced_archive(self):
+        archive = export_tracks(self.tracks[:1], self.path)
+        export_tracks(self.tracks[1:2], self.path)
+
+        self.assertEqual(self.tracks[0].url, archive[0].url)
+        self.assertEqual(1541874568, archive[0].timestamp)
+        self.assertIsNone(Archive(self.path)[0].timestamp)
+
+    def test_unsupported_version(self):
+        export_tracks([], self.path)
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            f.write('{"version": 0}')
+
+        with self.assertRaises(ValueError) as cm:
+            Archive(self.path)
+
+        self.assertEqual("Unsupported archive version: 0", str(cm.exception))
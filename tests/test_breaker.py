@@ -0,0 +1,174 @@
+from unittest import mock
+from unittest import TestCase
+
+from requests.exceptions import ConnectionError
+from requests.exceptions import HTTPError
+
+from pydrag.breaker import CircuitBreaker
+from pydrag.breaker import CLOSED
+from pydrag.breaker import HALF_OPEN
+from pydrag.breaker import OPEN
+from pydrag.cache import Cache
+from pydrag.exceptions import ApiError
+from pydrag.exceptions import CircuitOpenError
+from pydrag.exceptions import DeadlineExceeded
+from pydrag.metrics import MetricsCollector
+from pydrag.models.common import Config
+from pydrag.models.common import RawResponse
+from pydrag.services import ApiMixin
+from tests import make_response
+from tests import MethodTestCase
+
+offline = ApiError(message="Service Offline", error=11, links=[])
+
+
+@mock.patch("pydrag.breaker.time.monotonic")
+class CircuitBreakerTests(TestCase):
+    def test_is_failure(self, monotonic):
+        breaker = CircuitBreaker()
+        server_error = HTTPError(response=mock.Mock(status_code=502))
+        client_error = HTTPError(response=mock.Mock(status_code=404))
+
+        self.assertTrue(breaker.is_failure(offline))
+        self.assertTrue(breaker.is_failure(server_error))
+        self.assertTrue(breaker.is_failure(ConnectionError()))
+        self.assertFalse(breaker.is_failure(ApiError("Not found", 6, [])))
+        self.assertFalse(breaker.is_failure(client_error))
+        self.assertFalse(breaker.is_failure(DeadlineExceeded()))
+        self.assertFalse(breaker.is_failure(ValueError()))
+
+    def test_opens_on_failure_rate(self, monotonic):
+        monotonic.return_value = 100
+        breaker = CircuitBreaker(threshold=0.5, window=4, min_calls=4)
+
+        for error in (offline, None, offline):
+            self.assertIsNone(breaker.record(breaker.acquire(), error))
+
+        self.assertEqual((CLOSED, OPEN), breaker.record(breaker.acquire(), offline))
+
+        with self.assertRaises(CircuitOpenError) as cm:
+            breaker.acquire()
+        self.assertEqual(30, cm.exception.retry_after)
+
+    def test_half_open_trials(self, monotonic):
+        monotonic.return_value = 100
+        breaker = CircuitBreaker(min_calls=1, cooldown=10, probes=1)
+        breaker.record(breaker.acquire(), offline)
+        self.assertEqual(OPEN, breaker.state)
+
+        monotonic.return_value = 110
+        trial = breaker.acquire()
+        self.assertTrue(trial.trial)
+        self.assertEqual((OPEN, HALF_OPEN), trial.transition)
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire()
+
+        self.assertEqual((HALF_OPEN, OPEN), breaker.record(trial, offline))
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire()
+
+        monotonic.return_value = 120
+        trial = breaker.acquire()
+        self.assertEqual((HALF_OPEN, CLOSED), breaker.record(trial, None))
+        ticket = breaker.acquire()
+        self.assertFalse(ticket.trial)
+        self.assertIsNone(ticket.transition)
+
+        breaker.reset()
+        self.assertEqual(CLOSED, breaker.state)
+        self.assertEqual(0, len(breaker.outcomes))
+
+    def test_requests_admitted_before_opening_are_ignored(self, monotonic):
+        monotonic.return_value = 100
+        breaker = CircuitBreaker(min_calls=1, cooldown=10)
+        early = breaker.acquire()
+        breaker.record(breaker.acquire(), offline)
+
+        monotonic.return_value = 110
+        trial = breaker.acquire()
+        self.assertIsNone(breaker.record(early, None))
+        self.assertEqual(HALF_OPEN, breaker.state)
+        self.assertEqual(1, breaker.trials)
+
+        self.assertEqual((HALF_OPEN, OPEN), breaker.record(trial, offline))
+
+
+@mock.patch("requests.request")
+class BreakerRequestTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        Config.breaker = CircuitBreaker(min_calls=2, cooldown=30)
+        self.collector = MetricsCollector()
+        self.collector.attach()
+
+    def tearDown(self):
+        self.collector.detach()
+        Config.breaker = None
+        Config.cache = None
+        super().tearDown()
+
+    def test_fail_fast_and_recover(self, request):
+        response = make_response(500)
+        response.raise_for_status.side_effect = HTTPError(response=response)
+        request.return_value = response
+        params = {"method": "foo.bar"}
+
+        for _ in range(2):
+            with self.assertRaises(HTTPError):
+                ApiMixin.retrieve(bind=RawResponse, params=params)
+
+        with self.assertRaises(CircuitOpenError):
+            ApiMixin.retrieve(bind=RawResponse, params=params)
+
+        self.assertEqual(2, request.call_count)
+        self.assertEqual(OPEN, self.collector.circuit)
+        self.assertEqual(1, self.collector.get("foo.bar").errors["CircuitOpenError"])
+
+        Config.breaker.opened -= 30
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+        result = ApiMixin.retrieve(bind=RawResponse, params=params)
+
+        self.assertEqual({"a": 1}, result.data)
+        self.assertEqual(CLOSED, self.collector.circuit)
+        self.assertEqual(
+            {OPEN: 1, HALF_OPEN: 1, CLOSED: 1}, dict(self.collector.circuit_changes)
+        )
+
+    def test_api_errors(self, request):
+        request.return_value = make_response(
+            200, {"error": 16, "message": "Try again", "links": []}
+        )
+        params = {"method": "foo.bar"}
+        for _ in range(2):
+            with self.assertRaises(ApiError):
+                ApiMixin.retrieve(bind=RawResponse, params=params)
+
+        self.assertEqual(OPEN, Config.breaker.state)
+
+    def test_call_is_guarded(self, request):
+        request.return_value = make_response(
+            200, {"error": 11, "message": "Service Offline", "links": []}
+        )
+        params = {"method": "foo.bar"}
+        for _ in range(2):
+            with self.assertRaises(ApiError):
+                ApiMixin.call(params)
+
+        with self.assertRaises(CircuitOpenError):
+            ApiMixin.call(params, decode=False)
+        self.assertEqual(2, request.call_count)
+
+    def test_serve_cached_while_open(self, request):
+        Config.cache = Cache(ttl=0, stale_ttl=60)
+        params = {"method": "foo.bar"}
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+        ApiMixin.retrieve(bind=RawResponse, params=params, cache=True)
+
+        Config.breaker.transition(OPEN)
+        result = ApiMixin.retrieve(bind=RawResponse, params=params, cache=True)
+        Config.cache.join()
+
+        self.assertEqual({"a": 1}, result.data)
+        self.assertEqual(1, request.call_count)
+        with self.assertRaises(CircuitOpenError):
+            ApiMixin.retrieve(bind=RawResponse, params={"method": "foo.baz"})
@@ -0,0 +1,189 @@
+import threading
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.cache import Cache
+from pydrag.exceptions import ApiError
+from pydrag.models.common import Config
+from pydrag.models.common import ListModel
+from pydrag.models.common import RawResponse
+from pydrag.models.track import Track
+from pydrag.services import ApiMixin
+from tests import fixture
+from tests import make_response
+from tests import MethodTestCase
+
+
+@mock.patch("pydrag.cache.time.monotonic")
+class CacheTests(TestCase):
+    def test_get_set(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache(ttl=10, stale_ttl=20, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        monotonic.return_value = 15
+        self.assertEqual(1, cache.get("a").value)
+        self.assertFalse(cache.get("a").fresh)
+
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(["a", "c"], list(cache.entries))
+
+        monotonic.return_value = 30
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(["c"], list(cache.entries))
+
+    def test_fetch_fresh_and_expired(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache(ttl=10, stale_ttl=20)
+        loader = mock.Mock(side_effect=[1, 2])
+
+        self.assertEqual(1, cache.fetch("a", loader))
+        self.assertEqual(1, cache.fetch("a", loader))
+        self.assertEqual(1, loader.call_count)
+
+        monotonic.return_value = 30
+        self.assertEqual(2, cache.fetch("a", loader))
+        self.assertEqual(2, loader.call_count)
+
+    def test_fetch_stale_revalidates_once(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache(ttl=10, stale_ttl=20)
+        cache.set("a", 1)
+        monotonic.return_value = 15
+
+        release = threading.Event()
+
+        def loader():
+            release.wait(5)
+            return 2
+
+        loader_mock = mock.Mock(side_effect=loader)
+        self.assertEqual(1, cache.fetch("a", loader_mock))
+        self.assertEqual(1, cache.fetch("a", loader_mock))
+        release.set()
+        cache.join()
+
+        self.assertEqual(1, loader_mock.call_count)
+        self.assertEqual(2, cache.get("a").value)
+        self.assertEqual({}, cache.pending)
+
+    def test_refresh_failure_keeps_stale_entry(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache(ttl=10, stale_ttl=20)
+        cache.set("a", 1)
+        monotonic.return_value = 15
+
+        self.assertEqual(1, cache.fetch("a", mock.Mock(side_effect=ValueError)))
+        cache.join()
+        self.assertEqual(1, cache.get("a").value)
+
+    def test_fetch_negative_caching(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache(negative_ttl=5)
+        loader = mock.Mock(side_effect=ApiError("Not found", 6, []))
+
+        for _ in range(2):
+            with self.assertRaises(ApiError) as cm:
+                cache.fetch("a", loader)
+
+            self.assertEqual("Not found", cm.exception.message)
+            self.assertEqual(6, cm.exception.error)
+
+        self.assertEqual(1, loader.call_count)
+
+        monotonic.return_value = 5
+        self.assertIsNone(cache.get("a"))
+
+    def test_fetch_negative_only(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache(negative_ttl=5)
+        cache.set("a", 1)
+        loader = mock.Mock(side_effect=[2, 3, ApiError("Not found", 6, [])])
+
+        self.assertEqual(2, cache.fetch("a", loader, positive=False))
+        self.assertEqual(3, cache.fetch("b", loader, positive=False))
+        self.assertIsNone(cache.get("b"))
+
+        for _ in range(2):
+            with self.assertRaises(ApiError):
+                cache.fetch("b", loader, positive=False)
+        self.assertEqual(3, loader.call_count)
+
+    def test_fetch_ignores_other_errors(self, monotonic):
+        monotonic.return_value = 0
+        cache = Cache()
+        loader = mock.Mock(side_effect=ApiError("Offline", 11, []))
+
+        for _ in range(2):
+            with self.assertRaises(ApiError):
+                cache.fetch("a", loader)
+
+        self.assertEqual(2, loader.call_count)
+        self.assertIsNone(cache.get("a"))
+
+
+class CachedRetrieveTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        Config.cache = Cache()
+
+    def tearDown(self):
+        Config.cache = None
+        super().tearDown()
+
+    @fixture.use_cassette(path="chart/get_top_tracks")
+    def test_chart_is_cached(self):
+        first = Track.get_top_tracks_chart(limit=10, page=2)
+        second = Track.get_top_tracks_chart(limit=10, page=2)
+
+        self.assertIsInstance(second, ListModel)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertFixtureEqual("chart/get_top_tracks", second.to_dict())
+        self.assertEqual(1, len(Config.cache.entries))
+
+    @fixture.use_cassette(path="track/find", allow_playback_repeats=True)
+    def test_found_lookups_are_not_cached(self):
+        first = Track.find(artist="AC / DC", track="Hells Bell")
+        second = Track.find(artist="AC / DC", track="Hells Bell")
+
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertEqual(0, len(Config.cache.entries))
+
+    @fixture.use_cassette(path="error_response")
+    def test_not_found_is_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ApiError) as cm:
+                Track.find(track="Axe and the wind", artist="scorpions")
+
+            self.assertEqual("Track not found", cm.exception.message)
+            self.assertEqual(6, cm.exception.error)
+
+        self.assertTrue(next(iter(Config.cache.entries.values())).error)
+
+    @mock.patch("requests.request")
+    def test_stale_entry_is_revalidated_conditionally(self, request):
+        Config.cache = Cache(ttl=0, stale_ttl=60)
+        request.side_effect = [
+            make_response(200, {"foo": {"a": 1}}, {"ETag": '"v1"'}),
+            make_response(304),
+        ]
+        params = {"method": "foo.bar"}
+
+        first = ApiMixin.retrieve(bind=RawResponse, params=params, cache=True)
+        second = ApiMixin.retrieve(bind=RawResponse, params=params, cache=True)
+        Config.cache.join()
+
+        self.assertEqual({"a": 1}, first.data)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(2, request.call_count)
+
+        headers = [c.kwargs["headers"] for c in request.call_args_list]
+        self.assertEqual({"Accept-Encoding": "gzip, deflate"}, headers[0])
+        self.assertEqual('"v1"', headers[1]["If-None-Match"])
+
+        entry = Config.cache.get(ApiMixin.cache_key(params))
+        self.assertEqual('"v1"', entry.value["etag"])
+        self.assertEqual({"foo": {"a": 1}}, entry.value["body"])
@@ -0,0 +1,164 @@
+import os
+import tempfile
+from unittest import skipIf
+from unittest import TestCase
+
+from pydrag.constants import Period
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.common import Chart
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+
+try:
+    import numpy as np
+
+    from pydrag.archive import export_tracks
+    from pydrag.charts import ChartEngine
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def scrobble(artist, album, name, timestamp):
+    return Track(
+        name=name,
+        artist=Artist(name=artist, mbid=""),
+        album=Album(name=album) if album else None,
+        timestamp=timestamp,
+    )
+
+
+@skipIf(np is None, "numpy is not installed")
+class ChartEngineTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        archive = export_tracks(
+            [
+                scrobble("Fugees", "The Score", "Ready or Not", 100),
+                scrobble("Queen", "Jazz", "Mustapha", 150),
+                scrobble("Queen", "Jazz", "Bicycle Race", 160),
+                scrobble("Fugees", "The Score", "Fu-Gee-La", 200),
+                scrobble("Fugees", None, "Ready or Not", 210),
+                scrobble("Fugees", "The Score", "Ready or Not", 300),
+                scrobble("Queen", "Jazz", "Mustapha", None),
+            ],
+            os.path.join(self.tmp.name, "rj"),
+        )
+        self.engine = ChartEngine(archive, user="rj")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_weekly_artist_chart(self):
+        result = self.engine.weekly_artist_chart(from_date=100, to_date=300)
+
+        self.assertIsInstance(result, ListModel)
+        self.assertEqual("rj", result.user)
+        self.assertEqual(100, result.from_date)
+        self.assertEqual(300, result.to_date)
+        expected = [
+            {"name": "Fugees", "mbid": "", "playcount": 3, "rank": 1},
+            {"name": "Queen", "mbid": "", "playcount": 2, "rank": 2},
+        ]
+        self.assertEqual(expected, [artist.to_dict() for artist in result])
+
+    def test_weekly_album_chart(self):
+        result = self.engine.weekly_album_chart()
+
+        expected = [
+            {
+                "name": "The Score",
+                "mbid": "",
+                "artist": {"name": "Fugees", "mbid": ""},
+                "playcount": 3,
+                "rank": 1,
+            },
+            {
+                "name": "Jazz",
+                "mbid": "",
+                "artist": {"name": "Queen", "mbid": ""},
+                "playcount": 2,
+                "rank": 2,
+            },
+        ]
+        self.assertEqual(expected, [album.to_dict() for album in result])
+
+    def test_weekly_track_chart(self):
+        result = self.engine.weekly_track_chart(from_date="150")
+
+        actual = [(t.artist.name, t.name, t.playcount, t.rank) for t in result]
+        expected = [
+            ("Fugees", "Ready or Not", 2, 1),
+            ("Queen", "Mustapha", 1, 2),
+            ("Queen", "Bicycle Race", 1, 3),
+            ("Fugees", "Fu-Gee-La", 1, 4),
+        ]
+        self.assertEqual(expected, actual)
+
+    def test_weekly_charts(self):
+        charts = [
+            Chart(text="", from_date="100", to_date="200"),
+            Chart(text="", from_date="200", to_date="300"),
+            Chart(text="", from_date="400", to_date="500"),
+        ]
+        result = self.engine.weekly_charts("artist", charts)
+
+        actual = [[(a.name, a.playcount) for a in chart] for chart in result]
+        expected = [[("Queen", 2), ("Fugees", 1)], [("Fugees", 2)], []]
+        self.assertEqual(expected, actual)
+        self.assertEqual([200, 300, 500], [chart.to_date for chart in result])
+
+        with self.assertRaises(ValueError) as cm:
+            self.engine.weekly_charts("artist", list(reversed(charts)))
+
+        self.assertEqual(
+            "Chart ranges must be sorted and not overlapping", str(cm.exception)
+        )
+
+    def test_top_periods(self):
+        now = 300 + 10 * 86400
+        result = self.engine.top_periods("artist", now=now)
+
+        self.assertEqual(set(Period), set(result))
+        actual = {
+            period.value: [(a.name, a.playcount, a.rank) for a in chart]
+            for period, chart in result.items()
+        }
+        self.assertEqual([], actual["7day"])
+        self.assertEqual([("Fugees", 4, 1), ("Queen", 2, 2)], actual["1month"])
+        self.assertEqual(actual["1month"], actual["12month"])
+        self.assertEqual([("Fugees", 4, 1), ("Queen", 3, 2)], actual["overall"])
+
+        overall = result[Period.overall]
+        self.assertEqual(1, overall.page)
+        self.assertEqual(50, overall.limit)
+        self.assertEqual(2, overall.total)
+        self.assertEqual("rj", overall.user)
+
+    def test_top(self):
+        result = self.engine.top("track", Period.overall, limit=2, page=2)
+
+        actual = [(t.name, t.playcount, t.rank) for t in result]
+        self.assertEqual([("Bicycle Race", 1, 3), ("Fu-Gee-La", 1, 4)], actual)
+        self.assertEqual(4, result.total)
+        self.assertEqual(2, result.page)
+
+        self.assertEqual(2, len(self.engine.top_artists(Period.overall)))
+        self.assertEqual(0, len(self.engine.top_albums(Period.year)))
+        self.assertEqual(4, len(self.engine.top_tracks(Period.overall)))
+
+        with self.assertRaises(ValueError) as cm:
+            self.engine.top("artist", "overall")
+
+        self.assertEqual("Invalid period", str(cm.exception))
+
+    def test_group_keys(self):
+        keys = self.engine.group_keys("album")
+
+        self.assertEqual([0, 3, 3, 0, -1, 0, 3], keys.tolist())
+        self.assertIs(keys, self.engine.group_keys("album"))
+
+        with self.assertRaises(ValueError) as cm:
+            self.engine.group_keys("tag")
+
+        self.assertEqual("Unknown chart kind: tag", str(cm.exception))
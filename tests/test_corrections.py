@@ -0,0 +1,58 @@
+from unittest import mock
+
+from pydrag.corrections import Corrector
+from pydrag.corrections import normalize
+from pydrag.stores import MemoryStore
+from tests import fixture
+from tests import MethodTestCase
+
+
+class CorrectorTests(MethodTestCase):
+    def test_normalize(self):
+        self.assertEqual("guns n' roses", normalize("  Guns   N' ROSES "))
+
+    @fixture.use_cassette(path="artist/get_correction")
+    def test_correct_artists(self):
+        store = MemoryStore()
+        corrector = Corrector(store)
+        names = ["Guns an roses", "guns  an Roses ", "Guns an roses"]
+        result = corrector.correct_artists(names)
+
+        expected = {
+            "Guns an roses": "Guns N' Roses",
+            "guns  an Roses ": "Guns N' Roses",
+        }
+        self.assertEqual(expected, result)
+        self.assertEqual("Guns N' Roses", store.get("artist:guns an roses"))
+
+        with mock.patch.object(Corrector, "fetch_artist") as fetch_artist:
+            self.assertEqual(expected, corrector.correct_artists(names))
+            self.assertEqual(0, fetch_artist.call_count)
+
+    @fixture.use_cassette(path="track/get_correction")
+    def test_correct_tracks(self):
+        corrector = Corrector()
+        result = corrector.correct_tracks(
+            [("AC / DC", "Hells Bell"), ("ac / dc", "hells bell")]
+        )
+
+        expected = {
+            ("AC / DC", "Hells Bell"): ("AC/DC", "Hells Bells"),
+            ("ac / dc", "hells bell"): ("AC/DC", "Hells Bells"),
+        }
+        self.assertEqual(expected, result)
+
+    @mock.patch.object(Corrector, "fetch")
+    def test_correct_without_correction(self, fetch):
+        fetch.return_value = {}
+        result = Corrector().correct_artists(["Queen "])
+        self.assertEqual({"Queen ": "Queen"}, result)
+
+    @mock.patch.object(Corrector, "fetch")
+    def test_failed_lookups_are_not_stored(self, fetch):
+        fetch.side_effect = ValueError
+        store = MemoryStore()
+        result = Corrector(store).correct_artists(["Queen"])
+
+        self.assertEqual({"Queen": None}, result)
+        self.assertEqual([], list(store.keys()))
@@ -0,0 +1,238 @@
+import threading
+import time
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.crawlers import Crawler
+from pydrag.crawlers import Edge
+from pydrag.crawlers import FriendsCrawler
+from pydrag.crawlers import SimilarityCrawler
+from pydrag.models.artist import Artist
+from pydrag.models.common import ListModel
+from pydrag.models.tag import Tag
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from pydrag.stores import MemoryStore
+from tests import fixture
+from tests import MethodTestCase
+
+graph = {
+    "a": [("b", 1.0), ("c", 0.5)],
+    "b": [("a", 1.0), ("d", 0.2)],
+    "c": [("d", 0.7)],
+    "d": [("e", 0.1)],
+}
+
+
+def get_similar(self, limit=50):
+    if self.name == "boom":
+        raise ValueError()
+    return ListModel(
+        [Artist(name=name, match=match) for name, match in graph.get(self.name, [])][
+            :limit
+        ]
+    )
+
+
+def retry_similar(self, limit=50):
+    names = {"boom": [("f", 0.3)]}.get(self.name, graph.get(self.name, []))
+    return ListModel([Artist(name=name, match=match) for name, match in names])
+
+
+class CrawlerTests(TestCase):
+    def test_expand_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Crawler([])
+
+
+@mock.patch.object(Artist, "get_similar", get_similar)
+class SimilarityCrawlerTests(TestCase):
+    def test_crawl(self):
+        crawler = SimilarityCrawler([Artist(name="a")], depth=2, workers=2)
+        edges = list(crawler.crawl())
+
+        expected = [
+            Edge("name:a", "name:b", 1.0, 0),
+            Edge("name:a", "name:c", 0.5, 0),
+            Edge("name:b", "name:a", 1.0, 1),
+            Edge("name:b", "name:d", 0.2, 1),
+            Edge("name:c", "name:d", 0.7, 1),
+        ]
+        self.assertEqual(expected, edges)
+
+    def test_adjacency_with_limit(self):
+        crawler = SimilarityCrawler([Artist(name="a")], depth=3, limit=1)
+        expected = {"name:a": [("name:b", 1.0)], "name:b": [("name:a", 1.0)]}
+        self.assertEqual(expected, crawler.adjacency())
+
+    def test_resume(self):
+        store = MemoryStore()
+        crawler = SimilarityCrawler([Artist(name="a")], depth=1, store=store)
+        self.assertEqual(2, len(list(crawler.crawl())))
+
+        state = store.get("crawler")
+        self.assertEqual(1, state["hop"])
+        self.assertEqual(["name:b", "name:c"], list(state["frontier"]))
+
+        crawler = SimilarityCrawler([Artist(name="a")], depth=2, store=store)
+        edges = list(crawler.crawl())
+        self.assertEqual(["name:b", "name:b", "name:c"], [e.source for e in edges])
+        self.assertEqual({1}, {e.depth for e in edges})
+
+    def test_errors(self):
+        crawler = SimilarityCrawler([Artist(name="boom"), Artist(name="c")])
+        edges = list(crawler.crawl())
+
+        self.assertEqual(2, len(edges))
+        self.assertEqual(["name:boom"], list(crawler.errors))
+
+    def test_errors_are_retried_on_resume(self):
+        store = MemoryStore()
+        crawler = SimilarityCrawler(
+            [Artist(name="boom"), Artist(name="c")], 1, store=store
+        )
+        self.assertEqual(1, len(list(crawler.crawl())))
+        self.assertEqual(
+            ["name:boom", "name:d"], list(store.get("crawler")["frontier"])
+        )
+
+        crawler = SimilarityCrawler([Artist(name="a")], depth=2, store=store)
+        with mock.patch.object(Artist, "get_similar", retry_similar):
+            edges = list(crawler.crawl())
+
+        self.assertEqual(
+            [Edge("name:boom", "name:f", 0.3, 1), Edge("name:d", "name:e", 0.1, 1)],
+            edges,
+        )
+        self.assertEqual({}, crawler.errors)
+
+    def test_key(self):
+        crawler = SimilarityCrawler([])
+        self.assertEqual("mbid:x", crawler.key(Artist(name="A", mbid="x")))
+        self.assertEqual(
+            "name:a\x1fb", crawler.key(Track(name="B", artist=Artist(name="A")))
+        )
+
+
+friends = {
+    "rj": ["a", "b", "c", "d", "e"],
+    "a": ["rj", "f"],
+    "f": ["g"],
+}
+
+
+def get_friends_pages(self, recent_tracks, limit=50, page=1):
+    if self.name == "boom":
+        raise ValueError()
+
+    names = friends.get(self.name, [])
+    data = []
+    for name in names[(page - 1) * limit : page * limit]:
+        user = FriendsCrawler.user(name)
+        if recent_tracks:
+            user.recent_track = Track(name=name, artist=Artist(name=name))
+        data.append(user)
+    return ListModel(data=data, total=len(names), page=page, limit=limit)
+
+
+@mock.patch.object(User, "get_friends", autospec=True, side_effect=get_friends_pages)
+class FriendsCrawlerTests(TestCase):
+    def test_crawl(self, get_friends):
+        crawler = FriendsCrawler(["rj"], depth=2, limit=4, page_size=2)
+        edges = list(crawler.crawl())
+
+        expected = [
+            Edge("name:rj", "name:a", None, 0),
+            Edge("name:rj", "name:b", None, 0),
+            Edge("name:rj", "name:c", None, 0),
+            Edge("name:rj", "name:d", None, 0),
+            Edge("name:a", "name:rj", None, 1),
+            Edge("name:a", "name:f", None, 1),
+        ]
+        self.assertEqual(expected, edges)
+        self.assertIsInstance(edges[0].entity, User)
+        self.assertIsNone(edges[0].entity.recent_track)
+
+        pages = sorted(
+            c.kwargs.get("page", 1)
+            for c in get_friends.call_args_list
+            if c.args[0].name == "rj"
+        )
+        self.assertEqual([1, 2], pages)
+
+        neighbours = crawler.expand(FriendsCrawler.user("rj"))
+        self.assertEqual(["a", "b", "c", "d"], [u.name for u, _ in neighbours])
+
+    def track_concurrency(self, get_friends):
+        lock = threading.Lock()
+        calls = {"active": 0, "max": 0}
+
+        def tracked(*args, **kwargs):
+            with lock:
+                calls["active"] += 1
+                calls["max"] = max(calls["max"], calls["active"])
+            time.sleep(0.01)
+            with lock:
+                calls["active"] -= 1
+            return get_friends_pages(*args, **kwargs)
+
+        get_friends.side_effect = tracked
+        return calls
+
+    def test_bounded_concurrency(self, get_friends):
+        calls = self.track_concurrency(get_friends)
+        seeds = ["rj", "a", "f", "rj2"]
+        crawler = FriendsCrawler(seeds, depth=1, page_size=1, workers=2)
+        list(crawler.crawl())
+
+        self.assertEqual(2, calls["max"])
+
+    def test_concurrent_pages(self, get_friends):
+        calls = self.track_concurrency(get_friends)
+        crawler = FriendsCrawler(["rj"], depth=1, page_size=1, workers=3)
+        edges = list(crawler.crawl())
+
+        self.assertEqual(["a", "b", "c", "d", "e"], [e.entity.name for e in edges])
+        self.assertEqual(3, calls["max"])
+        self.assertEqual(5, get_friends.call_count)
+
+    def test_recent_tracks(self, get_friends):
+        crawler = FriendsCrawler(
+            [FriendsCrawler.user("a")], depth=1, recent_tracks=True
+        )
+        edges = list(crawler.crawl())
+
+        self.assertEqual(["rj", "f"], [e.entity.recent_track.name for e in edges])
+
+    def test_resume(self, get_friends):
+        store = MemoryStore()
+        crawler = FriendsCrawler(["a"], depth=1, store=store)
+        self.assertEqual(2, len(list(crawler.crawl())))
+        self.assertEqual(
+            {"name:f": {"name": "f"}, "name:rj": {"name": "rj"}},
+            store.get("crawler")["frontier"],
+        )
+
+        crawler = FriendsCrawler(["a"], depth=3, store=store)
+        edges = list(crawler.crawl())
+        self.assertEqual(
+            ["name:f", "name:rj", "name:rj", "name:rj", "name:rj", "name:rj"],
+            sorted(e.source for e in edges),
+        )
+        self.assertEqual(
+            {"name:a", "name:b", "name:c", "name:d", "name:e", "name:g"},
+            {e.target for e in edges if e.depth == 1},
+        )
+
+    def test_errors(self, get_friends):
+        crawler = FriendsCrawler(["boom", "f"])
+        self.assertEqual([Edge("name:f", "name:g")], list(crawler.crawl()))
+        self.assertEqual(["name:boom"], list(crawler.errors))
+
+
+class SimilarityCrawlerRequestTests(MethodTestCase):
+    @fixture.use_cassette(path="tag/get_similar")
+    def test_crawl_tags(self):
+        crawler = SimilarityCrawler([Tag(name="Disco")], depth=1)
+        self.assertEqual([], list(crawler.crawl()))
+        self.assertEqual({}, crawler.errors)
@@ -0,0 +1,122 @@
+from unittest import mock
+from unittest import TestCase
+
+from requests.exceptions import ReadTimeout
+
+from pydrag import deadlines
+from pydrag.deadlines import deadline
+from pydrag.exceptions import DeadlineExceeded
+from pydrag.hooks import ON_ERROR
+from pydrag.hooks import POST_RESPONSE
+from pydrag.models.common import Config
+from pydrag.models.common import RawResponse
+from pydrag.services import ApiMixin
+from pydrag.utils import map_concurrently
+from tests import make_response
+from tests import MethodTestCase
+
+
+@mock.patch("pydrag.deadlines.time.monotonic")
+class DeadlineTests(TestCase):
+    def test_deadline(self, monotonic):
+        monotonic.return_value = 100
+        self.assertIsNone(deadlines.remaining())
+
+        with deadline(10) as expires:
+            self.assertEqual(110, expires)
+            with deadline(20) as inner:
+                self.assertEqual(110, inner)
+            with deadline(5):
+                self.assertEqual(5, deadlines.remaining())
+            self.assertEqual(10, deadlines.remaining())
+
+        self.assertIsNone(deadlines.remaining())
+
+    def test_request_timeout(self, monotonic):
+        monotonic.return_value = 100
+        self.assertEqual((1, 2), deadlines.request_timeout((1, 2)))
+        self.assertIsNone(deadlines.request_timeout(None))
+
+        with deadline(5):
+            self.assertEqual((1, 5), deadlines.request_timeout((1, 10)))
+            self.assertEqual((5, 5), deadlines.request_timeout(None))
+            self.assertEqual((3, 3), deadlines.request_timeout(3))
+
+            monotonic.return_value = 105
+            self.assertTrue(deadlines.expired())
+            with self.assertRaises(DeadlineExceeded):
+                deadlines.request_timeout((1, 10))
+
+    def test_propagates_to_concurrent_calls(self, monotonic):
+        monotonic.return_value = 100
+        with deadline(5):
+            results, _ = map_concurrently(
+                lambda _: deadlines.remaining(), range(3), workers=2
+            )
+        self.assertEqual({0: 5, 1: 5, 2: 5}, results)
+
+
+@mock.patch("requests.request")
+class TimeoutTests(MethodTestCase):
+    def test_default_and_per_call_timeouts(self, request):
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+        params = {"method": "foo.bar"}
+
+        ApiMixin.retrieve(bind=RawResponse, params=params)
+        self.assertEqual(Config.timeout, request.call_args.kwargs["timeout"])
+
+        ApiMixin.submit(bind=RawResponse, params=params, timeout=(1, 2))
+        self.assertEqual((1, 2), request.call_args.kwargs["timeout"])
+
+        ApiMixin.call(params, timeout=3)
+        self.assertEqual(3, request.call_args.kwargs["timeout"])
+
+    @mock.patch("pydrag.deadlines.time.monotonic")
+    def test_deadline_caps_timeouts(self, monotonic, request):
+        monotonic.return_value = 100
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+
+        with deadline(4):
+            ApiMixin.retrieve(bind=RawResponse, params={"method": "foo.bar"})
+        self.assertEqual((4, 4), request.call_args.kwargs["timeout"])
+
+    @mock.patch("pydrag.deadlines.time.monotonic")
+    def test_expired_deadline_fails_fast(self, monotonic, request):
+        monotonic.return_value = 100
+        callback = mock.Mock()
+        Config.hooks.register(ON_ERROR, callback)
+        self.addCleanup(Config.hooks.unregister, ON_ERROR, callback)
+
+        with deadline(0):
+            with self.assertRaises(DeadlineExceeded):
+                ApiMixin.retrieve(bind=RawResponse, params={"method": "foo.bar"})
+
+        self.assertEqual(0, request.call_count)
+        self.assertIsInstance(callback.call_args.kwargs["error"], DeadlineExceeded)
+
+    @mock.patch("pydrag.deadlines.time.monotonic")
+    def test_timeout_after_deadline(self, monotonic, request):
+        monotonic.side_effect = [100, 101, 105, 105]
+        request.side_effect = ReadTimeout()
+
+        with deadline(5):
+            with self.assertRaises(DeadlineExceeded):
+                ApiMixin.retrieve(bind=RawResponse, params={"method": "foo.bar"})
+
+        request.side_effect = ReadTimeout()
+        with self.assertRaises(ReadTimeout):
+            ApiMixin.retrieve(bind=RawResponse, params={"method": "foo.bar"})
+
+    @mock.patch("pydrag.deadlines.time.monotonic")
+    def test_slow_response_after_deadline(self, monotonic, request):
+        monotonic.side_effect = [100, 101, 106]
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+        callback = mock.Mock()
+        Config.hooks.register(POST_RESPONSE, callback)
+        self.addCleanup(Config.hooks.unregister, POST_RESPONSE, callback)
+
+        with deadline(5):
+            with self.assertRaises(DeadlineExceeded):
+                ApiMixin.retrieve(bind=RawResponse, params={"method": "foo.bar"})
+
+        self.assertEqual(1, callback.call_count)
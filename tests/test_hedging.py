@@ -0,0 +1,150 @@
+import threading
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.hedging import HedgingPolicy
+from pydrag.models.common import Config
+from pydrag.models.common import RawResponse
+from pydrag.services import ApiMixin
+from pydrag.utils import map_concurrently
+from tests import make_response
+from tests import MethodTestCase
+
+
+class HedgingPolicyTests(TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.policy = HedgingPolicy(budget=1.0, default_delay=0.01)
+
+    def tearDown(self):
+        self.release.set()
+        self.policy.shutdown()
+
+    def slow_then_fast(self, slow, fast):
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                self.release.wait(5)
+                return slow()
+            return fast()
+
+        return send
+
+    def test_fast_request_is_not_hedged(self):
+        self.assertEqual("a", self.policy.run("foo", lambda: "a"))
+        self.assertEqual((1, 0), (self.policy.requests, self.policy.hedges))
+
+    def test_slow_request_is_hedged(self):
+        send = self.slow_then_fast(lambda: "slow", lambda: "fast")
+        self.assertEqual("fast", self.policy.run("foo", send))
+        self.assertEqual(1, self.policy.hedges)
+        self.assertEqual(1, self.policy.wins)
+
+    def test_errors_are_not_hedged(self):
+        send = mock.Mock(side_effect=ValueError("foo"))
+        with self.assertRaises(ValueError):
+            self.policy.run("foo", send)
+        self.assertEqual(1, send.call_count)
+
+    def test_failed_hedge_waits_for_the_request(self):
+        def fail():
+            raise ValueError("foo")
+
+        send = self.slow_then_fast(lambda: "slow", fail)
+        threading.Timer(0.05, self.release.set).start()
+        self.assertEqual("slow", self.policy.run("foo", send))
+        self.assertEqual(0, self.policy.wins)
+
+    def test_requests_are_not_limited_by_the_pool(self):
+        policy = HedgingPolicy(workers=1, default_delay=5)
+        self.addCleanup(policy.shutdown)
+        barrier = threading.Barrier(3, timeout=2)
+
+        results, errors = map_concurrently(
+            lambda i: policy.run("foo", lambda: barrier.wait() >= 0), range(3), 3
+        )
+        self.assertEqual({0: True, 1: True, 2: True}, results)
+        self.assertEqual({}, errors)
+
+    def test_hedges_are_skipped_without_idle_workers(self):
+        self.policy = HedgingPolicy(budget=1.0, default_delay=0.01, workers=1)
+        self.policy.slots.acquire()
+        self.addCleanup(self.policy.slots.release)
+
+        send = self.slow_then_fast(lambda: "slow", lambda: "fast")
+        threading.Timer(0.05, self.release.set).start()
+        self.assertEqual("slow", self.policy.run("foo", send))
+        self.assertEqual(0, self.policy.hedges)
+
+    def test_latency_is_measured_from_send(self):
+        with mock.patch("pydrag.hedging.time.perf_counter", side_effect=[10, 12]):
+            self.assertEqual("a", self.policy.timed("foo", lambda: "a"))
+
+        self.assertEqual(2, self.policy.latencies["foo"].sum)
+
+    def test_budget(self):
+        policy = HedgingPolicy(budget=0.5, default_delay=0)
+        self.addCleanup(policy.shutdown)
+
+        self.assertFalse(policy.allow())
+        policy.requests = 4
+        self.assertTrue(policy.allow())
+        self.assertTrue(policy.allow())
+        self.assertFalse(policy.allow())
+
+    def test_delay(self):
+        policy = HedgingPolicy(percentile=50, min_samples=2, buckets=(0.1, 1.0))
+        self.assertEqual(1.0, policy.delay("foo"))
+
+        policy.observe("foo", 0.05)
+        policy.observe("foo", 0.5)
+        self.assertEqual(0.1, policy.delay("foo"))
+
+        policy.observe("bar", 5)
+        policy.observe("bar", 5)
+        self.assertEqual(1.0, policy.delay("bar"))
+
+
+@mock.patch("requests.request")
+class HedgedRequestTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        self.release = threading.Event()
+        Config.hedging = HedgingPolicy(budget=1.0, default_delay=0.01)
+
+    def tearDown(self):
+        self.release.set()
+        Config.hedging.shutdown()
+        Config.hedging = None
+        super().tearDown()
+
+    def test_retrieve_is_hedged(self, request):
+        responses = [
+            make_response(200, {"foo": {"a": 1}}),
+            make_response(200, {"foo": {"a": 2}}),
+        ]
+
+        def send(**kwargs):
+            response = responses.pop(0)
+            if response.json()["foo"]["a"] == 1:
+                self.release.wait(5)
+            return response
+
+        request.side_effect = send
+        params = {"method": "foo.bar"}
+        result = ApiMixin.retrieve(bind=RawResponse, params=params)
+
+        self.assertEqual({"a": 2}, result.data)
+        self.assertEqual(1, Config.hedging.hedges)
+
+    def test_call_is_hedged(self, request):
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+        self.assertEqual({"foo": {"a": 1}}, ApiMixin.call({"method": "foo.bar"}))
+        self.assertEqual(1, Config.hedging.requests)
+
+    def test_submit_is_not_hedged(self, request):
+        request.return_value = make_response(200, {"foo": {"a": 1}})
+        ApiMixin.submit(bind=RawResponse, params={"method": "foo.bar"})
+        self.assertEqual(0, Config.hedging.requests)
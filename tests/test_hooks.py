@@ -0,0 +1,83 @@
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.exceptions import ApiError
+from pydrag.hooks import Hooks
+from pydrag.models.common import Config
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from tests import fixture
+from tests import MethodTestCase
+
+
+class HooksTests(TestCase):
+    def test_register_and_emit(self):
+        hooks = Hooks()
+        callback = mock.Mock()
+        hooks.register("pre_request", callback)
+        hooks.emit("pre_request", method="a", params={})
+        callback.assert_called_once_with(method="a", params={})
+
+        hooks.unregister("pre_request", callback)
+        hooks.emit("pre_request", method="a", params={})
+        self.assertEqual(1, callback.call_count)
+
+    def test_emit_isolates_callback_errors(self):
+        hooks = Hooks()
+        failing = mock.Mock(side_effect=RuntimeError("boom"))
+        callback = mock.Mock()
+        hooks.register("pre_request", failing)
+        hooks.register("pre_request", callback)
+
+        with self.assertLogs("pydrag.hooks", level="ERROR") as cm:
+            hooks.emit("pre_request", method="a", params={})
+
+        callback.assert_called_once_with(method="a", params={})
+        self.assertIn("pre_request", cm.output[0])
+
+    def test_register_unknown_event(self):
+        with self.assertRaises(ValueError) as cm:
+            Hooks().register("foo", print)
+
+        self.assertEqual("Unknown event: foo", str(cm.exception))
+
+
+class RequestHooksTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        self.events = []
+        for event in Hooks.events:
+            Config.hooks.register(event, self.record(event))
+
+    def tearDown(self):
+        Config.hooks.clear()
+        super().tearDown()
+
+    def record(self, event):
+        def callback(**kwargs):
+            self.events.append((event, kwargs))
+
+        return callback
+
+    @fixture.use_cassette(path="user/get_info")
+    def test_success_events(self):
+        result = User.find("rj")
+
+        names = [event for event, _ in self.events]
+        self.assertEqual(
+            ["pre_request", "post_response", "post_parse", "post_bind"], names
+        )
+        self.assertTrue(all(kw["method"] == "user.getInfo" for _, kw in self.events))
+        self.assertGreater(self.events[1][1]["size"], 0)
+        self.assertIs(result, self.events[3][1]["result"])
+
+    @fixture.use_cassette(path="error_response")
+    def test_error_events(self):
+        with self.assertRaises(ApiError):
+            Track.find(track="Axe and the wind", artist="scorpions")
+
+        names = [event for event, _ in self.events]
+        self.assertEqual(
+            ["pre_request", "post_response", "post_parse", "on_error"], names
+        )
+        self.assertIsInstance(self.events[-1][1]["error"], ApiError)
@@ -0,0 +1,111 @@
+import os
+import tempfile
+from unittest import mock
+from unittest import skipIf
+from unittest import TestCase
+
+from pydrag.models.artist import Artist
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+from pydrag.models.user import User
+
+try:
+    import numpy as np
+
+    from pydrag.index import ScrobbleIndex
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def scrobble(name, timestamp):
+    return Track(name=name, artist=Artist(name="Fugees"), timestamp=timestamp)
+
+
+@skipIf(np is None, "numpy is not installed")
+@mock.patch.object(User, "get_recent_tracks")
+class ScrobbleIndexTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_sync(self, get_recent_tracks):
+        get_recent_tracks.side_effect = [
+            ListModel(
+                data=[scrobble("Now", None), scrobble("c", 30), scrobble("b", 20)],
+                total=3,
+            ),
+            ListModel(data=[scrobble("a", 10)], total=3),
+        ]
+
+        index = ScrobbleIndex(self.tmp.name, "rj")
+        with mock.patch("time.time", return_value=100):
+            self.assertEqual(3, index.sync(limit=2))
+
+        self.assertEqual(3, len(index))
+        self.assertEqual(100, index.synced)
+        self.assertEqual([10, 20, 30], index.archive.column("timestamp").tolist())
+        get_recent_tracks.assert_has_calls(
+            [
+                mock.call(from_date=None, to_date="100", limit=2, page=1),
+                mock.call(from_date=None, to_date="100", limit=2, page=2),
+            ]
+        )
+
+        get_recent_tracks.side_effect = [ListModel(data=[scrobble("d", 110)], total=1)]
+        with mock.patch("time.time", return_value=200):
+            self.assertEqual(1, index.sync())
+
+        get_recent_tracks.assert_called_with(
+            from_date="101", to_date="200", limit=200, page=1
+        )
+
+        index = ScrobbleIndex(self.tmp.name, "rj")
+        self.assertEqual(200, index.synced)
+        self.assertEqual([10, 20, 30, 110], index.archive.column("timestamp").tolist())
+        self.assertTrue(os.path.isdir(os.path.join(self.tmp.name, "rj")))
+
+    def test_range(self, get_recent_tracks):
+        get_recent_tracks.return_value = ListModel(
+            data=[scrobble(str(i), i) for i in (40, 30, 30, 20, 10)], total=5
+        )
+        index = ScrobbleIndex(self.tmp.name, "rj")
+        with mock.patch("time.time", return_value=50):
+            index.sync()
+        get_recent_tracks.reset_mock()
+
+        result = index.range(from_date=20, to_date=30)
+        self.assertIsInstance(result, ListModel)
+        self.assertEqual(["20", "30", "30"], [track.name for track in result])
+        self.assertEqual(3, result.total)
+        self.assertEqual("rj", result.user)
+        self.assertEqual(["10"], [t.name for t in index.range(to_date=15)])
+        self.assertEqual([], list(index.range(from_date=41, to_date=49)))
+        self.assertEqual([], list(index.range(from_date=30, to_date=20)))
+        get_recent_tracks.assert_not_called()
+
+        get_recent_tracks.return_value = ListModel(
+            data=[scrobble("70", 70), scrobble("60", 60)], total=2
+        )
+        result = index.range(from_date=35, to_date=80)
+        self.assertEqual(["40", "60", "70"], [track.name for track in result])
+        get_recent_tracks.assert_called_once_with(
+            from_date="51", to_date="80", limit=200, page=1
+        )
+
+        get_recent_tracks.reset_mock()
+        self.assertEqual(5, len(index.range(fetch=False)))
+        get_recent_tracks.assert_not_called()
+
+    def test_range_without_index(self, get_recent_tracks):
+        get_recent_tracks.return_value = ListModel(
+            data=[scrobble("b", 20), scrobble("a", 10)], total=2
+        )
+        index = ScrobbleIndex(self.tmp.name, "rj")
+
+        result = index.range(from_date=5, to_date=25)
+        self.assertEqual(["a", "b"], [track.name for track in result])
+        get_recent_tracks.assert_called_once_with(
+            from_date="5", to_date="25", limit=200, page=1
+        )
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import pydrag
+from pydrag.models.common import Config
+from pydrag.models.track import Track
+
+
+class InitTests(TestCase):
+    def test_lazy_attributes(self):
+        self.assertIs(Track, pydrag.Track)
+        self.assertEqual(Config.instance, pydrag.configure)
+        self.assertIn("User", dir(pydrag))
+
+        with self.assertRaises(AttributeError):
+            pydrag.Foo
+
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, pydrag;"
+            "print([m for m in ('requests', 'dotenv', 'pydrag.models.common')"
+            " if m in sys.modules])"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(b"[]", output.strip())
@@ -0,0 +1,86 @@
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.exceptions import ApiError
+from pydrag.hooks import Hooks
+from pydrag.metrics import Histogram
+from pydrag.metrics import MetricsCollector
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from tests import fixture
+from tests import MethodTestCase
+
+
+class HistogramTests(TestCase):
+    def test_observe_and_percentile(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        self.assertIsNone(histogram.percentile(50))
+
+        for value in (0.05, 0.05, 0.5, 2):
+            histogram.observe(value)
+
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(1.0, histogram.percentile(75))
+        self.assertEqual(float("inf"), histogram.percentile(99))
+        self.assertEqual(
+            {0.1: 2, 1.0: 1, float("inf"): 1}, histogram.to_dict()["buckets"]
+        )
+
+
+class MetricsCollectorTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        self.collector = MetricsCollector()
+        self.collector.attach()
+
+    def tearDown(self):
+        self.collector.detach()
+        super().tearDown()
+
+    def test_attach_and_detach(self):
+        hooks = Hooks()
+        collector = MetricsCollector()
+        collector.attach(hooks)
+        self.assertEqual([collector.on_error], hooks.callbacks["on_error"])
+
+        collector.detach()
+        self.assertEqual([], hooks.callbacks["on_error"])
+        self.assertIsNone(collector.hooks)
+
+    @fixture.use_cassette(path="user/get_info")
+    def test_collect_response(self):
+        User.find("rj")
+
+        metrics = self.collector.get("user.getInfo")
+        self.assertEqual(1, metrics.requests)
+        self.assertGreater(metrics.bytes, 0)
+        self.assertGreater(metrics.wire_bytes, 0)
+        self.assertEqual(0, metrics.not_modified)
+        self.assertEqual(1, metrics.latency.count)
+        self.assertEqual(1, metrics.parse.count)
+        self.assertEqual(1, metrics.bind.count)
+        self.assertEqual({}, metrics.errors)
+        self.assertEqual(["user.getInfo"], list(self.collector.to_dict()))
+
+    def test_collect_compressed_and_not_modified(self):
+        response = mock.Mock(status_code=304)
+        self.collector.on_response("m", 0.1, 0.1, size=100, wire_size=30)
+        self.collector.on_response("m", 0.1, 0.1, size=0, response=response)
+
+        metrics = self.collector.get("m")
+        self.assertEqual(100, metrics.bytes)
+        self.assertEqual(30, metrics.wire_bytes)
+        self.assertEqual(1, metrics.not_modified)
+
+    @fixture.use_cassette(path="error_response")
+    def test_collect_error(self):
+        with self.assertRaises(ApiError):
+            Track.find(track="Axe and the wind", artist="scorpions")
+
+        metrics = self.collector.get("track.getInfo")
+        self.assertEqual({6: 1}, metrics.errors)
+        self.assertEqual(0, metrics.bind.count)
+
+        self.collector.reset()
+        self.assertEqual({}, self.collector.to_dict())
@@ -0,0 +1,259 @@
+import copy
+import json
+import os
+import threading
+from typing import List
+from typing import Optional
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.exceptions import ApiError
+from pydrag.models.album import Album
+from pydrag.models.artist import Artist
+from pydrag.models.auth import AuthSession
+from pydrag.models.common import Config
+from pydrag.models.common import Image
+from pydrag.models.common import ScrobbleTrack
+from pydrag.models.tag import Tag
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from pydrag.services import ApiMixin
+from pydrag.services import model_type
+from pydrag.services import project
+from pydrag.services import projection
+from pydrag.services import pythonic_variables
+from pydrag.stores import MemoryStore
+from pydrag.utils import md5
+from tests import fixture
+from tests import fixtures_dir
+from tests import MethodTestCase
+
+
+class ApiMixinTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        self.username = Config.instance().username
+        Config.instance().username = "rj"
+
+    def tearDown(self):
+        Config.session_store = None
+        Config.instance().username = self.username
+        super().tearDown()
+
+    @mock.patch.object(AuthSession, "authenticate")
+    def test_get_session_authenticates_once(self, authenticate):
+        barrier = threading.Barrier(8)
+        authenticate.return_value = AuthSession(key="k", name="rj")
+
+        def worker():
+            barrier.wait()
+            results.append(ApiMixin.get_session())
+
+        results = []
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, authenticate.call_count)
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(r is results[0] for r in results))
+
+    @mock.patch.object(AuthSession, "authenticate")
+    def test_get_session_from_store(self, authenticate):
+        Config.session_store = MemoryStore()
+        Config.session_store.set("rj", {"key": "stored", "name": "rj"})
+
+        session = ApiMixin.get_session()
+        self.assertEqual(AuthSession(key="stored", name="rj"), session)
+        self.assertEqual(0, authenticate.call_count)
+
+    @mock.patch.object(AuthSession, "authenticate")
+    def test_get_session_saves_to_store(self, authenticate):
+        Config.session_store = MemoryStore()
+        authenticate.return_value = AuthSession(key="k", name="rj")
+
+        ApiMixin.get_session()
+        self.assertEqual({"key": "k", "name": "rj"}, Config.session_store.get("rj"))
+
+    def test_get_session_for_registered_user(self):
+        session = AuthSession(key="other", name="bob")
+        session.save()
+
+        self.assertIs(session, ApiMixin.get_session("bob"))
+        self.assertEqual(
+            "other", ApiMixin.prepare_params({}, False, True, False, "bob")["sk"]
+        )
+
+        with self.assertRaises(ValueError) as cm:
+            ApiMixin.get_session("alice")
+
+        self.assertEqual("No session registered for user: alice", str(cm.exception))
+
+    def test_get_session_for_stored_user(self):
+        Config.session_store = MemoryStore()
+        Config.session_store.set("bob", {"key": "other", "name": "bob"})
+
+        session = ApiMixin.get_session("bob")
+        self.assertEqual(AuthSession(key="other", name="bob"), session)
+        self.assertIs(session, AuthSession.registry["bob"])
+
+    def test_sign(self):
+        cfg = Config.instance()
+        params = {"method": "track.love", "format": "json", "b": "", "a": "1"}
+        expected = md5(f"a1methodtrack.love{cfg.api_secret}")
+
+        self.assertEqual(expected, ApiMixin.sign(params))
+
+    def test_prepare_params_sorted(self):
+        params = ApiMixin.prepare_params(
+            {"method": "m", "b": 1, "a": True}, True, False, False
+        )
+
+        self.assertEqual(
+            ["a", "api_key", "b", "format", "method", "api_sig"], list(params)
+        )
+        signature = params.pop("api_sig")
+        self.assertEqual(ApiMixin.sign(params), signature)
+
+    def test_auth_token(self):
+        cfg = Config.instance()
+        self.assertEqual(md5(f"rj{cfg.password}"), cfg.auth_token)
+        self.assertIs(cfg.auth_token, cfg.auth_token)
+
+
+class CallTests(MethodTestCase):
+    @fixture.use_cassette(path="user/get_info")
+    def test_call(self):
+        result = ApiMixin.call({"method": "user.getInfo", "user": "rj"})
+
+        self.assertIsInstance(result, dict)
+        self.assertEqual("RJ", result["user"]["name"])
+        self.assertIn("real_name", result["user"])
+
+    @fixture.use_cassette(path="user/get_info")
+    def test_call_without_decoding(self):
+        result = ApiMixin.call({"method": "user.getInfo", "user": "rj"}, decode=False)
+
+        self.assertIsInstance(result, bytes)
+        self.assertIn("realname", json.loads(result)["user"])
+
+    @fixture.use_cassette(path="error_response", allow_playback_repeats=True)
+    def test_call_error(self):
+        params = {
+            "method": "track.getInfo",
+            "artist": "scorpions",
+            "track": "Axe and the wind",
+            "autocorrect": True,
+            "lang": "en",
+        }
+        with self.assertRaises(ApiError) as cm:
+            ApiMixin.call(params)
+
+        self.assertEqual(6, cm.exception.error)
+        self.assertIn(b"Track not found", ApiMixin.call(params, decode=False))
+
+
+class BindDataTests(TestCase):
+    cases = [
+        ("album/find", Album, None),
+        ("artist/find", Artist, None),
+        ("artist/get_correction", Artist, None),
+        ("artist/get_similar", Artist, "artist"),
+        ("library/get_artists", Artist, "artist"),
+        ("tag/get_info", Tag, None),
+        ("track/find", Track, None),
+        ("track/get_correction", Track, None),
+        ("user/get_friends_with_recent_tracks", User, "user"),
+        ("user/get_info", User, None),
+        ("user/get_recent_tracks", Track, "track"),
+        ("track/search", Track, "tracks.track"),
+        ("track/scrobble_tracks", ScrobbleTrack, "scrobble"),
+    ]
+
+    def test_bind_data_does_not_mutate_the_body(self):
+        for cassette, bind, flatten in self.cases:
+            path = os.path.join(fixtures_dir, f"{cassette}.json")
+            with self.subTest(cassette=cassette):
+                with open(path) as f:
+                    interaction = json.load(f)["interactions"][-1]
+
+                body = json.loads(
+                    interaction["response"]["body"]["string"],
+                    object_pairs_hook=pythonic_variables,
+                )
+                expected = copy.deepcopy(body)
+
+                first = ApiMixin.bind_data(bind, body, flatten)
+                second = ApiMixin.bind_data(bind, body, flatten)
+
+                self.assertEqual(expected, body)
+                self.assertEqual(first.to_dict(), second.to_dict())
+
+
+class ProjectionTests(TestCase):
+    def test_projection(self):
+        expected = {"name": {}, "artist": {"name": {}, "mbid": {}}}
+        self.assertEqual(expected, projection(["name", "artist.name", "artist.mbid"]))
+
+    def test_project(self):
+        data = {
+            "name": "Fu-Gee-La",
+            "url": "https://www.last.fm",
+            "artist": {"text": "Fugees", "mbid": "a1", "url": "https://www.last.fm"},
+            "image": [{"size": "small", "text": ""}],
+            "date": {"timestamp": "1", "text": "1 Jan 1970"},
+            "attr": {"rank": "1"},
+        }
+
+        result = project(data, projection(["artist.name", "timestamp"]), Track)
+        expected = {
+            "name": "Fu-Gee-La",
+            "artist": {"text": "Fugees"},
+            "date": {"timestamp": "1", "text": "1 Jan 1970"},
+            "attr": {"rank": "1"},
+        }
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            {
+                "name": "Fu-Gee-La",
+                "artist": {"name": "Fugees"},
+                "timestamp": 1,
+                "rank": 1,
+            },
+            Track.from_dict(result).to_dict(),
+        )
+        self.assertEqual(data, project(data, {}, Track))
+
+    def test_project_nested_wrappers(self):
+        cases = [
+            ("album/find", Album, ["name", "tracks.name"], "tracks"),
+            ("track/find", Track, ["name", "top_tags.name"], "top_tags"),
+        ]
+        for cassette, bind, fields, key in cases:
+            with self.subTest(cassette=cassette):
+                path = os.path.join(fixtures_dir, f"{cassette}.json")
+                with open(path) as f:
+                    interaction = json.load(f)["interactions"][-1]
+
+                body = json.loads(
+                    interaction["response"]["body"]["string"],
+                    object_pairs_hook=pythonic_variables,
+                )
+                full = ApiMixin.bind_data(bind, body).to_dict()
+                result = ApiMixin.bind_data(bind, body, fields=fields).to_dict()
+
+                self.assertEqual(full["name"], result["name"])
+                self.assertEqual(
+                    [item["name"] for item in full[key]],
+                    [item["name"] for item in result[key]],
+                )
+                self.assertNotIn("url", result)
+                self.assertNotIn("url", result[key][0])
+
+    def test_model_type(self):
+        self.assertIs(Track, model_type(Optional[List["Track"]]))
+        self.assertIs(Artist, model_type(Artist))
+        self.assertIs(Image, model_type(Optional[List[Image]]))
+        self.assertIsNone(model_type(Optional[str]))
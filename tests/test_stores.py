@@ -0,0 +1,47 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from pydrag.stores import MemoryStore
+from pydrag.stores import ShelveStore
+from pydrag.stores import Store
+
+
+class StoreTests(TestCase):
+    def test_incomplete_store_is_abstract(self):
+        class ReadOnlyStore(Store):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            ReadOnlyStore()
+
+
+class MemoryStoreTests(TestCase):
+    def test_get_set_delete(self):
+        store = MemoryStore()
+        self.assertIsNone(store.get("a"))
+
+        store.set("a", {"b": 1})
+        self.assertEqual({"b": 1}, store.get("a"))
+        self.assertEqual(["a"], list(store.keys()))
+
+        store.delete("a")
+        store.delete("a")
+        self.assertIsNone(store.get("a"))
+
+
+class ShelveStoreTests(TestCase):
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "store")
+            store = ShelveStore(path)
+            store.set("a", {"b": 1})
+            store.set("c", 2)
+            store.delete("c")
+            store.close()
+
+            store = ShelveStore(path)
+            self.assertEqual({"b": 1}, store.get("a"))
+            self.assertEqual(["a"], list(store.keys()))
+            store.close()
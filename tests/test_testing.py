@@ -0,0 +1,69 @@
+from requests import HTTPError
+
+from pydrag.exceptions import ApiError
+from pydrag.models.common import Config
+from pydrag.models.common import ListModel
+from pydrag.models.track import Track
+from pydrag.models.user import User
+from pydrag.testing import FakeServer
+from pydrag.testing import Paginated
+from pydrag.testing import synthetic_track
+from tests import fixtures_dir
+from tests import MethodTestCase
+
+
+class FakeServerTests(MethodTestCase):
+    def setUp(self):
+        super().setUp()
+        self.api_url = Config.api_url
+
+    def tearDown(self):
+        Config.api_url = self.api_url
+        super().tearDown()
+
+    def test_fixtures(self):
+        with FakeServer(fixtures_dir) as server:
+            Config.api_url = server.url
+            result = Track.get_top_tracks_chart(limit=10, page=2)
+
+        self.assertIsInstance(result, ListModel)
+        self.assertFixtureEqual("chart/get_top_tracks", result.to_dict())
+        self.assertEqual({"chart.getTopTracks": 1}, server.requests)
+
+    def test_pagination(self):
+        with FakeServer() as server:
+            server.register(
+                "user.getRecentTracks",
+                Paginated("recenttracks", "track", 120, synthetic_track),
+            )
+            Config.api_url = server.url
+            user = User(None, None, None, "rj", None, None, None, None, None)
+            result = user.get_recent_tracks(limit=50, page=3)
+
+        self.assertEqual(20, len(result))
+        self.assertEqual(3, result.page)
+        self.assertEqual(120, result.total)
+        self.assertEqual("Track 100", result[0].name)
+        self.assertEqual(1500018000, result[0].timestamp)
+
+    def test_error_injection(self):
+        with FakeServer(error_rate=1.0, error_code=16) as server:
+            Config.api_url = server.url
+            with self.assertRaises(HTTPError) as cm:
+                Track.get_top_tracks_chart()
+
+        self.assertEqual(500, cm.exception.response.status_code)
+
+    def test_rate_limit(self):
+        server = FakeServer(rate_limit=2)
+        statuses = [server.respond({"method": "foo"})[0] for _ in range(3)]
+        self.assertEqual([200, 200, 429], statuses)
+        server.stop()
+
+    def test_unknown_method(self):
+        with FakeServer() as server:
+            Config.api_url = server.url
+            with self.assertRaises(ApiError) as cm:
+                Track.get_top_tracks_chart()
+
+        self.assertEqual(3, cm.exception.error)
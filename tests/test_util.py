@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from pydrag.utils import map_concurrently
 from pydrag.utils import md5
 from pydrag.utils import to_camel_case
 
@@ -17,3 +18,14 @@ class UtilTests(TestCase):
         self.assertEqual("aaBb", to_camel_case("AA_BB"))
         self.assertEqual("aa", to_camel_case("aa"))
         self.assertEqual("aa", to_camel_case("Aa"))
+
+    def test_map_concurrently(self):
+        def func(x):
+            if x == 0:
+                raise ZeroDivisionError()
+            return 10 // x
+
+        results, errors = map_concurrently(func, [0, 1, 2, 5], workers=2)
+        self.assertEqual({1: 10, 2: 5, 5: 2}, results)
+        self.assertEqual([0], list(errors))
+        self.assertIsInstance(errors[0], ZeroDivisionError)